@@ -330,6 +330,8 @@ func (c *clientImpl) ListMessagesForTask(taskID, userID string) ([]*protocol.Mes
 
 type QueryOptions struct {
 	Limit int
+	// Only events created at or after this time. Inclusive, so that clients using
+	// the last created_at they saw as a cursor don't miss events sharing it.
 	After time.Time
 }
 
@@ -341,7 +343,7 @@ func (c *clientImpl) ListEventsForSession(sessionID, userID string, options Quer
 		Order("created_at DESC")
 
 	if !options.After.IsZero() {
-		query = query.Where("created_at > ?", options.After)
+		query = query.Where("created_at >= ?", options.After)
 	}
 
 	if options.Limit > 1 {
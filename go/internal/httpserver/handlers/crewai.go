@@ -1,6 +1,7 @@
 package handlers
 
 import (
+	"bytes"
 	"encoding/json"
 	"net/http"
 	"strconv"
@@ -47,7 +48,9 @@ type KagentFlowStateResponse struct {
 	Data KagentFlowStatePayload `json:"data"`
 }
 
-// HandleStoreMemory handles POST /api/crewai/memory requests
+// HandleStoreMemory handles POST /api/crewai/memory requests.
+// The body is a single memory payload or a JSON array of them, so buffered saves
+// are stored in one request.
 func (h *CrewAIHandler) HandleStoreMemory(w ErrorResponseWriter, r *http.Request) {
 	log := ctrllog.FromContext(r.Context()).WithName("crewai-handler").WithValues("operation", "store-memory")
 
@@ -58,44 +61,56 @@ func (h *CrewAIHandler) HandleStoreMemory(w ErrorResponseWriter, r *http.Request
 	}
 	log = log.WithValues("userID", userID)
 
-	var req KagentMemoryPayload
-	if err := DecodeJSONBody(r, &req); err != nil {
+	var body json.RawMessage
+	if err := DecodeJSONBody(r, &body); err != nil {
 		w.RespondWithError(errors.NewBadRequestError("Invalid request body", err))
 		return
 	}
 
-	// Validate required fields
-	if req.ThreadID == "" {
-		w.RespondWithError(errors.NewBadRequestError("thread_id is required", nil))
-		return
+	var reqs []KagentMemoryPayload
+	if trimmed := bytes.TrimSpace(body); len(trimmed) > 0 && trimmed[0] == '[' {
+		err = json.Unmarshal(trimmed, &reqs)
+	} else {
+		var req KagentMemoryPayload
+		err = json.Unmarshal(trimmed, &req)
+		reqs = []KagentMemoryPayload{req}
 	}
-
-	log = log.WithValues(
-		"threadID", req.ThreadID,
-		"userID", userID,
-	)
-
-	// Serialize memory data to JSON string
-	memoryDataJSON, err := json.Marshal(req.MemoryData)
 	if err != nil {
-		w.RespondWithError(errors.NewBadRequestError("Failed to serialize memory data", err))
+		w.RespondWithError(errors.NewBadRequestError("Invalid request body", err))
 		return
 	}
 
-	// Create memory model
-	memory := &database.CrewAIAgentMemory{
-		UserID:     userID,
-		ThreadID:   req.ThreadID,
-		MemoryData: string(memoryDataJSON),
+	// Validate and serialize every memory before storing any of them
+	memories := make([]*database.CrewAIAgentMemory, 0, len(reqs))
+	for _, req := range reqs {
+		if req.ThreadID == "" {
+			w.RespondWithError(errors.NewBadRequestError("thread_id is required", nil))
+			return
+		}
+
+		// Serialize memory data to JSON string
+		memoryDataJSON, err := json.Marshal(req.MemoryData)
+		if err != nil {
+			w.RespondWithError(errors.NewBadRequestError("Failed to serialize memory data", err))
+			return
+		}
+
+		memories = append(memories, &database.CrewAIAgentMemory{
+			UserID:     userID,
+			ThreadID:   req.ThreadID,
+			MemoryData: string(memoryDataJSON),
+		})
 	}
 
-	// Store memory
-	if err := h.DatabaseService.StoreCrewAIMemory(memory); err != nil {
-		w.RespondWithError(errors.NewInternalServerError("Failed to store CrewAI memory", err))
-		return
+	// Store memories
+	for _, memory := range memories {
+		if err := h.DatabaseService.StoreCrewAIMemory(memory); err != nil {
+			w.RespondWithError(errors.NewInternalServerError("Failed to store CrewAI memory", err))
+			return
+		}
 	}
 
-	log.Info("Successfully stored CrewAI memory")
+	log.Info("Successfully stored CrewAI memory", "count", len(memories))
 	data := api.NewResponse(struct{}{}, "Successfully stored CrewAI memory", false)
 	RespondWithJSON(w, http.StatusCreated, data)
 }
@@ -1,8 +1,18 @@
 import importlib.metadata
 
 from ._a2a import KAgentApp
+from ._agent_executor import A2aAgentExecutorConfig
+from ._session_service import KAgentSessionServiceConfig
+from ._tool_scheduler import ToolSchedulerConfig, ToolSchedulerPlugin
 from .types import AgentConfig
 
 __version__ = importlib.metadata.version("kagent_adk")
 
-__all__ = ["KAgentApp", "AgentConfig"]
+__all__ = [
+    "KAgentApp",
+    "AgentConfig",
+    "A2aAgentExecutorConfig",
+    "KAgentSessionServiceConfig",
+    "ToolSchedulerConfig",
+    "ToolSchedulerPlugin",
+]
@@ -2,9 +2,9 @@
 import faulthandler
 import logging
 import os
-from typing import Callable, List
+from contextlib import asynccontextmanager
+from typing import Any, Callable, List
 
-import httpx
 from a2a.server.apps import A2AFastAPIApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
@@ -14,16 +14,24 @@ from fastapi import FastAPI, Request
 from fastapi.responses import PlainTextResponse
 from google.adk.agents import BaseAgent
 from google.adk.apps import App
-from google.adk.artifacts import InMemoryArtifactService
+from google.adk.artifacts import BaseArtifactService, InMemoryArtifactService
 from google.adk.plugins import BasePlugin
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
-from kagent.core.a2a import KAgentRequestContextBuilder, KAgentTaskStore
-
-from ._agent_executor import A2aAgentExecutor
-from ._session_service import KAgentSessionService
+from kagent.core import HttpClientConfig, create_http_client
+from kagent.core.a2a import (
+    AdmissionController,
+    AdmissionControllerConfig,
+    KAgentRequestContextBuilder,
+    KAgentTaskStore,
+    KAgentTaskStoreConfig,
+)
+
+from ._agent_executor import A2aAgentExecutor, A2aAgentExecutorConfig
+from ._artifact_service import BoundedArtifactService
+from ._session_service import KAgentSessionService, KAgentSessionServiceConfig
 from ._token import KAgentTokenService
 
 
@@ -55,19 +63,32 @@ class KAgentApp:
         kagent_url: str,
         app_name: str,
         plugins: List[BasePlugin] = None,
+        session_config: KAgentSessionServiceConfig | None = None,
+        executor_config: A2aAgentExecutorConfig | None = None,
+        task_store_config: KAgentTaskStoreConfig | None = None,
+        http_config: HttpClientConfig | None = None,
+        admission_config: AdmissionControllerConfig | None = None,
+        artifact_service: BaseArtifactService | None = None,
     ):
         self.root_agent = root_agent
         self.kagent_url = kagent_url
         self.app_name = app_name
         self.agent_card = agent_card
         self.plugins = plugins if plugins is not None else []
+        self.session_config = session_config
+        self.executor_config = executor_config
+        self.task_store_config = task_store_config
+        self.http_config = http_config
+        self.admission_config = admission_config
+        # Shared by all requests, so artifacts outlive the turn that saved them
+        self.artifact_service = artifact_service or BoundedArtifactService()
 
     def build(self) -> FastAPI:
         token_service = KAgentTokenService(self.app_name)
-        http_client = httpx.AsyncClient(  # TODO: add user  and agent headers
-            base_url=kagent_url_override or self.kagent_url, event_hooks=token_service.event_hooks()
+        http_client = create_http_client(  # TODO: add user  and agent headers
+            kagent_url_override or self.kagent_url, self.http_config, event_hooks=token_service.event_hooks()
         )
-        session_service = KAgentSessionService(http_client)
+        session_service = KAgentSessionService(http_client, self.session_config)
 
         if sts_well_known_uri:
             sts_integration = ADKSTSIntegration(sts_well_known_uri)
@@ -75,18 +96,22 @@ class KAgentApp:
 
         adk_app = App(name=self.app_name, root_agent=self.root_agent, plugins=self.plugins)
 
-        def create_runner() -> Runner:
-            return Runner(
-                app=adk_app,
-                session_service=session_service,
-                artifact_service=InMemoryArtifactService(),
-            )
+        # One runner serves all requests, the request specifics are passed per run
+        runner = Runner(
+            app=adk_app,
+            session_service=session_service,
+            artifact_service=self.artifact_service,
+        )
 
-        agent_executor = A2aAgentExecutor(
-            runner=create_runner,
+        agent_executor = AdmissionController(
+            A2aAgentExecutor(
+                runner=runner,
+                config=self.executor_config,
+            ),
+            self.admission_config,
         )
 
-        kagent_task_store = KAgentTaskStore(http_client)
+        kagent_task_store = KAgentTaskStore(http_client, self.task_store_config)
 
         request_context_builder = KAgentRequestContextBuilder(task_store=kagent_task_store)
         request_handler = DefaultRequestHandler(
@@ -100,8 +125,24 @@ class KAgentApp:
             http_handler=request_handler,
         )
 
+        token_lifespan = token_service.lifespan()
+
+        @asynccontextmanager
+        async def lifespan(app: Any):
+            async with token_lifespan(app):
+                try:
+                    yield
+                finally:
+                    # Don't lose buffered session events and task saves on shutdown
+                    try:
+                        await kagent_task_store.close()
+                    finally:
+                        await session_service.close()
+                        await runner.close()
+                        await http_client.aclose()
+
         faulthandler.enable()
-        app = FastAPI(lifespan=token_service.lifespan())
+        app = FastAPI(lifespan=lifespan)
 
         # Health check/readiness probe
         app.add_route("/health", methods=["GET"], route=health_check)
@@ -111,18 +152,19 @@ class KAgentApp:
         return app
 
     def build_local(self) -> FastAPI:
-        session_service = InMemorySessionService()
-
-        def create_runner() -> Runner:
-            return Runner(
-                agent=self.root_agent,
-                app_name=self.app_name,
-                session_service=session_service,
-                artifact_service=InMemoryArtifactService(),
-            )
+        runner = Runner(
+            agent=self.root_agent,
+            app_name=self.app_name,
+            session_service=InMemorySessionService(),
+            artifact_service=self.artifact_service,
+        )
 
-        agent_executor = A2aAgentExecutor(
-            runner=create_runner,
+        agent_executor = AdmissionController(
+            A2aAgentExecutor(
+                runner=runner,
+                config=self.executor_config,
+            ),
+            self.admission_config,
         )
 
         task_store = InMemoryTaskStore()
@@ -5,7 +5,7 @@ import inspect
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal, Optional
 
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.agent_execution.context import RequestContext
@@ -21,6 +21,7 @@ from a2a.types import (
     TaskStatusUpdateEvent,
     TextPart,
 )
+from google.adk.agents.run_config import StreamingMode
 from google.adk.events import Event, EventActions
 from google.adk.runners import Runner
 from google.adk.utils.context_utils import Aclosing
@@ -28,8 +29,16 @@ from opentelemetry import trace
 from pydantic import BaseModel
 from typing_extensions import override
 
-from kagent.core.a2a import TaskResultAggregator, get_kagent_metadata_key
+from kagent.core.a2a import (
+    BackpressurePolicy,
+    EventPublisher,
+    TaskCancellationRegistry,
+    TaskResultAggregator,
+    get_kagent_metadata_key,
+)
 
+from ._event_coalescer import PartialEventCoalescer
+from ._session_service import KAgentSessionService
 from .converters.event_converter import convert_event_to_a2a_events
 from .converters.request_converter import convert_a2a_request_to_adk_run_args
 
@@ -39,30 +48,63 @@ logger = logging.getLogger("kagent_adk." + __name__)
 class A2aAgentExecutorConfig(BaseModel):
     """Configuration for the A2aAgentExecutor."""
 
-    pass
+    # How the request headers are stored in the session state:
+    # - "event": appended as a separate header_update system event before the run
+    # - "message": attached as state delta to the user message event of the turn,
+    #   saving a controller write per request. Unchanged headers are not stored again.
+    header_state_mode: Literal["event", "message"] = "event"
+
+    # Number of A2A events buffered between the agent run and the event queue. The
+    # buffer is drained in the background so slow event consumers (task persistence,
+    # SSE clients) don't hold up the agent. 0 publishes every event inline.
+    event_buffer_size: int = 0
+
+    # What to do with partial text events while the buffer is full: wait for room
+    # ("block"), merge them into the partial event waiting in the buffer ("coalesce")
+    # or drop them ("drop"). All other events always wait and are delivered in order.
+    event_backpressure: BackpressurePolicy = "block"
+
+    # Stream model responses, publishing partial text events as they are generated
+    stream: bool = False
+
+    # Merge consecutive partial text events for up to this many seconds before
+    # publishing them, instead of publishing one event per streamed delta. The first
+    # delta of each response is published right away. 0 disables.
+    partial_event_window: float = 0.0
+
+    # Publish merged partial text as soon as it reaches this many bytes
+    partial_event_max_bytes: int = 4096
 
 
 # This class is a copy of the A2aAgentExecutor class in the ADK sdk,
 # with the following changes:
-# - The runner is ALWAYS a callable that returns a Runner instance
-# - The runner is cleaned up at the end of the execution
+# - The runner is either shared by all requests or a callable that returns a Runner
+#   instance per request
 class A2aAgentExecutor(AgentExecutor):
     """An AgentExecutor that runs an ADK Agent against an A2A request and
     publishes updates to an event queue.
+
+    A shared Runner only holds the agent, plugins and services. Everything that
+    belongs to a request, i.e. its session, user, message and run config, is
+    passed to the runner per run, so one runner can serve concurrent requests.
     """
 
     def __init__(
         self,
         *,
-        runner: Callable[..., Runner | Awaitable[Runner]],
+        runner: Runner | Callable[..., Runner | Awaitable[Runner]],
         config: Optional[A2aAgentExecutorConfig] = None,
     ):
         super().__init__()
         self._runner = runner
-        self._config = config
+        self._config = config or A2aAgentExecutorConfig()
+        self._cancellations = TaskCancellationRegistry()
 
     async def _resolve_runner(self) -> Runner:
         """Resolve the runner, handling cases where it's a callable that returns a Runner."""
+        if isinstance(self._runner, Runner):
+            return self._runner
+
         if callable(self._runner):
             # Call the function to get the runner
             result = self._runner()
@@ -85,9 +127,8 @@ class A2aAgentExecutor(AgentExecutor):
 
     @override
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
-        """Cancel the execution."""
-        # TODO: Implement proper cancellation logic if needed
-        raise NotImplementedError("Cancellation is not supported")
+        """Cancel the running execution of the task and publish its canceled status."""
+        await self._cancellations.cancel(context.task_id, context.context_id, event_queue)
 
     @override
     async def execute(
@@ -102,7 +143,16 @@ class A2aAgentExecutor(AgentExecutor):
         * Collects output events of the underlying ADK Agent
         * Converts the ADK output events into A2A task updates
         * Publishes the updates back to A2A server via event queue
+        The execution can be stopped with cancel.
         """
+        async with self._cancellations.track(context.task_id, context.context_id, event_queue):
+            await self._execute(context, event_queue)
+
+    async def _execute(
+        self,
+        context: RequestContext,
+        event_queue: EventQueue,
+    ):
         if not context.message:
             raise ValueError("A2A request must have a message")
 
@@ -156,6 +206,8 @@ class A2aAgentExecutor(AgentExecutor):
     ):
         # Convert the a2a request to ADK run args
         run_args = convert_a2a_request_to_adk_run_args(context)
+        if self._config.stream:
+            run_args["run_config"].streaming_mode = StreamingMode.SSE
 
         # ensure the session exists
         session = await self._prepare_session(context, run_args, runner)
@@ -166,14 +218,19 @@ class A2aAgentExecutor(AgentExecutor):
             "headers": headers,
         }
 
-        actions_with_update = EventActions(state_delta=state_changes)
-        system_event = Event(
-            invocation_id="header_update",
-            author="system",
-            actions=actions_with_update,
-        )
+        if self._config.header_state_mode == "message":
+            # Persisted together with the user message when the run starts
+            if session.state.get("headers") != headers:
+                run_args["state_delta"] = state_changes
+        else:
+            actions_with_update = EventActions(state_delta=state_changes)
+            system_event = Event(
+                invocation_id="header_update",
+                author="system",
+                actions=actions_with_update,
+            )
 
-        await runner.session_service.append_event(session, system_event)
+            await runner.session_service.append_event(session, system_event)
 
         current_span = trace.get_current_span()
         if run_args["user_id"]:
@@ -209,13 +266,41 @@ class A2aAgentExecutor(AgentExecutor):
         )
 
         task_result_aggregator = TaskResultAggregator()
-        async with Aclosing(runner.run_async(**run_args)) as agen:
-            async for adk_event in agen:
-                for a2a_event in convert_event_to_a2a_events(
-                    adk_event, invocation_context, context.task_id, context.context_id
-                ):
-                    task_result_aggregator.process_event(a2a_event)
-                    await event_queue.enqueue_event(a2a_event)
+        publisher = EventPublisher(
+            event_queue,
+            max_pending=self._config.event_buffer_size,
+            policy=self._config.event_backpressure,
+        )
+        coalescer = None
+        if self._config.partial_event_window > 0:
+            coalescer = PartialEventCoalescer(self._config.partial_event_window, self._config.partial_event_max_bytes)
+
+        async def publish(adk_event: Event):
+            for a2a_event in convert_event_to_a2a_events(
+                adk_event, invocation_context, context.task_id, context.context_id
+            ):
+                # Decided before the aggregator rewrites the state to working
+                intermediate = bool(adk_event.partial) and _is_working_status(a2a_event)
+                task_result_aggregator.process_event(a2a_event)
+                await publisher.publish(a2a_event, intermediate=intermediate)
+
+        try:
+            async with publisher, Aclosing(runner.run_async(**run_args)) as agen:
+                if coalescer:
+                    await _publish_coalesced(agen, coalescer, publish)
+                else:
+                    async for adk_event in agen:
+                        await publish(adk_event)
+        except BaseException:
+            # Persist whatever the turn produced before reporting the failure
+            try:
+                await self._flush_session_events(runner, session.id)
+            except Exception as flush_error:
+                logger.error("Failed to flush session events: %s", flush_error, exc_info=True)
+            raise
+
+        # The turn is over: make sure every event is persisted before reporting the result
+        await self._flush_session_events(runner, session.id)
 
         # publish the task result event - this is final
         if (
@@ -262,6 +347,10 @@ class A2aAgentExecutor(AgentExecutor):
                 )
             )
 
+    async def _flush_session_events(self, runner: Runner, session_id: str):
+        if isinstance(runner.session_service, KAgentSessionService):
+            await runner.session_service.flush(session_id)
+
     async def _prepare_session(self, context: RequestContext, run_args: dict[str, Any], runner: Runner):
         session_id = run_args["session_id"]
         # create a new session if not exists
@@ -297,3 +386,44 @@ class A2aAgentExecutor(AgentExecutor):
             run_args["session_id"] = session.id
 
         return session
+
+
+def _is_working_status(event: Any) -> bool:
+    return isinstance(event, TaskStatusUpdateEvent) and event.status.state == TaskState.working
+
+
+async def _publish_coalesced(
+    events: AsyncIterator[Event], coalescer: PartialEventCoalescer, publish: Callable[[Event], Awaitable[None]]
+) -> None:
+    """Publish events through the coalescer, releasing held text when its window passes.
+
+    Held text is released by a timer, so it is not hidden while the model stalls. A
+    lock keeps the timer's and the loop's events in order.
+    """
+    lock = asyncio.Lock()
+    timer: Optional[asyncio.Task] = None
+
+    async def release_when_due():
+        while (delay := coalescer.due_in()) is not None:
+            await asyncio.sleep(delay)
+            async with lock:
+                for ready_event in coalescer.release_due():
+                    await publish(ready_event)
+
+    try:
+        async for adk_event in events:
+            if timer is not None and timer.done():
+                # Raises the error of a failed publish
+                timer.result()
+                timer = None
+            async with lock:
+                for ready_event in coalescer.add(adk_event):
+                    await publish(ready_event)
+            if timer is None and coalescer.due_in() is not None:
+                timer = asyncio.create_task(release_when_due())
+        async with lock:
+            for ready_event in coalescer.flush():
+                await publish(ready_event)
+    finally:
+        if timer is not None:
+            timer.cancel()
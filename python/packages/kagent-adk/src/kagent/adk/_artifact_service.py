@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from google.adk.artifacts import BaseArtifactService
+from google.genai import types
+from typing_extensions import override
+
+from kagent.core import BoundedCache
+
+
+def _part_size(part: types.Part) -> int:
+    size = len(part.text or "")
+    if part.inline_data is not None and part.inline_data.data:
+        size += len(part.inline_data.data)
+    return size
+
+
+def _versions_size(versions: list[types.Part]) -> int:
+    return sum(_part_size(part) for part in versions)
+
+
+class BoundedArtifactService(BaseArtifactService):
+    """An in-memory artifact service bounded by artifact count, size and age.
+
+    Meant to be shared by all requests of an agent, so artifacts saved in one turn
+    can be loaded in the next. When a limit is exceeded the least recently used
+    artifacts are evicted with all their versions. Artifacts are kept per process,
+    like ADK's InMemoryArtifactService.
+
+    Args:
+        max_artifacts: Maximum number of artifacts kept. Unbounded if None.
+        max_bytes: Maximum total size of text and inline data kept. Unbounded if None.
+        ttl: Seconds an artifact is kept after its last save. Kept until evicted if None.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_artifacts: Optional[int] = 1024,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        self._artifacts: BoundedCache[str, list[types.Part]] = BoundedCache(
+            "adk_artifacts",
+            max_entries=max_artifacts,
+            ttl=ttl,
+            max_bytes=max_bytes,
+            sizeof=_versions_size,
+        )
+
+    def _artifact_path(self, app_name: str, user_id: str, session_id: str, filename: str) -> str:
+        if filename.startswith("user:"):
+            return f"{app_name}/{user_id}/user/{filename}"
+        return f"{app_name}/{user_id}/{session_id}/{filename}"
+
+    @override
+    async def save_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        artifact: types.Part,
+    ) -> int:
+        path = self._artifact_path(app_name, user_id, session_id, filename)
+        versions = self._artifacts.peek(path)
+        if versions is None:
+            self._artifacts.set(path, [artifact])
+            return 0
+        versions.append(artifact)
+        # Refreshes the expiry and re-measures the versions
+        self._artifacts.set(path, versions)
+        return len(versions) - 1
+
+    @override
+    async def load_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        version: Optional[int] = None,
+    ) -> Optional[types.Part]:
+        versions = self._artifacts.get(self._artifact_path(app_name, user_id, session_id, filename))
+        if not versions:
+            return None
+        return versions[-1 if version is None else version]
+
+    @override
+    async def list_artifact_keys(self, *, app_name: str, user_id: str, session_id: str) -> list[str]:
+        session_prefix = f"{app_name}/{user_id}/{session_id}/"
+        user_prefix = f"{app_name}/{user_id}/user/"
+        filenames = []
+        for path in self._artifacts.keys():
+            if path.startswith(session_prefix):
+                filenames.append(path.removeprefix(session_prefix))
+            elif path.startswith(user_prefix):
+                filenames.append(path.removeprefix(user_prefix))
+        return sorted(filenames)
+
+    @override
+    async def delete_artifact(self, *, app_name: str, user_id: str, session_id: str, filename: str) -> None:
+        self._artifacts.pop(self._artifact_path(app_name, user_id, session_id, filename))
+
+    @override
+    async def list_versions(self, *, app_name: str, user_id: str, session_id: str, filename: str) -> list[int]:
+        versions = self._artifacts.peek(self._artifact_path(app_name, user_id, session_id, filename))
+        return list(range(len(versions))) if versions else []
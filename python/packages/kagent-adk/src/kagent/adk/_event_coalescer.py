@@ -0,0 +1,115 @@
+import time
+from typing import Callable, Optional
+
+from google.adk.events import Event
+from google.genai import types
+
+
+def _partial_text(event: Event) -> Optional[types.Part]:
+    """Returns the only part of a partial text-only event, or None if the event can't be merged."""
+    if not event.partial or event.error_code or not event.content or not event.content.parts:
+        return None
+    if len(event.content.parts) != 1:
+        return None
+    part = event.content.parts[0]
+    if part.text is None or part.function_call or part.function_response or part.inline_data:
+        return None
+    return part
+
+
+class PartialEventCoalescer:
+    """Merges consecutive partial text events of a streamed model response.
+
+    A streamed response is emitted as one partial event per text delta. The first
+    delta of each response is emitted right away, so the first token is not held
+    back. The following deltas of the same author and kind (thought or answer) are
+    held and emitted as a single partial event once the window has passed or enough
+    text has accumulated. Any other event first releases the held text, so event
+    order is preserved. Held text whose window passes before the next event arrives
+    is taken with release_due, due_in tells when.
+
+    Args:
+        window: Seconds to merge deltas for, counted from the first held delta.
+        max_bytes: Emit the merged text as soon as it reaches this many bytes.
+    """
+
+    def __init__(self, window: float, max_bytes: int, clock: Callable[[], float] = time.monotonic):
+        self._window = window
+        self._max_bytes = max_bytes
+        self._clock = clock
+        # First event of the response being streamed
+        self._current: Optional[Event] = None
+        self._first: Optional[Event] = None
+        self._last: Optional[Event] = None
+        self._texts: list[str] = []
+        self._bytes = 0
+        self._started_at = 0.0
+
+    def add(self, event: Event) -> list[Event]:
+        """Add an event, returning the events that are ready to be published."""
+        part = _partial_text(event)
+        if part is None:
+            return self.flush() + [event]
+
+        if not self._can_merge(event, part):
+            ready = self.flush()
+            self._current = event
+            return ready + [event]
+
+        if self._first is None:
+            self._first = event
+            self._started_at = self._clock()
+        self._last = event
+        self._texts.append(part.text)
+        self._bytes += len(part.text.encode())
+
+        if self._bytes >= self._max_bytes or self._clock() - self._started_at >= self._window:
+            return self._release()
+        return []
+
+    def due_in(self) -> Optional[float]:
+        """Seconds until the held text is due, None if no text is held."""
+        if self._first is None:
+            return None
+        return max(0.0, self._started_at + self._window - self._clock())
+
+    def release_due(self) -> list[Event]:
+        """Release the held text if its window has passed."""
+        if self.due_in() == 0.0:
+            return self._release()
+        return []
+
+    def flush(self) -> list[Event]:
+        """Release the held text, if any. The next delta starts a new response."""
+        ready = self._release()
+        self._current = None
+        return ready
+
+    def _release(self) -> list[Event]:
+        if self._first is None:
+            return []
+        first = self._first
+        if len(self._texts) > 1:
+            part = first.content.parts[0].model_copy(update={"text": "".join(self._texts)})
+            first = first.model_copy(
+                update={
+                    "content": first.content.model_copy(update={"parts": [part]}),
+                    "turn_complete": self._last.turn_complete,
+                }
+            )
+        self._first = None
+        self._last = None
+        self._texts = []
+        self._bytes = 0
+        return [first]
+
+    def _can_merge(self, event: Event, part: types.Part) -> bool:
+        if self._current is None:
+            return False
+        current_part = self._current.content.parts[0]
+        return (
+            event.invocation_id == self._current.invocation_id
+            and event.author == self._current.author
+            and event.branch == self._current.branch
+            and bool(part.thought) == bool(current_part.thought)
+        )
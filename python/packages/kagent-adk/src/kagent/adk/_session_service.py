@@ -1,4 +1,9 @@
+import asyncio
+import copy
 import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 import httpx
@@ -9,20 +14,128 @@ from google.adk.sessions.base_session_service import (
     GetSessionConfig,
     ListSessionsResponse,
 )
+from opentelemetry import metrics
+from pydantic import BaseModel
 from typing_extensions import override
 
+from kagent.core import BoundedCache, CacheStats
+
 logger = logging.getLogger("kagent." + __name__)
 
+meter = metrics.get_meter("kagent.adk")
+flush_duration_histogram = meter.create_histogram(
+    "kagent.session.events.flush.duration",
+    unit="s",
+    description="Time taken to flush buffered session events to the controller",
+)
+write_buffer_depth_counter = meter.create_up_down_counter(
+    "kagent.session.events.buffered",
+    description="Number of session events buffered and not yet flushed to the controller",
+)
+
+
+class KAgentSessionServiceConfig(BaseModel):
+    """Configuration for the KAgentSessionService."""
+
+    # Buffer appended events per session and flush them in the background
+    # instead of awaiting one controller round-trip per event.
+    write_behind: bool = False
+
+    # Flush a session buffer as soon as it holds this many events
+    write_behind_batch_size: int = 16
+
+    # Flush a session buffer at most this long (seconds) after its first buffered event
+    write_behind_flush_interval: float = 0.25
+
+    # Keep hydrated sessions (events and replayed state) in an in-process LRU cache so
+    # repeated get_session calls skip parsing and replaying the whole history. Without
+    # incremental_load, events written by other replicas are only picked up once the
+    # cached entry expires.
+    session_cache: bool = False
+
+    # Maximum number of sessions kept in the cache
+    session_cache_max_entries: int = 256
+
+    # Seconds a session stays cached after it was loaded from the controller
+    session_cache_ttl: Optional[float] = 300.0
+
+    # Approximate upper bound on the serialized size of all cached session events
+    session_cache_max_bytes: Optional[int] = 64 * 1024 * 1024
+
+    # Cache loaded sessions and, on every subsequent get_session call, only fetch the
+    # events created at or after the last one seen instead of the whole history.
+    # Events seen before are skipped by id.
+    incremental_load: bool = False
+
+
+def _parse_timestamp(value: Optional[str]) -> datetime:
+    """Parse a controller timestamp, ordering missing or malformed values first."""
+    if value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            logger.warning("Failed to parse event timestamp %s", value)
+    return datetime.min.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class _CachedSession:
+    """A hydrated session together with the cursor of the last event loaded from the controller."""
+
+    # Snapshot of the session with its state already replayed. Callers get copies.
+    session: Session
+    # created_at of the most recent event loaded from the controller
+    cursor: str | None = None
+    # IDs of the events already applied to the session
+    event_ids: set[str] = field(default_factory=set)
+    # Approximate serialized size of the session events
+    size: int = 0
+
+
+def _copy_session(session: Session) -> Session:
+    """Copy a cached session so callers can modify it without touching the cache."""
+    return session.model_copy(update={"events": list(session.events), "state": copy.deepcopy(session.state)})
+
+
+@dataclass
+class _SessionWriteBuffer:
+    """Ordered buffer of events waiting to be flushed for a single session."""
+
+    user_id: str
+    events: list[dict[str, str]] = field(default_factory=list)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    timer: asyncio.Task | None = None
+
 
 class KAgentSessionService(BaseSessionService):
     """A session service implementation that uses the Kagent API.
     This service integrates with the Kagent server to manage session state
     and persistence through HTTP API calls.
+
+    With write-behind enabled, appended events are kept in a per-session ordered
+    buffer and flushed in batches, either when the batch size or flush interval is
+    reached, when the session is read back, or explicitly via flush()/close().
+
+    With the session cache enabled, hydrated sessions are kept in a bounded LRU
+    cache and get_session hands out copies of them. Events appended through such
+    a copy are applied to the cached snapshot as well, so it stays current.
     """
 
-    def __init__(self, client: httpx.AsyncClient):
+    def __init__(self, client: httpx.AsyncClient, config: Optional[KAgentSessionServiceConfig] = None):
         super().__init__()
         self.client = client
+        self._config = config or KAgentSessionServiceConfig()
+        self._write_buffers: dict[str, _SessionWriteBuffer] = {}
+        self._session_cache: BoundedCache[tuple[str, str, str], _CachedSession] = BoundedCache(
+            "session",
+            max_entries=self._config.session_cache_max_entries,
+            ttl=self._config.session_cache_ttl,
+            max_bytes=self._config.session_cache_max_bytes,
+            sizeof=lambda entry: entry.size,
+        )
+        self._background_flushes: set[asyncio.Task] = set()
+        # Flipped off the first time the controller does not know the batch endpoint
+        self._batch_events_supported = True
 
     @override
     async def create_session(
@@ -69,62 +182,133 @@ class KAgentSessionService(BaseSessionService):
         session_id: str,
         config: Optional[GetSessionConfig] = None,
     ) -> Optional[Session]:
+        # Make sure buffered events are visible to the read
+        await self.flush(session_id)
+
+        cache_key = (app_name, user_id, session_id)
+        use_cache = (self._config.session_cache or self._config.incremental_load) and not (
+            config and (config.num_recent_events or config.after_timestamp)
+        )
         try:
-            url = f"/api/sessions/{session_id}?user_id={user_id}"
+            cached = self._session_cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                if self._config.incremental_load:
+                    # Only ask for what happened since the last load and merge it in
+                    session_data, events_data = await self._fetch_session(session_id, user_id, after=cached.cursor)
+                    if session_data is None:
+                        self._session_cache.pop(cache_key)
+                        return None
+                    if events_data:
+                        await self._merge_events(cached, events_data)
+                        self._session_cache.resize(cache_key)
+                return _copy_session(cached.session)
+
+            after = None
+            limit = -1
             if config:
                 if config.after_timestamp:
-                    # TODO: implement
-                    # url += f"&after={config.after_timestamp}"
-                    pass
+                    after = datetime.fromtimestamp(config.after_timestamp, tz=timezone.utc).isoformat()
                 if config.num_recent_events:
-                    url += f"&limit={config.num_recent_events}"
-                else:
-                    url += "&limit=-1"
-            else:
-                # return all
-                url += "&limit=-1"
-
-            # Make API call to get session
-            response: httpx.Response = await self.client.get(
-                url,
-                headers={"X-User-ID": user_id},
-            )
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-
-            data = response.json()
-            if not data.get("data"):
-                return None
+                    limit = config.num_recent_events
 
-            if not data.get("data").get("session"):
+            session_data, events_data = await self._fetch_session(session_id, user_id, after=after, limit=limit)
+            if session_data is None:
                 return None
-            session_data = data["data"]["session"]
-
-            events_data = data["data"]["events"]
-
-            events: list[Event] = []
-            for event_data in events_data:
-                events.append(Event.model_validate_json(event_data["data"]))
 
             # Convert to ADK Session format
             session = Session(
                 id=session_data["id"],
                 user_id=session_data["user_id"],
-                events=events,
                 app_name=app_name,
                 state={},
             )
+            entry = _CachedSession(session=session)
+            await self._merge_events(entry, events_data)
 
-            for event in events:
-                await super().append_event(session, event)
+            if use_cache:
+                self._session_cache.set(cache_key, entry)
+                return _copy_session(session)
 
             return session
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None
+        except Exception:
+            self._session_cache.pop(cache_key)
             raise
 
+    def invalidate_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        """Drop the cached copy of a session so the next get_session reloads it in full."""
+        self._session_cache.pop((app_name, user_id, session_id))
+
+    def session_cache_stats(self) -> CacheStats:
+        """Returns the hit, miss and eviction counters and the current size of the session cache."""
+        return self._session_cache.stats()
+
+    async def _fetch_session(
+        self, session_id: str, user_id: str, *, after: Optional[str] = None, limit: int = -1
+    ) -> tuple[Optional[dict[str, Any]], list[dict[str, Any]]]:
+        """Fetch a session and its events from the controller.
+
+        Returns:
+            The session data and raw event records, or (None, []) if the session does not exist.
+        """
+        params: dict[str, Any] = {"user_id": user_id, "limit": limit}
+        if after:
+            params["after"] = after
+
+        # Make API call to get session
+        response: httpx.Response = await self.client.get(
+            f"/api/sessions/{session_id}",
+            params=params,
+            headers={"X-User-ID": user_id},
+        )
+        if response.status_code == 404:
+            return None, []
+        response.raise_for_status()
+
+        data = response.json()
+        if not data.get("data"):
+            return None, []
+
+        if not data.get("data").get("session"):
+            return None, []
+
+        return data["data"]["session"], data["data"].get("events") or []
+
+    async def _merge_events(self, entry: _CachedSession, events_data: list[dict[str, Any]]) -> None:
+        """Apply event records from the controller to a session in created_at order, skipping known ones."""
+        session = entry.session
+        created: dict[str, datetime] = {}
+        new_events = []
+        # The controller returns the most recent events first
+        for event_data in sorted(events_data, key=lambda e: _parse_timestamp(e.get("created_at"))):
+            created_at = event_data.get("created_at")
+            if created_at and _parse_timestamp(created_at) > _parse_timestamp(entry.cursor):
+                entry.cursor = created_at
+            created[event_data.get("id")] = _parse_timestamp(created_at)
+            if event_data.get("id") in entry.event_ids:
+                continue
+            event = Event.model_validate_json(event_data["data"])
+            entry.event_ids.add(event.id)
+            entry.size += len(event_data["data"])
+            new_events.append(event)
+        if not new_events:
+            return
+
+        # Known events that were not fetched again precede the cursor. Events created at
+        # the same time keep the order they were applied in.
+        events = [*session.events, *new_events]
+        position = {event.id: i for i, event in enumerate(events)}
+        ordered = sorted(
+            events, key=lambda e: (created.get(e.id, datetime.min.replace(tzinfo=timezone.utc)), position[e.id])
+        )
+        if ordered[: len(session.events)] != session.events:
+            # Another writer stored events before ones already applied: replay the whole
+            # history, so it matches a full reload
+            new_events = ordered
+            session.events = []
+            session.state = {}
+        for event in new_events:
+            await super().append_event(session, event)
+
     @override
     async def list_sessions(self, *, app_name: str, user_id: str) -> ListSessionsResponse:
         # Make API call to list sessions
@@ -147,6 +331,9 @@ class KAgentSessionService(BaseSessionService):
 
     @override
     async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        self._discard_write_buffer(session_id)
+        self.invalidate_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
         # Make API call to delete session
         response = await self.client.delete(
             f"/api/sessions/{session_id}?user_id={user_id}",
@@ -162,17 +349,179 @@ class KAgentSessionService(BaseSessionService):
             "data": event.model_dump_json(),
         }
 
-        # Make API call to append event to session
-        response = await self.client.post(
-            f"/api/sessions/{session.id}/events?user_id={session.user_id}",
-            json=event_data,
-            headers={"X-User-ID": session.user_id},
-        )
-        response.raise_for_status()
+        if self._config.write_behind:
+            self._buffer_event(session, event_data)
+        else:
+            # Make API call to append event to session
+            await self._post_event(session.id, session.user_id, event_data)
 
         # TODO: potentially pull and update the session from the server
         # Update the in-memory session.
         session.last_update_time = event.timestamp
         await super().append_event(session=session, event=event)
 
+        if not event.partial:
+            await self._update_cached_session(session, event, event_data)
+
         return event
+
+    async def _update_cached_session(self, session: Session, event: Event, event_data: dict[str, str]) -> None:
+        """Apply an event appended through a copy of a cached session to the cached snapshot."""
+        cache_key = (session.app_name, session.user_id, session.id)
+        cached = self._session_cache.peek(cache_key)
+        if cached is None:
+            return
+
+        # The copy must have been up to date with the snapshot before this event
+        previous = session.events[-2].id if len(session.events) > 1 else None
+        current = cached.session.events[-1].id if cached.session.events else None
+        if not session.events or session.events[-1] is not event or previous != current:
+            # Written through a session we can't reconcile: reload in full next time
+            self._session_cache.pop(cache_key)
+            return
+
+        cached.session.last_update_time = event.timestamp
+        await super().append_event(session=cached.session, event=event)
+        # Remember the event so the next incremental load does not apply it twice
+        cached.event_ids.add(event.id)
+        cached.size += len(event_data["data"])
+        self._session_cache.resize(cache_key)
+
+    def pending_event_count(self, session_id: Optional[str] = None) -> int:
+        """Returns the number of buffered events not yet flushed to the controller.
+
+        Args:
+            session_id: Only count events of this session. Counts all sessions if None.
+        """
+        if session_id is not None:
+            buffer = self._write_buffers.get(session_id)
+            return len(buffer.events) if buffer else 0
+        return sum(len(buffer.events) for buffer in self._write_buffers.values())
+
+    async def flush(self, session_id: Optional[str] = None) -> None:
+        """Flush buffered events to the controller.
+
+        Args:
+            session_id: Only flush events of this session. Flushes all sessions if None.
+
+        Raises:
+            httpx.HTTPStatusError: If the controller rejects the events. The events
+                stay buffered and are retried on the next flush.
+        """
+        if session_id is not None:
+            buffer = self._write_buffers.get(session_id)
+            if buffer is not None:
+                await self._flush_buffer(session_id, buffer)
+            return
+
+        for buffered_session_id, buffer in list(self._write_buffers.items()):
+            await self._flush_buffer(buffered_session_id, buffer)
+
+    async def close(self) -> None:
+        """Flush all buffered events and stop background flushes."""
+        try:
+            await self.flush()
+        finally:
+            for buffer in self._write_buffers.values():
+                if buffer.timer is not None:
+                    buffer.timer.cancel()
+            for task in list(self._background_flushes):
+                task.cancel()
+
+    def _buffer_event(self, session: Session, event_data: dict[str, str]) -> None:
+        buffer = self._write_buffers.get(session.id)
+        if buffer is None:
+            buffer = _SessionWriteBuffer(user_id=session.user_id)
+            self._write_buffers[session.id] = buffer
+
+        buffer.events.append(event_data)
+        write_buffer_depth_counter.add(1)
+
+        if len(buffer.events) >= self._config.write_behind_batch_size:
+            self._spawn_background_flush(session.id, buffer, delay=0)
+        elif buffer.timer is None:
+            buffer.timer = self._spawn_background_flush(
+                session.id, buffer, delay=self._config.write_behind_flush_interval
+            )
+
+    def _spawn_background_flush(self, session_id: str, buffer: _SessionWriteBuffer, delay: float) -> asyncio.Task:
+        task = asyncio.create_task(self._background_flush(session_id, buffer, delay))
+        self._background_flushes.add(task)
+        task.add_done_callback(self._background_flushes.discard)
+        return task
+
+    async def _background_flush(self, session_id: str, buffer: _SessionWriteBuffer, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if buffer.timer is asyncio.current_task():
+            buffer.timer = None
+        try:
+            await self._flush_buffer(session_id, buffer)
+        except Exception as e:
+            # Events stay buffered and are retried by the next flush
+            logger.warning("Background flush of session %s events failed: %s", session_id, e)
+
+    async def _flush_buffer(self, session_id: str, buffer: _SessionWriteBuffer) -> None:
+        async with buffer.lock:
+            if buffer.events:
+                await self._post_buffered_events(session_id, buffer)
+
+            # Also drops buffers emptied by an earlier flush
+            if not buffer.events and buffer.timer is None and self._write_buffers.get(session_id) is buffer:
+                del self._write_buffers[session_id]
+
+    async def _post_buffered_events(self, session_id: str, buffer: _SessionWriteBuffer) -> None:
+        start = time.perf_counter()
+        count = len(buffer.events)
+        try:
+            if (
+                self._batch_events_supported
+                and count > 1
+                and await self._post_events_batch(session_id, buffer.user_id, buffer.events[:count])
+            ):
+                del buffer.events[:count]
+                write_buffer_depth_counter.add(-count)
+            else:
+                # Post one by one, dropping each event as soon as it is stored so a
+                # failure part way through does not resend the stored ones.
+                for _ in range(count):
+                    await self._post_event(session_id, buffer.user_id, buffer.events[0])
+                    del buffer.events[0]
+                    write_buffer_depth_counter.add(-1)
+        finally:
+            flush_duration_histogram.record(time.perf_counter() - start)
+
+    def _discard_write_buffer(self, session_id: str) -> None:
+        buffer = self._write_buffers.pop(session_id, None)
+        if buffer is None:
+            return
+        if buffer.timer is not None:
+            buffer.timer.cancel()
+        write_buffer_depth_counter.add(-len(buffer.events))
+        buffer.events.clear()
+
+    async def _post_event(self, session_id: str, user_id: str, event_data: dict[str, str]) -> None:
+        response = await self.client.post(
+            f"/api/sessions/{session_id}/events?user_id={user_id}",
+            json=event_data,
+            headers={"X-User-ID": user_id},
+        )
+        response.raise_for_status()
+
+    async def _post_events_batch(self, session_id: str, user_id: str, events_data: list[dict[str, str]]) -> bool:
+        """Store several events with a single request.
+
+        Returns:
+            False if the controller does not support batched writes, True otherwise.
+        """
+        response = await self.client.post(
+            f"/api/sessions/{session_id}/events/batch?user_id={user_id}",
+            json={"events": events_data},
+            headers={"X-User-ID": user_id},
+        )
+        if response.status_code in (404, 405):
+            logger.info("Controller does not support batched session events, falling back to single event writes")
+            self._batch_events_supported = False
+            return False
+        response.raise_for_status()
+        return True
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins import BasePlugin
+from google.adk.tools import BaseTool, ToolContext
+from google.adk.tools.mcp_tool.mcp_tool import McpTool
+from google.genai import types
+from pydantic import BaseModel, Field
+from typing_extensions import override
+
+logger = logging.getLogger(__name__)
+
+
+class ToolSchedulerConfig(BaseModel):
+    """Limits on how the tool calls of an agent are run."""
+
+    # Maximum number of calls of one tool running at once, across all requests. 0 means no limit.
+    max_concurrency_per_tool: int = 0
+
+    # Limits for specific tools by name, overriding max_concurrency_per_tool
+    tool_concurrency: dict[str, int] = Field(default_factory=dict)
+
+    # Seconds a tool call may run before it is stopped with an error result. 0 means no timeout.
+    timeout: float = 0
+
+    # Timeouts for specific tools by name, overriding timeout
+    tool_timeouts: dict[str, float] = Field(default_factory=dict)
+
+    # Tools with side effects, besides the MCP tools annotated as not read-only or destructive
+    side_effecting_tools: list[str] = Field(default_factory=list)
+
+
+def _declares_side_effects(tool: BaseTool) -> bool:
+    if not isinstance(tool, McpTool):
+        return False
+    annotations = tool.raw_mcp_tool.annotations
+    if annotations is None or annotations.readOnlyHint:
+        return False
+    return annotations.readOnlyHint is False or bool(annotations.destructiveHint)
+
+
+class _ScheduledTool(BaseTool):
+    """Runs the calls of a tool through the scheduler."""
+
+    def __init__(self, tool: BaseTool, scheduler: "ToolSchedulerPlugin"):
+        super().__init__(
+            name=tool.name,
+            description=tool.description,
+            is_long_running=tool.is_long_running,
+            custom_metadata=tool.custom_metadata,
+        )
+        self.tool = tool
+        self._scheduler = scheduler
+
+    @override
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        return self.tool._get_declaration()
+
+    @override
+    async def run_async(self, *, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        return await self._scheduler.run(self.tool, args, tool_context)
+
+
+class ToolSchedulerPlugin(BasePlugin):
+    """Applies concurrency limits, timeouts and ordering to the tool calls of an agent.
+
+    ADK runs the function calls of a model response concurrently and returns their
+    results in call order. This plugin bounds how many calls of each tool run at
+    once across all requests, stops calls that run longer than their timeout with
+    an error result the model can react to, and runs the calls of side-effecting
+    tools in a response one at a time, in call order. Calls of other tools still
+    run alongside them.
+
+    Args:
+        config: The limits. Calls run as ADK schedules them if None.
+    """
+
+    def __init__(self, config: Optional[ToolSchedulerConfig] = None):
+        super().__init__(name="kagent_tool_scheduler")
+        self._config = config or ToolSchedulerConfig()
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        # Locks serializing side-effecting calls, per invocation, with the number of calls using them
+        self._invocation_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    @override
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        # The function calls of the response are run with the tools of the request
+        for name, tool in list(llm_request.tools_dict.items()):
+            if not isinstance(tool, _ScheduledTool):
+                llm_request.tools_dict[name] = _ScheduledTool(tool, self)
+        return None
+
+    async def run(self, tool: BaseTool, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        """Run a call of a tool within the limits."""
+        if tool.name in self._config.side_effecting_tools or _declares_side_effects(tool):
+            async with self._serialized(tool_context.invocation_id):
+                return await self._run_limited(tool, args, tool_context)
+        return await self._run_limited(tool, args, tool_context)
+
+    async def _run_limited(self, tool: BaseTool, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        semaphore = self._semaphore(tool.name)
+        if semaphore is None:
+            return await self._run_with_timeout(tool, args, tool_context)
+        async with semaphore:
+            return await self._run_with_timeout(tool, args, tool_context)
+
+    async def _run_with_timeout(self, tool: BaseTool, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        timeout = self._config.tool_timeouts.get(tool.name, self._config.timeout)
+        if timeout <= 0:
+            return await tool.run_async(args=args, tool_context=tool_context)
+        try:
+            async with asyncio.timeout(timeout):
+                return await tool.run_async(args=args, tool_context=tool_context)
+        except TimeoutError:
+            logger.warning("Call %s of tool %s timed out after %ss", tool_context.function_call_id, tool.name, timeout)
+            return {"error": f"Tool call timed out after {timeout}s"}
+
+    def _semaphore(self, tool_name: str) -> Optional[asyncio.Semaphore]:
+        limit = self._config.tool_concurrency.get(tool_name, self._config.max_concurrency_per_tool)
+        if limit <= 0:
+            return None
+        semaphore = self._semaphores.get(tool_name)
+        if semaphore is None:
+            semaphore = self._semaphores[tool_name] = asyncio.Semaphore(limit)
+        return semaphore
+
+    @asynccontextmanager
+    async def _serialized(self, invocation_id: str) -> AsyncIterator[None]:
+        """Hold the invocation's lock for side-effecting calls."""
+        lock, users = self._invocation_locks.get(invocation_id, (asyncio.Lock(), 0))
+        self._invocation_locks[invocation_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._invocation_locks[invocation_id]
+            if users == 1:
+                del self._invocation_locks[invocation_id]
+            else:
+                self._invocation_locks[invocation_id] = (lock, users - 1)
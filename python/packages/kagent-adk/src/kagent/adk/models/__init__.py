@@ -1,3 +1,4 @@
 from ._openai import AzureOpenAI, OpenAI
+from ._response_cache import InMemoryResponseCache, ResponseCache, SqliteResponseCache
 
-__all__ = ["OpenAI", "AzureOpenAI"]
+__all__ = ["OpenAI", "AzureOpenAI", "ResponseCache", "InMemoryResponseCache", "SqliteResponseCache"]
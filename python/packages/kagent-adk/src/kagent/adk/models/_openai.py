@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import os
+from dataclasses import dataclass
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable, Literal, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable, Iterator, Literal, Optional
 
 from google.adk.models import BaseLlm
 from google.adk.models.llm_response import LlmResponse
@@ -14,6 +16,7 @@ from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai.types.chat import (
     ChatCompletion,
     ChatCompletionAssistantMessageParam,
+    ChatCompletionChunk,
     ChatCompletionContentPartImageParam,
     ChatCompletionContentPartTextParam,
     ChatCompletionMessageParam,
@@ -28,9 +31,18 @@ from openai.types.chat.chat_completion_message_tool_call_param import (
 from openai.types.chat.chat_completion_message_tool_call_param import (
     Function as ToolCallFunction,
 )
+from openai.types.completion_usage import CompletionUsage
 from openai.types.shared_params import FunctionDefinition, FunctionParameters
 from pydantic import Field
 
+from ._response_cache import (
+    ResponseCache,
+    dump_responses,
+    load_responses,
+    response_cache_key,
+    response_cache_lookups_counter,
+)
+
 if TYPE_CHECKING:
     from google.adk.models.llm_request import LlmRequest
 
@@ -45,124 +57,144 @@ def _convert_role_to_openai(role: Optional[str]) -> str:
         return "user"
 
 
+def _collect_function_responses(content: types.Content) -> dict[str, FunctionResponse]:
+    """Collect the function responses of a content by tool call id."""
+    function_responses: dict[str, FunctionResponse] = {}
+    for part in content.parts or []:
+        if part.function_response:
+            tool_call_id = part.function_response.id or "call_1"
+            function_responses[tool_call_id] = part.function_response
+    return function_responses
+
+
+def _convert_single_content(
+    content: types.Content, all_function_responses: dict[str, FunctionResponse]
+) -> list[ChatCompletionMessageParam]:
+    """Convert one google.genai Content to OpenAI messages."""
+    messages: list[ChatCompletionMessageParam] = []
+    role = _convert_role_to_openai(content.role)
+
+    # Separate different types of parts
+    text_parts: list[str] = []
+    function_calls: list[FunctionCall] = []
+    function_responses: list[FunctionResponse] = []
+    image_parts = []
+
+    for part in content.parts or []:
+        if part.text:
+            text_parts.append(part.text)
+        elif part.function_call:
+            function_calls.append(part.function_call)
+        elif part.function_response:
+            function_responses.append(part.function_response)
+        elif part.inline_data and part.inline_data.mime_type and part.inline_data.mime_type.startswith("image"):
+            if part.inline_data.data:
+                image_data = base64.b64encode(part.inline_data.data).decode()
+                image_part: ChatCompletionContentPartImageParam = {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:{part.inline_data.mime_type};base64,{image_data}"},
+                }
+                image_parts.append(image_part)
+
+    # Function responses are now handled together with function calls
+    # This ensures proper pairing and prevents orphaned tool messages
+
+    # Handle function calls (assistant messages with tool_calls)
+    if function_calls:
+        tool_calls = []
+        tool_response_messages = []
+
+        for func_call in function_calls:
+            tool_call_function: ToolCallFunction = {
+                "name": func_call.name or "",
+                "arguments": json.dumps(func_call.args) if func_call.args else "{}",
+            }
+            tool_call_id = func_call.id or "call_1"
+            tool_call = ChatCompletionMessageToolCallParam(
+                id=tool_call_id,
+                type="function",
+                function=tool_call_function,
+            )
+            tool_calls.append(tool_call)
+
+            # Check if we have a response for this tool call
+            if tool_call_id in all_function_responses:
+                func_response = all_function_responses[tool_call_id]
+                tool_message = ChatCompletionToolMessageParam(
+                    role="tool",
+                    tool_call_id=tool_call_id,
+                    content=str(func_response.response.get("result", "")) if func_response.response else "",
+                )
+                tool_response_messages.append(tool_message)
+            else:
+                # If no response is available, create a placeholder response
+                # This prevents the OpenAI API error
+                tool_message = ChatCompletionToolMessageParam(
+                    role="tool",
+                    tool_call_id=tool_call_id,
+                    content="No response available for this function call.",
+                )
+                tool_response_messages.append(tool_message)
+
+        # Create assistant message with tool calls
+        text_content = "\n".join(text_parts) if text_parts else None
+        assistant_message = ChatCompletionAssistantMessageParam(
+            role="assistant",
+            content=text_content,
+            tool_calls=tool_calls,
+        )
+        messages.append(assistant_message)
+
+        # Add all tool response messages immediately after the assistant message
+        messages.extend(tool_response_messages)
+
+    # Handle regular text/image messages (only if no function calls)
+    elif text_parts or image_parts:
+        if role == "user":
+            if image_parts and text_parts:
+                # Multi-modal content
+                text_part = ChatCompletionContentPartTextParam(type="text", text="\n".join(text_parts))
+                content_parts = [text_part] + image_parts
+                user_message = ChatCompletionUserMessageParam(role="user", content=content_parts)
+            elif image_parts:
+                # Image only
+                user_message = ChatCompletionUserMessageParam(role="user", content=image_parts)
+            else:
+                # Text only
+                user_message = ChatCompletionUserMessageParam(role="user", content="\n".join(text_parts))
+            messages.append(user_message)
+        elif role == "assistant":
+            # Assistant messages with text (no tool calls)
+            assistant_message = ChatCompletionAssistantMessageParam(
+                role="assistant",
+                content="\n".join(text_parts),
+            )
+            messages.append(assistant_message)
+
+    return messages
+
+
+def _system_messages(system_instruction: Optional[str]) -> list[ChatCompletionMessageParam]:
+    if not system_instruction:
+        return []
+    system_message: ChatCompletionSystemMessageParam = {"role": "system", "content": system_instruction}
+    return [system_message]
+
+
 def _convert_content_to_openai_messages(
     contents: list[types.Content], system_instruction: Optional[str] = None
 ) -> list[ChatCompletionMessageParam]:
     """Convert google.genai Content list to OpenAI messages format."""
-    messages: list[ChatCompletionMessageParam] = []
-
     # Add system message if provided
-    if system_instruction:
-        system_message: ChatCompletionSystemMessageParam = {"role": "system", "content": system_instruction}
-        messages.append(system_message)
+    messages = _system_messages(system_instruction)
 
     # First pass: collect all function responses to match with tool calls
     all_function_responses: dict[str, FunctionResponse] = {}
     for content in contents:
-        for part in content.parts or []:
-            if part.function_response:
-                tool_call_id = part.function_response.id or "call_1"
-                all_function_responses[tool_call_id] = part.function_response
+        all_function_responses.update(_collect_function_responses(content))
 
     for content in contents:
-        role = _convert_role_to_openai(content.role)
-
-        # Separate different types of parts
-        text_parts: list[str] = []
-        function_calls: list[FunctionCall] = []
-        function_responses: list[FunctionResponse] = []
-        image_parts = []
-
-        for part in content.parts or []:
-            if part.text:
-                text_parts.append(part.text)
-            elif part.function_call:
-                function_calls.append(part.function_call)
-            elif part.function_response:
-                function_responses.append(part.function_response)
-            elif part.inline_data and part.inline_data.mime_type and part.inline_data.mime_type.startswith("image"):
-                if part.inline_data.data:
-                    image_data = base64.b64encode(part.inline_data.data).decode()
-                    image_part: ChatCompletionContentPartImageParam = {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:{part.inline_data.mime_type};base64,{image_data}"},
-                    }
-                    image_parts.append(image_part)
-
-        # Function responses are now handled together with function calls
-        # This ensures proper pairing and prevents orphaned tool messages
-
-        # Handle function calls (assistant messages with tool_calls)
-        if function_calls:
-            tool_calls = []
-            tool_response_messages = []
-
-            for func_call in function_calls:
-                tool_call_function: ToolCallFunction = {
-                    "name": func_call.name or "",
-                    "arguments": json.dumps(func_call.args) if func_call.args else "{}",
-                }
-                tool_call_id = func_call.id or "call_1"
-                tool_call = ChatCompletionMessageToolCallParam(
-                    id=tool_call_id,
-                    type="function",
-                    function=tool_call_function,
-                )
-                tool_calls.append(tool_call)
-
-                # Check if we have a response for this tool call
-                if tool_call_id in all_function_responses:
-                    func_response = all_function_responses[tool_call_id]
-                    tool_message = ChatCompletionToolMessageParam(
-                        role="tool",
-                        tool_call_id=tool_call_id,
-                        content=str(func_response.response.get("result", "")) if func_response.response else "",
-                    )
-                    tool_response_messages.append(tool_message)
-                else:
-                    # If no response is available, create a placeholder response
-                    # This prevents the OpenAI API error
-                    tool_message = ChatCompletionToolMessageParam(
-                        role="tool",
-                        tool_call_id=tool_call_id,
-                        content="No response available for this function call.",
-                    )
-                    tool_response_messages.append(tool_message)
-
-            # Create assistant message with tool calls
-            text_content = "\n".join(text_parts) if text_parts else None
-            assistant_message = ChatCompletionAssistantMessageParam(
-                role="assistant",
-                content=text_content,
-                tool_calls=tool_calls,
-            )
-            messages.append(assistant_message)
-
-            # Add all tool response messages immediately after the assistant message
-            messages.extend(tool_response_messages)
-
-        # Handle regular text/image messages (only if no function calls)
-        elif text_parts or image_parts:
-            if role == "user":
-                if image_parts and text_parts:
-                    # Multi-modal content
-                    text_part = ChatCompletionContentPartTextParam(type="text", text="\n".join(text_parts))
-                    content_parts = [text_part] + image_parts
-                    user_message = ChatCompletionUserMessageParam(role="user", content=content_parts)
-                elif image_parts:
-                    # Image only
-                    user_message = ChatCompletionUserMessageParam(role="user", content=image_parts)
-                else:
-                    # Text only
-                    user_message = ChatCompletionUserMessageParam(role="user", content="\n".join(text_parts))
-                messages.append(user_message)
-            elif role == "assistant":
-                # Assistant messages with text (no tool calls)
-                assistant_message = ChatCompletionAssistantMessageParam(
-                    role="assistant",
-                    content="\n".join(text_parts),
-                )
-                messages.append(assistant_message)
+        messages.extend(_convert_single_content(content, all_function_responses))
 
     return messages
 
@@ -190,42 +222,112 @@ def _update_type_string(value_dict: dict[str, Any]):
             _update_type_string(value)
 
 
-def _convert_tools_to_openai(tools: list[types.Tool]) -> list[ChatCompletionToolParam]:
-    """Convert google.genai Tools to OpenAI tools format."""
-    openai_tools: list[ChatCompletionToolParam] = []
+def _convert_function_declaration(func_decl: types.FunctionDeclaration) -> ChatCompletionToolParam:
+    """Convert a google.genai FunctionDeclaration to an OpenAI tool."""
+    # Build function definition
+    function_def = FunctionDefinition(
+        name=func_decl.name or "",
+        description=func_decl.description or "",
+    )
 
-    for tool in tools:
-        if tool.function_declarations:
-            for func_decl in tool.function_declarations:
-                # Build function definition
-                function_def = FunctionDefinition(
-                    name=func_decl.name or "",
-                    description=func_decl.description or "",
-                )
+    # Always include parameters field, even if empty
+    properties = {}
+    required = []
+
+    if func_decl.parameters:
+        if func_decl.parameters.properties:
+            for prop_name, prop_schema in func_decl.parameters.properties.items():
+                value_dict = prop_schema.model_dump(exclude_none=True)
+                _update_type_string(value_dict)
+                properties[prop_name] = value_dict
+
+        if func_decl.parameters.required:
+            required = func_decl.parameters.required
 
-                # Always include parameters field, even if empty
-                properties = {}
-                required = []
+    function_def["parameters"] = {"type": "object", "properties": properties, "required": required}
 
-                if func_decl.parameters:
-                    if func_decl.parameters.properties:
-                        for prop_name, prop_schema in func_decl.parameters.properties.items():
-                            value_dict = prop_schema.model_dump(exclude_none=True)
-                            _update_type_string(value_dict)
-                            properties[prop_name] = value_dict
+    # Create the tool param
+    return ChatCompletionToolParam(type="function", function=function_def)
 
-                    if func_decl.parameters.required:
-                        required = func_decl.parameters.required
 
-                function_def["parameters"] = {"type": "object", "properties": properties, "required": required}
+def _sorted_keys(value: Any) -> Any:
+    """Returns value with the keys of all its dicts in sorted order."""
+    if isinstance(value, dict):
+        return {key: _sorted_keys(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_sorted_keys(item) for item in value]
+    return value
 
-                # Create the tool param
-                openai_tool = ChatCompletionToolParam(type="function", function=function_def)
+
+def _convert_tools_to_openai(tools: list[types.Tool], stable_order: bool = False) -> list[ChatCompletionToolParam]:
+    """Convert google.genai Tools to OpenAI tools format.
+
+    With stable_order, the tools are sorted by name and the keys of their schemas
+    are sorted, so the same tools serialize identically in whatever order they are
+    declared.
+    """
+    openai_tools: list[ChatCompletionToolParam] = []
+
+    for tool in tools:
+        if tool.function_declarations:
+            for func_decl in tool.function_declarations:
+                openai_tool = _convert_function_declaration(func_decl)
+                if stable_order:
+                    openai_tool = _sorted_keys(openai_tool)
                 openai_tools.append(openai_tool)
 
+    if stable_order:
+        openai_tools.sort(key=lambda openai_tool: openai_tool["function"]["name"])
     return openai_tools
 
 
+def _prompt_prefix_key(
+    messages: list[ChatCompletionMessageParam], tools: Optional[list[ChatCompletionToolParam]]
+) -> str:
+    """Hash of the tools and system message, the prefix shared by the requests of an agent."""
+    system_messages = [message for message in messages[:1] if message["role"] == "system"]
+    prefix = json.dumps([tools or [], system_messages], separators=(",", ":"))
+    return hashlib.sha256(prefix.encode()).hexdigest()[:32]
+
+
+def _function_call_part(tool_call_id: str, name: str, arguments: str) -> types.Part:
+    """Convert an OpenAI function tool call to a function call part."""
+    try:
+        args = json.loads(arguments) if arguments else {}
+    except json.JSONDecodeError:
+        args = {}
+
+    part = types.Part.from_function_call(name=name, args=args)
+    if part.function_call:
+        part.function_call.id = tool_call_id
+    return part
+
+
+def _convert_usage(usage: Optional[CompletionUsage]) -> Optional[types.GenerateContentResponseUsageMetadata]:
+    if not usage:
+        return None
+    prompt_tokens_details = getattr(usage, "prompt_tokens_details", None)
+    completion_tokens_details = getattr(usage, "completion_tokens_details", None)
+    cached_tokens = prompt_tokens_details.cached_tokens if prompt_tokens_details else None
+    reasoning_tokens = completion_tokens_details.reasoning_tokens if completion_tokens_details else None
+    return types.GenerateContentResponseUsageMetadata(
+        prompt_token_count=usage.prompt_tokens,
+        # Like Gemini, candidates count the answer only and thoughts the reasoning
+        candidates_token_count=usage.completion_tokens - (reasoning_tokens or 0),
+        thoughts_token_count=reasoning_tokens,
+        cached_content_token_count=cached_tokens,
+        total_token_count=usage.total_tokens,
+    )
+
+
+def _convert_finish_reason(finish_reason: Optional[str]) -> types.FinishReason:
+    if finish_reason == "length":
+        return types.FinishReason.MAX_TOKENS
+    if finish_reason == "content_filter":
+        return types.FinishReason.SAFETY
+    return types.FinishReason.STOP
+
+
 def _convert_openai_response_to_llm_response(response: ChatCompletion) -> LlmResponse:
     """Convert OpenAI response to LlmResponse."""
     choice = response.choices[0]
@@ -241,35 +343,85 @@ def _convert_openai_response_to_llm_response(response: ChatCompletion) -> LlmRes
     if hasattr(message, "tool_calls") and message.tool_calls:
         for tool_call in message.tool_calls:
             if tool_call.type == "function":
-                try:
-                    args = json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
-                except json.JSONDecodeError:
-                    args = {}
-
-                part = types.Part.from_function_call(name=tool_call.function.name, args=args)
-                if part.function_call:
-                    part.function_call.id = tool_call.id
-                parts.append(part)
+                parts.append(_function_call_part(tool_call.id, tool_call.function.name, tool_call.function.arguments))
 
     content = types.Content(role="model", parts=parts)
 
-    # Handle usage metadata
-    usage_metadata = None
-    if hasattr(response, "usage") and response.usage:
-        usage_metadata = types.GenerateContentResponseUsageMetadata(
-            prompt_token_count=response.usage.prompt_tokens,
-            candidates_token_count=response.usage.completion_tokens,
-            total_token_count=response.usage.total_tokens,
-        )
-
-    # Handle finish reason
-    finish_reason = types.FinishReason.STOP
-    if choice.finish_reason == "length":
-        finish_reason = types.FinishReason.MAX_TOKENS
-    elif choice.finish_reason == "content_filter":
-        finish_reason = types.FinishReason.SAFETY
+    return LlmResponse(
+        content=content,
+        usage_metadata=_convert_usage(getattr(response, "usage", None)),
+        finish_reason=_convert_finish_reason(choice.finish_reason),
+    )
+
+
+@dataclass
+class _StreamedToolCall:
+    index: int
+    id: str = ""
+    name: str = ""
+    arguments: str = ""
+
+
+class _StreamingResponseAccumulator:
+    """Assembles the chunks of a streamed chat completion into LlmResponses.
+
+    Text deltas are passed on right away as partial responses. Tool calls are
+    streamed as fragments of their arguments and are collected until the stream
+    ends. The full text and all the calls are then emitted together in one
+    response, with the usage and finish reason of the completion, so ADK runs the
+    calls of the turn concurrently.
+    """
+
+    def __init__(self):
+        self._text: list[str] = []
+        self._tool_calls: dict[int, _StreamedToolCall] = {}
+        self._finish_reason: Optional[str] = None
+        self._usage: Optional[CompletionUsage] = None
+
+    def process(self, chunk: ChatCompletionChunk) -> Iterator[LlmResponse]:
+        # Sent in a last chunk without choices when stream_options.include_usage is set
+        if chunk.usage:
+            self._usage = chunk.usage
+        if not chunk.choices:
+            return
+
+        choice = chunk.choices[0]
+        if choice.finish_reason:
+            self._finish_reason = choice.finish_reason
+        delta = choice.delta
+        if not delta:
+            return
+
+        if delta.content:
+            self._text.append(delta.content)
+            yield LlmResponse(
+                content=types.Content(role="model", parts=[types.Part.from_text(text=delta.content)]), partial=True
+            )
 
-    return LlmResponse(content=content, usage_metadata=usage_metadata, finish_reason=finish_reason)
+        for tool_call_delta in delta.tool_calls or []:
+            tool_call = self._tool_calls.setdefault(
+                tool_call_delta.index, _StreamedToolCall(index=tool_call_delta.index)
+            )
+            if tool_call_delta.id:
+                tool_call.id = tool_call_delta.id
+            if tool_call_delta.function:
+                tool_call.name += tool_call_delta.function.name or ""
+                tool_call.arguments += tool_call_delta.function.arguments or ""
+
+    def close(self) -> LlmResponse:
+        """Returns the response completing the turn, with the text and all tool calls."""
+        parts = []
+        if self._text:
+            parts.append(types.Part.from_text(text="".join(self._text)))
+        for index in sorted(self._tool_calls):
+            tool_call = self._tool_calls[index]
+            parts.append(_function_call_part(tool_call.id, tool_call.name, tool_call.arguments))
+        return LlmResponse(
+            content=types.Content(role="model", parts=parts) if parts else None,
+            usage_metadata=_convert_usage(self._usage),
+            finish_reason=_convert_finish_reason(self._finish_reason),
+            turn_complete=True,
+        )
 
 
 class BaseOpenAI(BaseLlm):
@@ -288,6 +440,16 @@ class BaseOpenAI(BaseLlm):
     temperature: Optional[float] = None
     timeout: Optional[int] = None
     top_p: Optional[float] = None
+    # Replays the responses of calls made before with the same messages, tools and
+    # parameters. Meant for deterministic calls, e.g. with a seed and temperature 0.
+    response_cache: Optional[ResponseCache] = Field(default=None, exclude=True)
+    # Sends the tools in a canonical order and form, so the tools and system message
+    # form a byte-identical prefix across turns that providers can cache, and sets
+    # prompt_cache_key to a hash of that prefix.
+    stable_prompt_prefix: bool = False
+    # Asks for the token usage of streamed responses, sent in a last chunk. By default
+    # it is asked for when the endpoint is known to support stream_options.
+    stream_usage: Optional[bool] = None
 
     @classmethod
     def supported_models(cls) -> list[str]:
@@ -305,6 +467,15 @@ class BaseOpenAI(BaseLlm):
             timeout=self.timeout,
         )
 
+    def _supports_stream_usage(self) -> bool:
+        """Whether the endpoint accepts stream_options in streaming requests."""
+        return True
+
+    def _endpoint(self) -> dict[str, Any]:
+        """Identifies the endpoint the requests go to, so the response cache keeps endpoints apart."""
+        # None is the client's default endpoint
+        return {"base_url": self.base_url or os.environ.get("OPENAI_BASE_URL")}
+
     async def generate_content_async(
         self, llm_request: LlmRequest, stream: bool = False
     ) -> AsyncGenerator[LlmResponse, None]:
@@ -359,22 +530,51 @@ class BaseOpenAI(BaseLlm):
                     genai_tools.append(tool)
 
             if genai_tools:
-                openai_tools = _convert_tools_to_openai(genai_tools)
+                openai_tools = _convert_tools_to_openai(genai_tools, stable_order=self.stable_prompt_prefix)
                 if openai_tools:
                     kwargs["tools"] = openai_tools
                     kwargs["tool_choice"] = "auto"
 
+        if self.stable_prompt_prefix:
+            # Lets the provider route the requests sharing the prefix to the same prompt cache.
+            # Sent in the body, as the older openai versions this package supports lack the parameter.
+            kwargs["extra_body"] = {"prompt_cache_key": _prompt_prefix_key(messages, kwargs.get("tools"))}
+
+        if self.response_cache is None:
+            async for response in self._generate(kwargs, stream):
+                yield response
+            return
+
+        key = response_cache_key(kwargs, stream, self._endpoint())
+        cached = await self.response_cache.get(key)
+        if cached is not None:
+            response_cache_lookups_counter.add(1, {"result": "hit"})
+            for response in load_responses(cached):
+                yield response
+            return
+        response_cache_lookups_counter.add(1, {"result": "miss"})
+
+        responses = []
+        async for response in self._generate(kwargs, stream):
+            # Copied in case the agent's callbacks modify the response
+            responses.append(response.model_copy(deep=True))
+            yield response
+        # Failed calls are made again next time
+        if not any(response.error_code for response in responses):
+            await self.response_cache.set(key, dump_responses(responses))
+
+    async def _generate(self, kwargs: dict[str, Any], stream: bool) -> AsyncGenerator[LlmResponse, None]:
         try:
             if stream:
                 # Handle streaming
+                accumulator = _StreamingResponseAccumulator()
+                stream_usage = self.stream_usage if self.stream_usage is not None else self._supports_stream_usage()
+                if stream_usage:
+                    kwargs = {**kwargs, "stream_options": {"include_usage": True}}
                 async for chunk in await self._client.chat.completions.create(stream=True, **kwargs):
-                    if chunk.choices and chunk.choices[0].delta:
-                        delta = chunk.choices[0].delta
-                        if delta.content:
-                            content = types.Content(role="model", parts=[types.Part.from_text(text=delta.content)])
-                            yield LlmResponse(
-                                content=content, partial=True, turn_complete=chunk.choices[0].finish_reason is not None
-                            )
+                    for response in accumulator.process(chunk):
+                        yield response
+                yield accumulator.close()
             else:
                 # Handle non-streaming
                 response = await self._client.chat.completions.create(stream=False, **kwargs)
@@ -390,6 +590,10 @@ class OpenAI(BaseOpenAI):
     type: Literal["openai"]
 
 
+# First Azure OpenAI API version that accepts stream_options
+_AZURE_STREAM_USAGE_API_VERSION = "2024-09-01-preview"
+
+
 class AzureOpenAI(BaseOpenAI):
     """Azure OpenAI model implementation."""
 
@@ -398,10 +602,26 @@ class AzureOpenAI(BaseOpenAI):
     azure_endpoint: Optional[str] = None
     azure_deployment: Optional[str] = None
 
+    @property
+    def _api_version(self) -> str:
+        return self.api_version or os.environ.get("OPENAI_API_VERSION", "2024-02-15-preview")
+
+    def _supports_stream_usage(self) -> bool:
+        # Dated API versions accept stream_options from 2024-09-01-preview on, the
+        # undated ones ("preview", "latest") of the v1 API sort after them
+        return self._api_version >= _AZURE_STREAM_USAGE_API_VERSION
+
+    def _endpoint(self) -> dict[str, Any]:
+        return {
+            "azure_endpoint": self.azure_endpoint or os.environ.get("AZURE_OPENAI_ENDPOINT"),
+            "azure_deployment": self.azure_deployment,
+            "api_version": self._api_version,
+        }
+
     @cached_property
     def _client(self) -> AsyncAzureOpenAI:
         """Get the Azure OpenAI client."""
-        api_version = self.api_version or os.environ.get("OPENAI_API_VERSION", "2024-02-15-preview")
+        api_version = self._api_version
         azure_endpoint = self.azure_endpoint or os.environ.get("AZURE_OPENAI_ENDPOINT")
         api_key = self.api_key or os.environ.get("AZURE_OPENAI_API_KEY")
 
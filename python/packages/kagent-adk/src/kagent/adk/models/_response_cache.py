@@ -0,0 +1,129 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+
+from google.adk.models.llm_response import LlmResponse
+from opentelemetry import metrics
+from pydantic import TypeAdapter
+
+from kagent.core import BoundedCache
+
+meter = metrics.get_meter("kagent.adk")
+response_cache_lookups_counter = meter.create_counter(
+    "kagent.llm.response_cache.lookups",
+    description="Number of LLM calls looked up in the response cache, by result (hit or miss)",
+)
+
+_responses_adapter = TypeAdapter(list[LlmResponse])
+
+
+class ResponseCache(ABC):
+    """Stores the responses of LLM calls, serialized, by request key."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Returns the responses stored for key, or None if there are none or they expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        """Stores the responses for key."""
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Keeps responses in process, evicting the least recently used ones.
+
+    Args:
+        max_entries: Maximum number of calls kept. Unbounded if None.
+        max_bytes: Maximum total size of the serialized responses. Unbounded if None.
+        ttl: Seconds the responses of a call are kept. Kept until evicted if None.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        self._responses: BoundedCache[str, str] = BoundedCache(
+            "llm_responses", max_entries=max_entries, ttl=ttl, max_bytes=max_bytes, sizeof=len
+        )
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._responses.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._responses.set(key, value)
+
+
+class SqliteResponseCache(ResponseCache):
+    """Keeps responses in a SQLite database, so they outlive the process.
+
+    Expired responses are deleted when the database is opened.
+
+    Args:
+        path: The database file. Created if it does not exist.
+        ttl: Seconds the responses of a call are kept. Kept forever if None.
+    """
+
+    def __init__(self, path: str | Path, *, ttl: Optional[float] = None):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self._ttl if self._ttl is not None else None
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)", (key, value, expires_at)
+            )
+
+
+def response_cache_key(request: dict[str, Any], stream: bool, endpoint: dict[str, Any]) -> str:
+    """Hash of everything sent to the model: messages, tools and sampling parameters,
+    and of the endpoint they are sent to.
+
+    Streamed and non-streamed calls are cached apart, so a streamed call replays
+    the same partial responses.
+    """
+    canonical = json.dumps(
+        {**request, "stream": stream, "endpoint": endpoint}, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def dump_responses(responses: list[LlmResponse]) -> str:
+    return _responses_adapter.dump_json(responses, exclude_none=True).decode()
+
+
+def load_responses(value: str) -> list[LlmResponse]:
+    return _responses_adapter.validate_json(value)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import signal
 from pathlib import Path
 from typing import Any, Dict
 
@@ -136,14 +137,19 @@ class BashTool(BaseTool):
                 stderr=asyncio.subprocess.PIPE,
                 cwd=working_dir,
                 env=env,  # Pass the modified environment
+                # Own process group, so the shell, srt and the command can be killed together
+                start_new_session=True,
             )
 
             try:
                 stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
+                await _kill_process_group(process)
                 return f"Error: Command timed out after {timeout}s"
+            except asyncio.CancelledError:
+                # The A2A task was canceled, don't leave the command running
+                await _kill_process_group(process)
+                raise
 
             stdout_str = stdout.decode("utf-8", errors="replace") if stdout else ""
             stderr_str = stderr.decode("utf-8", errors="replace") if stderr else ""
@@ -181,3 +187,11 @@ class BashTool(BaseTool):
             return 60.0  # 1 minute for python scripts
         else:
             return 30.0  # 30 seconds for other commands
+
+
+async def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await process.wait()
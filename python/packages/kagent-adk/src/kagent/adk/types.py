@@ -56,11 +56,15 @@ class OpenAI(BaseLLM):
     temperature: float | None = None
     timeout: int | None = None
     top_p: float | None = None
+    stable_prompt_prefix: bool = False
+    stream_usage: bool | None = None
 
     type: Literal["openai"]
 
 
 class AzureOpenAI(BaseLLM):
+    stream_usage: bool | None = None
+
     type: Literal["azure_openai"]
 
 
@@ -144,6 +148,8 @@ class AgentConfig(BaseModel):
                 temperature=self.model.temperature,
                 timeout=self.model.timeout,
                 top_p=self.model.top_p,
+                stable_prompt_prefix=self.model.stable_prompt_prefix,
+                stream_usage=self.model.stream_usage,
             )
         elif self.model.type == "anthropic":
             model = LiteLlm(
@@ -156,7 +162,12 @@ class AgentConfig(BaseModel):
         elif self.model.type == "ollama":
             model = LiteLlm(model=f"ollama_chat/{self.model.model}", extra_headers=extra_headers)
         elif self.model.type == "azure_openai":
-            model = OpenAIAzure(model=self.model.model, type="azure_openai", default_headers=extra_headers)
+            model = OpenAIAzure(
+                model=self.model.model,
+                type="azure_openai",
+                default_headers=extra_headers,
+                stream_usage=self.model.stream_usage,
+            )
         elif self.model.type == "gemini":
             model = self.model.model
         else:
@@ -0,0 +1,110 @@
+"""Benchmark of building an ADK Runner per request against sharing one runner.
+
+Run from the kagent-adk package directory:
+
+    uv run python tests/benchmarks/bench_runner.py
+
+It reports the cost of constructing a Runner for an LlmAgent app, and the
+overhead per A2A request of the executor with a runner factory and with a
+shared runner. The agent answers without calling a model, so the numbers
+only contain kagent and ADK overhead.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import AsyncGenerator
+
+from a2a.server.agent_execution.context import RequestContext
+from a2a.server.context import ServerCallContext
+from a2a.server.events.event_queue import EventQueue
+from a2a.types import Message, MessageSendParams, Part, Role, TextPart
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.apps import App
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from kagent.adk._agent_executor import A2aAgentExecutor
+from kagent.adk._artifact_service import BoundedArtifactService
+
+APP_NAME = "bench"
+CONSTRUCTIONS = 2000
+REQUESTS = 500
+
+
+def get_weather(city: str) -> str:
+    """Returns the weather of a city."""
+    return "sunny"
+
+
+def get_time(city: str) -> str:
+    """Returns the local time of a city."""
+    return "noon"
+
+
+class EchoAgent(BaseAgent):
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            content=types.Content(role="model", parts=[types.Part(text="ok")]),
+        )
+
+
+def _request(i: int) -> RequestContext:
+    return RequestContext(
+        request=MessageSendParams(
+            message=Message(message_id=f"msg-{i}", role=Role.user, parts=[Part(TextPart(text="hi"))])
+        ),
+        task_id=f"task-{i}",
+        context_id=f"session-{i % 10}",
+        call_context=ServerCallContext(state={"headers": {}}),
+    )
+
+
+def bench_construction() -> float:
+    app = App(
+        name=APP_NAME,
+        root_agent=LlmAgent(name="assistant", model="gemini-2.0-flash", tools=[get_weather, get_time]),
+    )
+    session_service = InMemorySessionService()
+    timings = []
+    for _ in range(CONSTRUCTIONS):
+        started = time.perf_counter()
+        Runner(app=app, session_service=session_service, artifact_service=InMemoryArtifactService())
+        timings.append(time.perf_counter() - started)
+    return statistics.mean(timings)
+
+
+async def bench_requests(shared: bool) -> float:
+    app = App(name=APP_NAME, root_agent=EchoAgent(name="echo"))
+    session_service = InMemorySessionService()
+    if shared:
+        runner = Runner(app=app, session_service=session_service, artifact_service=BoundedArtifactService())
+    else:
+
+        def runner() -> Runner:
+            return Runner(app=app, session_service=session_service, artifact_service=InMemoryArtifactService())
+
+    executor = A2aAgentExecutor(runner=runner)
+    started = time.perf_counter()
+    for i in range(REQUESTS):
+        await executor.execute(_request(i), EventQueue())
+    return (time.perf_counter() - started) / REQUESTS
+
+
+def main():
+    construction = bench_construction()
+    per_request_factory = asyncio.run(bench_requests(shared=False))
+    per_request_shared = asyncio.run(bench_requests(shared=True))
+    print(f"Runner construction:           {construction * 1e6:8.1f} us")  # noqa: T201
+    print(f"Request with a runner factory: {per_request_factory * 1e6:8.1f} us")  # noqa: T201
+    print(f"Request with a shared runner:  {per_request_shared * 1e6:8.1f} us")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""A local, in-memory stand-in for the kagent controller HTTP API.
+
+Serves the session endpoints used by the kagent ADK integration through an
+httpx.MockTransport, so tests can exercise the real HTTP client code paths
+without a running controller.
+"""
+
+import json
+import re
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+_SESSION_EVENTS_BATCH_PATH = re.compile(r"^/api/sessions/(?P<session_id>[^/]+)/events/batch$")
+_SESSION_EVENTS_PATH = re.compile(r"^/api/sessions/(?P<session_id>[^/]+)/events$")
+_SESSION_PATH = re.compile(r"^/api/sessions/(?P<session_id>[^/]+)$")
+
+
+class FakeKAgentController:
+    """In-memory fake of the kagent controller session API.
+
+    Args:
+        batch_events: Whether the batched session events endpoint is available.
+    """
+
+    def __init__(self, batch_events: bool = True):
+        self.batch_events = batch_events
+        self.sessions: dict[str, dict] = {}
+        self.events: dict[str, list[dict]] = {}
+        self.requests: list[httpx.Request] = []
+        self._clock = datetime(2025, 1, 1, tzinfo=UTC)
+        # Time between stored events, zero stores them with the same timestamp
+        self.tick = timedelta(milliseconds=1)
+
+    def client(self) -> httpx.AsyncClient:
+        """Returns an async client routed to this fake controller."""
+        return httpx.AsyncClient(base_url="http://kagent.test", transport=httpx.MockTransport(self.handle))
+
+    def requests_to(self, method: str, path_suffix: str) -> list[httpx.Request]:
+        return [r for r in self.requests if r.method == method and r.url.path.endswith(path_suffix)]
+
+    def stored_event_ids(self, session_id: str) -> list[str]:
+        return [event["id"] for event in self.events.get(session_id, [])]
+
+    def _now(self) -> str:
+        # Increasing timestamps, formatted like the Go controller does
+        self._clock += self.tick
+        return self._clock.isoformat().replace("+00:00", "Z")
+
+    def _store_event(self, session_id: str, user_id: str, event_data: dict) -> dict:
+        event = {
+            "id": event_data["id"],
+            "session_id": session_id,
+            "user_id": user_id,
+            "created_at": self._now(),
+            "data": event_data["data"],
+        }
+        self.events.setdefault(session_id, []).append(event)
+        return event
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        user_id = request.url.params.get("user_id") or request.headers.get("X-User-ID")
+
+        if path == "/api/sessions" and request.method == "POST":
+            body = json.loads(request.content)
+            session = {"id": body["id"], "user_id": body["user_id"], "name": body.get("name")}
+            self.sessions[session["id"]] = session
+            self.events.setdefault(session["id"], [])
+            return httpx.Response(201, json={"error": False, "data": session})
+
+        if match := _SESSION_EVENTS_BATCH_PATH.match(path):
+            session_id = match["session_id"]
+            if not self.batch_events or request.method != "POST":
+                return httpx.Response(404, text="404 page not found")
+            if session_id not in self.sessions:
+                return httpx.Response(404, json={"error": True, "message": "Session not found"})
+            body = json.loads(request.content)
+            stored = [self._store_event(session_id, user_id, event) for event in body["events"]]
+            return httpx.Response(201, json={"error": False, "data": stored})
+
+        if match := _SESSION_EVENTS_PATH.match(path):
+            session_id = match["session_id"]
+            if session_id not in self.sessions:
+                return httpx.Response(404, json={"error": True, "message": "Session not found"})
+            stored = self._store_event(session_id, user_id, json.loads(request.content))
+            return httpx.Response(201, json={"error": False, "data": stored})
+
+        if match := _SESSION_PATH.match(path):
+            session_id = match["session_id"]
+            session = self.sessions.get(session_id)
+            if session is None:
+                return httpx.Response(404, json={"error": True, "message": "Session not found"})
+
+            if request.method == "DELETE":
+                del self.sessions[session_id]
+                self.events.pop(session_id, None)
+                return httpx.Response(200, json={"error": False, "data": None})
+
+            events = self.events.get(session_id, [])
+            if after := request.url.params.get("after"):
+                after_time = datetime.fromisoformat(after)
+                events = [e for e in events if datetime.fromisoformat(e["created_at"]) >= after_time]
+            # The controller returns the most recent events first
+            events = list(reversed(events))
+            limit = int(request.url.params.get("limit", "0"))
+            if limit > 1:
+                events = events[:limit]
+            return httpx.Response(200, json={"error": False, "data": {"session": session, "events": events}})
+
+        return httpx.Response(404, text="404 page not found")
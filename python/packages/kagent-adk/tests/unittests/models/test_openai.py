@@ -12,17 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
 from unittest import mock
 
 import pytest
+from google.adk.agents import LlmAgent
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
 from google.genai import types
 from google.genai.types import Content, Part
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from openai.types.chat.chat_completion_tool_param import ChatCompletionToolParam
 
-from kagent.adk.models import OpenAI
-from kagent.adk.models._openai import _convert_tools_to_openai
+from kagent.adk.models import AzureOpenAI, OpenAI
+from kagent.adk.models._openai import (
+    _convert_content_to_openai_messages,
+    _convert_openai_response_to_llm_response,
+    _convert_tools_to_openai,
+)
 
 
 @pytest.fixture
@@ -303,6 +313,47 @@ async def test_function_declaration_to_tool_param(_, function_declaration, expec
     assert result[0] == expected_tool_param
 
 
+def _call(call_id: str) -> Content:
+    return Content(role="model", parts=[Part(function_call=types.FunctionCall(id=call_id, name="search", args={}))])
+
+
+def _response(call_id: str, result: str) -> Content:
+    return Content(
+        role="user",
+        parts=[Part(function_response=types.FunctionResponse(id=call_id, name="search", response={"result": result}))],
+    )
+
+
+@pytest.mark.asyncio
+async def test_each_request_converts_its_whole_history(openai_llm, generate_content_response):
+    question = Content(role="user", parts=[Part.from_text(text="Find kagent")])
+    histories = [
+        [question, _call("call_a"), _response("call_a", "old")],
+        [question, _call("call_a"), _response("call_a", "new")],
+        # The tool response is gone, the call gets a placeholder response
+        [question, _call("call_a"), Content(role="user", parts=[Part.from_text(text="Never mind")])],
+    ]
+
+    sent = []
+    with mock.patch.object(openai_llm, "_client") as mock_client:
+
+        async def create(**kwargs):
+            sent.append(kwargs["messages"])
+            return generate_content_response
+
+        mock_client.chat.completions.create.side_effect = create
+        for contents in histories:
+            request = LlmRequest(model="gpt-3.5-turbo", contents=contents)
+            _ = [resp async for resp in openai_llm.generate_content_async(request, stream=False)]
+
+    assert sent == [_convert_content_to_openai_messages(contents) for contents in histories]
+    assert [messages[2]["content"] for messages in sent] == [
+        "old",
+        "new",
+        "No response available for this function call.",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_generate_content_async(openai_llm, llm_request, generate_content_response, generate_llm_response):
     with mock.patch.object(openai_llm, "_client") as mock_client:
@@ -336,3 +387,209 @@ async def test_generate_content_async_with_max_tokens(llm_request, generate_cont
         mock_client.chat.completions.create.assert_called_once()
         _, kwargs = mock_client.chat.completions.create.call_args
         assert kwargs["max_tokens"] == 4096
+
+
+def _chunk(content=None, tool_call=None, finish_reason=None, usage=None) -> ChatCompletionChunk:
+    choices = []
+    if content is not None or tool_call is not None or finish_reason is not None:
+        delta = {"content": content, "tool_calls": [tool_call] if tool_call else None}
+        choices.append({"index": 0, "delta": delta, "finish_reason": finish_reason})
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chunk",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": choices,
+            "usage": usage,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_streams_text_and_tool_calls(openai_llm, llm_request):
+    chunks = [
+        _chunk(content="Let me "),
+        _chunk(content="check."),
+        _chunk(tool_call={"index": 0, "id": "call_a", "function": {"name": "search", "arguments": ""}}),
+        _chunk(tool_call={"index": 0, "function": {"arguments": '{"query": '}}),
+        _chunk(tool_call={"index": 0, "function": {"arguments": '"kagent"}'}}),
+        _chunk(
+            tool_call={"index": 1, "id": "call_b", "function": {"name": "fetch", "arguments": '{"url": "kagent.dev"}'}}
+        ),
+        _chunk(finish_reason="tool_calls"),
+        _chunk(usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}),
+    ]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    with mock.patch.object(openai_llm, "_client") as mock_client:
+        mock_client.chat.completions.create = mock.AsyncMock(return_value=stream())
+
+        responses = [resp async for resp in openai_llm.generate_content_async(llm_request, stream=True)]
+
+        _, kwargs = mock_client.chat.completions.create.call_args
+        assert kwargs["stream_options"] == {"include_usage": True}
+
+    assert [r.content.parts[0].text for r in responses[:2]] == ["Let me ", "check."]
+    assert all(r.partial for r in responses[:2])
+
+    # The text and both calls complete the turn in one response
+    last = responses[2]
+    assert len(responses) == 3
+    assert not last.partial
+    assert last.turn_complete
+    assert last.content.parts[0].text == "Let me check."
+    assert last.content.parts[1].function_call.id == "call_a"
+    assert last.content.parts[1].function_call.args == {"query": "kagent"}
+    assert last.content.parts[2].function_call.name == "fetch"
+    assert last.content.parts[2].function_call.args == {"url": "kagent.dev"}
+    assert last.usage_metadata.total_token_count == 15
+
+
+@pytest.mark.asyncio
+async def test_streamed_tool_calls_of_a_turn_run_concurrently(openai_llm):
+    running = 0
+    max_running = 0
+
+    async def lookup(key: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return key
+
+    async def tool_calls():
+        for i, key in enumerate("ab"):
+            yield _chunk(tool_call={"index": i, "id": f"call_{key}", "function": {"name": "lookup", "arguments": ""}})
+            yield _chunk(tool_call={"index": i, "function": {"arguments": json.dumps({"key": key})}})
+        yield _chunk(finish_reason="tool_calls")
+
+    async def answer():
+        yield _chunk(content="Done")
+        yield _chunk(finish_reason="stop")
+
+    runner = InMemoryRunner(agent=LlmAgent(name="agent", model=openai_llm, tools=[lookup]), app_name="app")
+    session = await runner.session_service.create_session(app_name="app", user_id="user")
+    with mock.patch.object(openai_llm, "_client") as mock_client:
+        mock_client.chat.completions.create = mock.AsyncMock(side_effect=[tool_calls(), answer()])
+
+        events = [
+            event
+            async for event in runner.run_async(
+                user_id="user",
+                session_id=session.id,
+                new_message=types.UserContent(parts=[types.Part(text="go")]),
+                run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+            )
+        ]
+
+    responses = [r.response["result"] for event in events for r in event.get_function_responses()]
+    assert responses == ["a", "b"]
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "api_version, stream_usage, sends_stream_options",
+    [
+        # The default version rejects stream_options
+        (None, None, False),
+        ("2024-10-21", None, True),
+        ("2024-02-15-preview", True, True),
+        ("2024-10-21", False, False),
+    ],
+)
+async def test_azure_streaming_asks_for_usage_when_supported(
+    monkeypatch, llm_request, api_version, stream_usage, sends_stream_options
+):
+    monkeypatch.delenv("OPENAI_API_VERSION", raising=False)
+    azure_llm = AzureOpenAI(
+        model="gpt-4o",
+        type="azure_openai",
+        api_key="fake",
+        azure_endpoint="https://example.openai.azure.com",
+        api_version=api_version,
+        stream_usage=stream_usage,
+    )
+
+    async def stream():
+        yield _chunk(content="Hi")
+        yield _chunk(finish_reason="stop")
+
+    with mock.patch.object(azure_llm, "_client") as mock_client:
+        mock_client.chat.completions.create = mock.AsyncMock(return_value=stream())
+
+        responses = [resp async for resp in azure_llm.generate_content_async(llm_request, stream=True)]
+
+        _, kwargs = mock_client.chat.completions.create.call_args
+        assert ("stream_options" in kwargs) == sends_stream_options
+    assert responses[-1].content.parts[0].text == "Hi"
+
+
+def _tool(name: str, *properties: str) -> types.Tool:
+    return types.Tool(
+        function_declarations=[
+            types.FunctionDeclaration(
+                name=name,
+                parameters=types.Schema(
+                    type=types.Type.OBJECT,
+                    properties={prop: types.Schema(type=types.Type.STRING, description=prop) for prop in properties},
+                ),
+            )
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_stable_prompt_prefix_sends_the_same_tools_in_any_declared_order(generate_content_response):
+    openai_llm = OpenAI(model="gpt-4o", type="openai", api_key="fake", stable_prompt_prefix=True)
+
+    def request(*tools: types.Tool) -> LlmRequest:
+        return LlmRequest(
+            model="gpt-4o",
+            contents=[Content(role="user", parts=[Part.from_text(text="Hello")])],
+            config=types.GenerateContentConfig(system_instruction="You are a helpful assistant", tools=list(tools)),
+        )
+
+    with mock.patch.object(openai_llm, "_client") as mock_client:
+        mock_client.chat.completions.create = mock.AsyncMock(return_value=generate_content_response)
+
+        _ = [r async for r in openai_llm.generate_content_async(request(_tool("b", "y", "x"), _tool("a")))]
+        _ = [r async for r in openai_llm.generate_content_async(request(_tool("a"), _tool("b", "x", "y")))]
+
+        first, second = [call.kwargs for call in mock_client.chat.completions.create.call_args_list]
+
+    assert json.dumps(first["tools"]) == json.dumps(second["tools"])
+    assert [tool["function"]["name"] for tool in first["tools"]] == ["a", "b"]
+    assert first["extra_body"]["prompt_cache_key"] == second["extra_body"]["prompt_cache_key"]
+
+
+def test_usage_includes_cached_and_reasoning_tokens():
+    response = ChatCompletion.model_validate(
+        {
+            "id": "completion",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "o3",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hi"}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": 1200,
+                "completion_tokens": 300,
+                "total_tokens": 1500,
+                "prompt_tokens_details": {"cached_tokens": 1024},
+                "completion_tokens_details": {"reasoning_tokens": 256},
+            },
+        }
+    )
+
+    usage = _convert_openai_response_to_llm_response(response).usage_metadata
+
+    assert usage.prompt_token_count == 1200
+    assert usage.cached_content_token_count == 1024
+    assert usage.candidates_token_count == 44
+    assert usage.thoughts_token_count == 256
+    assert usage.total_token_count == 1500
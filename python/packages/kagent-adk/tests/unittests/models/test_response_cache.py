@@ -0,0 +1,140 @@
+from unittest import mock
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from google.genai.types import Content, Part
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from kagent.adk.models import AzureOpenAI, InMemoryResponseCache, OpenAI, SqliteResponseCache
+
+
+def _request(text: str = "Hello") -> LlmRequest:
+    return LlmRequest(
+        model="gpt-4o",
+        contents=[Content(role="user", parts=[Part.from_text(text=text)])],
+        config=types.GenerateContentConfig(temperature=0, system_instruction="You are a helpful assistant"),
+    )
+
+
+def _completion(text: str) -> ChatCompletion:
+    return ChatCompletion.model_validate(
+        {
+            "id": "completion",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+        }
+    )
+
+
+def _chunk(content=None, finish_reason=None) -> ChatCompletionChunk:
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chunk",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": finish_reason}],
+        }
+    )
+
+
+async def _generate(llm: OpenAI, request: LlmRequest, stream: bool = False):
+    return [response async for response in llm.generate_content_async(request, stream=stream)]
+
+
+@pytest.mark.asyncio
+async def test_repeated_calls_are_served_from_the_cache():
+    llm = OpenAI(model="gpt-4o", type="openai", api_key="fake", seed=1, response_cache=InMemoryResponseCache())
+    with mock.patch.object(llm, "_client") as mock_client:
+        mock_client.chat.completions.create = mock.AsyncMock(return_value=_completion("Hi!"))
+
+        first = await _generate(llm, _request())
+        second = await _generate(llm, _request())
+        await _generate(llm, _request("Something else"))
+
+        assert mock_client.chat.completions.create.call_count == 2
+    assert second == first
+    assert second[0].content.parts[0].text == "Hi!"
+    assert second[0].usage_metadata.total_token_count == 12
+
+
+@pytest.mark.asyncio
+async def test_streamed_calls_replay_the_partial_responses():
+    def stream():
+        async def chunks():
+            for chunk in [_chunk("Hi"), _chunk(" there"), _chunk(finish_reason="stop")]:
+                yield chunk
+
+        return chunks()
+
+    llm = OpenAI(model="gpt-4o", type="openai", api_key="fake", response_cache=InMemoryResponseCache())
+    with mock.patch.object(llm, "_client") as mock_client:
+        mock_client.chat.completions.create = mock.AsyncMock(side_effect=lambda **kwargs: stream())
+
+        first = await _generate(llm, _request(), stream=True)
+        second = await _generate(llm, _request(), stream=True)
+
+        mock_client.chat.completions.create.assert_called_once()
+    assert [r.partial for r in second] == [True, True, None]
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_are_not_cached():
+    llm = OpenAI(model="gpt-4o", type="openai", api_key="fake", response_cache=InMemoryResponseCache())
+    with mock.patch.object(llm, "_client") as mock_client:
+        mock_client.chat.completions.create = mock.AsyncMock(side_effect=[RuntimeError("boom"), _completion("Hi!")])
+
+        assert (await _generate(llm, _request()))[0].error_code == "API_ERROR"
+        assert (await _generate(llm, _request()))[0].content.parts[0].text == "Hi!"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_outlives_the_process_until_expired(tmp_path):
+    path = tmp_path / "responses.db"
+    cache = SqliteResponseCache(path)
+    await cache.set("key", "value")
+    cache.close()
+
+    reopened = SqliteResponseCache(path)
+    assert await reopened.get("key") == "value"
+    assert await reopened.get("other") is None
+    reopened.close()
+
+    expiring = SqliteResponseCache(path, ttl=0)
+    await expiring.set("key", "new value")
+    assert await expiring.get("key") is None
+    expiring.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_keeps_endpoints_apart():
+    cache = InMemoryResponseCache()
+    llms = [
+        OpenAI(model="gpt-4o", type="openai", api_key="fake", response_cache=cache),
+        OpenAI(model="gpt-4o", type="openai", api_key="fake", base_url="http://proxy/v1", response_cache=cache),
+        AzureOpenAI(
+            model="gpt-4o", type="azure_openai", api_key="fake", azure_endpoint="https://a", response_cache=cache
+        ),
+        AzureOpenAI(
+            model="gpt-4o", type="azure_openai", api_key="fake", azure_endpoint="https://b", response_cache=cache
+        ),
+        AzureOpenAI(
+            model="gpt-4o",
+            type="azure_openai",
+            api_key="fake",
+            azure_endpoint="https://b",
+            api_version="2024-10-21",
+            response_cache=cache,
+        ),
+    ]
+    for i, llm in enumerate(llms):
+        with mock.patch.object(llm, "_client") as mock_client:
+            mock_client.chat.completions.create = mock.AsyncMock(return_value=_completion(f"Hi from {i}"))
+
+            assert (await _generate(llm, _request()))[0].content.parts[0].text == f"Hi from {i}"
+            mock_client.chat.completions.create.assert_called_once()
@@ -0,0 +1,238 @@
+import asyncio
+import json
+import time
+from typing import AsyncGenerator
+
+import pytest
+from a2a.server.agent_execution.context import RequestContext
+from a2a.server.context import ServerCallContext
+from a2a.server.events.event_queue import EventQueue
+from a2a.types import Message, MessageSendParams, Part, Role, TaskState, TextPart
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.genai import types
+
+from kagent.adk import A2aAgentExecutorConfig
+from kagent.adk._agent_executor import A2aAgentExecutor
+from kagent.adk._session_service import KAgentSessionService
+
+from .fake_controller import FakeKAgentController
+
+APP_NAME = "test_app"
+
+
+class EchoAgent(BaseAgent):
+    """Replies with the request headers it finds in the session state."""
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        headers = ctx.session.state.get("headers")
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            content=types.Content(role="model", parts=[types.Part(text=json.dumps(headers))]),
+        )
+
+
+class StreamingAgent(BaseAgent):
+    """Streams its reply as one partial event per word, followed by the full reply.
+
+    It stalls for stall seconds before the last word, recording when it resumed.
+    """
+
+    stall: float = 0.0
+    resumed_at: list[float] = []
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        words = ["one ", "two ", "three ", "four"]
+        for word in words:
+            if word == words[-1] and self.stall:
+                await asyncio.sleep(self.stall)
+                self.resumed_at.append(time.monotonic())
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                partial=True,
+                content=types.Content(role="model", parts=[types.Part(text=word)]),
+            )
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            content=types.Content(role="model", parts=[types.Part(text="".join(words))]),
+        )
+
+
+class SlowAgent(BaseAgent):
+    """Waits until it is canceled."""
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        await asyncio.sleep(60)
+        yield Event(invocation_id=ctx.invocation_id, author=self.name)
+
+
+def _request_context(text: str, headers: dict[str, str]) -> RequestContext:
+    return RequestContext(
+        request=MessageSendParams(
+            message=Message(message_id="msg-1", role=Role.user, parts=[Part(TextPart(text=text))])
+        ),
+        task_id="task-1",
+        context_id="session-1",
+        call_context=ServerCallContext(state={"headers": headers}),
+    )
+
+
+async def _execute(executor: A2aAgentExecutor, context: RequestContext):
+    queue = EventQueue()
+    await executor.execute(context, queue)
+    events = []
+    while not queue.queue.empty():
+        events.append(await queue.dequeue_event())
+    return events
+
+
+def _stored_events(controller: FakeKAgentController) -> list[Event]:
+    return [Event.model_validate_json(e["data"]) for e in controller.events["session-1"]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("header_state_mode", ["event", "message"])
+async def test_request_headers_are_visible_to_the_agent(header_state_mode):
+    controller = FakeKAgentController()
+    session_service = KAgentSessionService(controller.client())
+    executor = A2aAgentExecutor(
+        runner=lambda: Runner(app_name=APP_NAME, agent=EchoAgent(name="echo"), session_service=session_service),
+        config=A2aAgentExecutorConfig(header_state_mode=header_state_mode),
+    )
+
+    events = await _execute(executor, _request_context("hi", {"x-tenant": "a"}))
+
+    assert events[-1].status.state == TaskState.completed
+    assert json.loads(events[-2].artifact.parts[0].root.text) == {"x-tenant": "a"}
+
+
+@pytest.mark.asyncio
+async def test_message_mode_stores_headers_on_the_user_message():
+    controller = FakeKAgentController()
+    session_service = KAgentSessionService(controller.client())
+    executor = A2aAgentExecutor(
+        runner=lambda: Runner(app_name=APP_NAME, agent=EchoAgent(name="echo"), session_service=session_service),
+        config=A2aAgentExecutorConfig(header_state_mode="message"),
+    )
+
+    await _execute(executor, _request_context("hi", {"x-tenant": "a"}))
+
+    stored = _stored_events(controller)
+    assert [e.author for e in stored] == ["user", "echo"]
+    assert stored[0].actions.state_delta == {"headers": {"x-tenant": "a"}}
+
+    # Same headers on the next turn: nothing to store again
+    await _execute(executor, _request_context("again", {"x-tenant": "a"}))
+    stored = _stored_events(controller)
+    assert [e.author for e in stored] == ["user", "echo", "user", "echo"]
+    assert not stored[2].actions.state_delta
+
+
+@pytest.mark.asyncio
+async def test_buffered_event_publishing_keeps_order():
+    controller = FakeKAgentController()
+    session_service = KAgentSessionService(controller.client())
+    executor = A2aAgentExecutor(
+        runner=lambda: Runner(app_name=APP_NAME, agent=EchoAgent(name="echo"), session_service=session_service),
+        config=A2aAgentExecutorConfig(event_buffer_size=4, event_backpressure="coalesce"),
+    )
+
+    events = await _execute(executor, _request_context("hi", {"x-tenant": "a"}))
+
+    states = [e.status.state for e in events if hasattr(e, "status")]
+    assert states == [TaskState.submitted, TaskState.working, TaskState.working, TaskState.completed]
+    assert events[-1].final
+
+
+@pytest.mark.asyncio
+async def test_partial_events_are_coalesced():
+    controller = FakeKAgentController()
+    session_service = KAgentSessionService(controller.client())
+    executor = A2aAgentExecutor(
+        runner=lambda: Runner(app_name=APP_NAME, agent=StreamingAgent(name="stream"), session_service=session_service),
+        config=A2aAgentExecutorConfig(partial_event_window=60),
+    )
+
+    events = await _execute(executor, _request_context("hi", {}))
+
+    texts = [e.status.message.parts[0].root.text for e in events if getattr(e, "status", None) and e.status.message]
+    # The submitted request, the first chunk right away, the merged rest and the full reply
+    assert texts == ["hi", "one ", "two three four", "one two three four"]
+    assert events[-1].status.state == TaskState.completed
+
+
+class RecordingEventQueue(EventQueue):
+    """Records when each event was enqueued."""
+
+    def __init__(self):
+        super().__init__()
+        self.enqueued_at: list[tuple[float, object]] = []
+
+    async def enqueue_event(self, event):
+        self.enqueued_at.append((time.monotonic(), event))
+        await super().enqueue_event(event)
+
+
+@pytest.mark.asyncio
+async def test_held_partial_text_is_published_while_the_model_stalls():
+    controller = FakeKAgentController()
+    agent = StreamingAgent(name="stream", stall=0.3)
+    executor = A2aAgentExecutor(
+        runner=lambda: Runner(
+            app_name=APP_NAME, agent=agent, session_service=KAgentSessionService(controller.client())
+        ),
+        config=A2aAgentExecutorConfig(partial_event_window=0.05),
+    )
+    queue = RecordingEventQueue()
+
+    await executor.execute(_request_context("hi", {}), queue)
+
+    published = {
+        e.status.message.parts[0].root.text: at
+        for at, e in queue.enqueued_at
+        if getattr(e, "status", None) and e.status.message
+    }
+    assert published["two three "] < agent.resumed_at[0]
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_the_running_execution():
+    controller = FakeKAgentController()
+    session_service = KAgentSessionService(controller.client())
+    executor = A2aAgentExecutor(
+        runner=lambda: Runner(app_name=APP_NAME, agent=SlowAgent(name="slow"), session_service=session_service),
+    )
+    context = _request_context("hi", {})
+    queue = EventQueue()
+    execution = asyncio.create_task(executor.execute(context, queue))
+    # Let the agent start
+    await asyncio.sleep(0.05)
+
+    await executor.cancel(context, EventQueue())
+    await asyncio.wait_for(execution, timeout=1)
+
+    events = []
+    while not queue.queue.empty():
+        events.append(await queue.dequeue_event())
+    assert events[-1].status.state == TaskState.canceled
+    assert events[-1].final
+
+
+@pytest.mark.asyncio
+async def test_shared_runner_serves_every_request():
+    controller = FakeKAgentController()
+    runner = Runner(
+        app_name=APP_NAME, agent=EchoAgent(name="echo"), session_service=KAgentSessionService(controller.client())
+    )
+    executor = A2aAgentExecutor(runner=runner)
+
+    first = await _execute(executor, _request_context("hi", {"x-tenant": "a"}))
+    second = await _execute(executor, _request_context("hi", {"x-tenant": "b"}))
+
+    assert json.loads(first[-2].artifact.parts[0].root.text) == {"x-tenant": "a"}
+    assert json.loads(second[-2].artifact.parts[0].root.text) == {"x-tenant": "b"}
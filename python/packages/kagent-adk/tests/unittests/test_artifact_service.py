@@ -0,0 +1,41 @@
+import pytest
+from google.genai import types
+
+from kagent.adk._artifact_service import BoundedArtifactService
+
+SCOPE = {"app_name": "app", "user_id": "user", "session_id": "session"}
+
+
+@pytest.mark.asyncio
+async def test_saves_versions_and_lists_session_and_user_artifacts():
+    service = BoundedArtifactService()
+
+    assert await service.save_artifact(**SCOPE, filename="report.txt", artifact=types.Part(text="v0")) == 0
+    assert await service.save_artifact(**SCOPE, filename="report.txt", artifact=types.Part(text="v1")) == 1
+    await service.save_artifact(**SCOPE, filename="user:profile", artifact=types.Part(text="me"))
+    await service.save_artifact(
+        app_name="app", user_id="user", session_id="other", filename="other.txt", artifact=types.Part(text="x")
+    )
+
+    assert (await service.load_artifact(**SCOPE, filename="report.txt")).text == "v1"
+    assert (await service.load_artifact(**SCOPE, filename="report.txt", version=0)).text == "v0"
+    assert await service.list_versions(**SCOPE, filename="report.txt") == [0, 1]
+    assert await service.list_artifact_keys(**SCOPE) == ["report.txt", "user:profile"]
+
+    await service.delete_artifact(**SCOPE, filename="report.txt")
+    assert await service.load_artifact(**SCOPE, filename="report.txt") is None
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_artifacts_over_the_size_limit():
+    service = BoundedArtifactService(max_bytes=10)
+    data = types.Part(inline_data=types.Blob(mime_type="application/octet-stream", data=b"x" * 4))
+
+    await service.save_artifact(**SCOPE, filename="a", artifact=data)
+    await service.save_artifact(**SCOPE, filename="b", artifact=data)
+    await service.load_artifact(**SCOPE, filename="a")
+    # A second version of b is over the limit together with a
+    await service.save_artifact(**SCOPE, filename="b", artifact=data)
+
+    assert await service.list_artifact_keys(**SCOPE) == ["b"]
+    assert await service.list_versions(**SCOPE, filename="b") == [0, 1]
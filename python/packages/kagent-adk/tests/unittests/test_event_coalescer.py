@@ -0,0 +1,99 @@
+from google.adk.events import Event
+from google.genai import types
+
+from kagent.adk._event_coalescer import PartialEventCoalescer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _chunk(text: str, partial: bool = True, thought: bool = False, author: str = "agent") -> Event:
+    return Event(
+        invocation_id="inv-1",
+        author=author,
+        partial=partial,
+        content=types.Content(role="model", parts=[types.Part(text=text, thought=thought or None)]),
+    )
+
+
+def _texts(events: list[Event]) -> list[str]:
+    return [e.content.parts[0].text for e in events]
+
+
+def test_first_delta_is_emitted_right_away():
+    coalescer = PartialEventCoalescer(window=60, max_bytes=1024, clock=FakeClock())
+
+    assert _texts(coalescer.add(_chunk("Hel"))) == ["Hel"]
+    assert coalescer.add(_chunk("lo")) == []
+
+
+def test_merges_deltas_until_the_window_passes():
+    clock = FakeClock()
+    coalescer = PartialEventCoalescer(window=0.1, max_bytes=1024, clock=clock)
+    coalescer.add(_chunk("Hel"))
+
+    assert coalescer.add(_chunk("lo")) == []
+    assert coalescer.add(_chunk(" wor")) == []
+    clock.now = 0.1
+    ready = coalescer.add(_chunk("ld"))
+
+    assert _texts(ready) == ["lo world"]
+    assert ready[0].partial
+    assert coalescer.flush() == []
+
+
+def test_held_text_is_released_when_due_without_a_new_event():
+    clock = FakeClock()
+    coalescer = PartialEventCoalescer(window=0.1, max_bytes=1024, clock=clock)
+    coalescer.add(_chunk("a"))
+    assert coalescer.due_in() is None
+
+    coalescer.add(_chunk("b"))
+    assert coalescer.due_in() == 0.1
+    assert coalescer.release_due() == []
+    clock.now = 0.1
+
+    assert coalescer.due_in() == 0.0
+    assert _texts(coalescer.release_due()) == ["b"]
+    assert coalescer.due_in() is None
+    # The response goes on: the next delta is held again
+    assert coalescer.add(_chunk("c")) == []
+
+
+def test_emits_when_max_bytes_is_reached():
+    coalescer = PartialEventCoalescer(window=60, max_bytes=4, clock=FakeClock())
+    coalescer.add(_chunk("a"))
+
+    assert coalescer.add(_chunk("bc")) == []
+    assert _texts(coalescer.add(_chunk("de"))) == ["bcde"]
+
+
+def test_other_events_release_held_text_first():
+    coalescer = PartialEventCoalescer(window=60, max_bytes=1024, clock=FakeClock())
+    coalescer.add(_chunk("a"))
+    coalescer.add(_chunk("b"))
+    coalescer.add(_chunk("c"))
+
+    final = _chunk("abc", partial=False)
+    ready = coalescer.add(final)
+
+    assert _texts(ready) == ["bc", "abc"]
+    assert ready[1] is final
+    # The next response starts over
+    assert _texts(coalescer.add(_chunk("d"))) == ["d"]
+
+
+def test_does_not_merge_thoughts_with_answers():
+    coalescer = PartialEventCoalescer(window=60, max_bytes=1024, clock=FakeClock())
+    coalescer.add(_chunk("thinking", thought=True))
+    coalescer.add(_chunk(" more", thought=True))
+
+    ready = coalescer.add(_chunk("answer"))
+
+    assert _texts(ready) == [" more", "answer"]
+    assert coalescer.flush() == []
@@ -0,0 +1,314 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from kagent.adk import KAgentSessionServiceConfig
+from kagent.adk._session_service import KAgentSessionService
+
+from .fake_controller import FakeKAgentController
+
+APP_NAME = "test_app"
+USER_ID = "test_user"
+
+
+def _text_event(text: str, invocation_id: str = "inv-1") -> Event:
+    return Event(
+        invocation_id=invocation_id,
+        author="agent",
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+    )
+
+
+async def _create_session(service: KAgentSessionService, session_id: str = "session-1"):
+    return await service.create_session(app_name=APP_NAME, user_id=USER_ID, session_id=session_id)
+
+
+@pytest.mark.asyncio
+async def test_append_event_posts_immediately_by_default():
+    controller = FakeKAgentController()
+    service = KAgentSessionService(controller.client())
+    session = await _create_session(service)
+
+    event = await service.append_event(session, _text_event("hello"))
+
+    assert controller.stored_event_ids(session.id) == [event.id]
+    assert service.pending_event_count() == 0
+    assert session.events == [event]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_buffers_until_flush():
+    controller = FakeKAgentController()
+    config = KAgentSessionServiceConfig(write_behind=True, write_behind_batch_size=100, write_behind_flush_interval=60)
+    service = KAgentSessionService(controller.client(), config)
+    session = await _create_session(service)
+
+    events = [await service.append_event(session, _text_event(f"chunk {i}")) for i in range(5)]
+
+    # The in-memory session is updated right away, the controller is not
+    assert len(session.events) == 5
+    assert controller.stored_event_ids(session.id) == []
+    assert service.pending_event_count(session.id) == 5
+
+    await service.flush(session.id)
+
+    assert controller.stored_event_ids(session.id) == [e.id for e in events]
+    assert len(controller.requests_to("POST", "/events/batch")) == 1
+    assert controller.requests_to("POST", "/events") == []
+    assert service.pending_event_count() == 0
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_on_batch_size_and_interval():
+    controller = FakeKAgentController()
+    config = KAgentSessionServiceConfig(write_behind=True, write_behind_batch_size=3, write_behind_flush_interval=0.01)
+    service = KAgentSessionService(controller.client(), config)
+    session = await _create_session(service)
+
+    events = [await service.append_event(session, _text_event(f"chunk {i}")) for i in range(3)]
+    # Batch size reached: flushed in the background
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert controller.stored_event_ids(session.id) == [e.id for e in events]
+
+    last = await service.append_event(session, _text_event("tail"))
+    # Below the batch size: flushed once the interval expires
+    await asyncio.sleep(0.05)
+    assert controller.stored_event_ids(session.id) == [e.id for e in events] + [last.id]
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_drops_buffers_emptied_by_an_earlier_flush():
+    controller = FakeKAgentController()
+    config = KAgentSessionServiceConfig(write_behind=True, write_behind_batch_size=3, write_behind_flush_interval=0.01)
+    service = KAgentSessionService(controller.client(), config)
+    session = await _create_session(service)
+
+    # The batch flush empties the buffer while the interval flush is still pending
+    for i in range(3):
+        await service.append_event(session, _text_event(f"chunk {i}"))
+    await asyncio.sleep(0.05)
+
+    assert service.pending_event_count() == 0
+    assert session.id not in service._write_buffers
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_falls_back_to_single_writes_and_keeps_order():
+    controller = FakeKAgentController(batch_events=False)
+    config = KAgentSessionServiceConfig(write_behind=True, write_behind_batch_size=100, write_behind_flush_interval=60)
+    service = KAgentSessionService(controller.client(), config)
+    session_a = await _create_session(service, "session-a")
+    session_b = await _create_session(service, "session-b")
+
+    a_events = []
+    b_events = []
+    for i in range(3):
+        a_events.append(await service.append_event(session_a, _text_event(f"a{i}")))
+        b_events.append(await service.append_event(session_b, _text_event(f"b{i}")))
+
+    await service.close()
+
+    assert controller.stored_event_ids("session-a") == [e.id for e in a_events]
+    assert controller.stored_event_ids("session-b") == [e.id for e in b_events]
+    # Only the first batch attempt hits the missing endpoint
+    assert len(controller.requests_to("POST", "/events/batch")) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_session_sees_buffered_events():
+    controller = FakeKAgentController()
+    config = KAgentSessionServiceConfig(write_behind=True, write_behind_batch_size=100, write_behind_flush_interval=60)
+    service = KAgentSessionService(controller.client(), config)
+    session = await _create_session(service)
+
+    await service.append_event(
+        session,
+        Event(invocation_id="inv-1", author="system", actions=EventActions(state_delta={"headers": {"a": "b"}})),
+    )
+
+    loaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+    assert loaded is not None
+    assert loaded.state["headers"] == {"a": "b"}
+    assert service.pending_event_count() == 0
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_get_session_replays_events_in_order_once():
+    controller = FakeKAgentController()
+    service = KAgentSessionService(controller.client())
+    session = await _create_session(service)
+
+    for value in ("first", "second"):
+        await service.append_event(
+            session,
+            Event(invocation_id="inv-1", author="agent", actions=EventActions(state_delta={"value": value})),
+        )
+
+    loaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+    assert [e.id for e in loaded.events] == [e.id for e in session.events]
+    assert loaded.state["value"] == "second"
+
+
+@pytest.mark.asyncio
+async def test_incremental_load_fetches_only_new_events():
+    controller = FakeKAgentController()
+    service = KAgentSessionService(controller.client(), KAgentSessionServiceConfig(incremental_load=True))
+    session = await _create_session(service)
+    await service.append_event(session, _text_event("hello"))
+
+    loaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    assert len(loaded.events) == 1
+    assert "after" not in controller.requests[-1].url.params
+
+    # Written through the loaded session by this process
+    own = await service.append_event(loaded, _text_event("own"))
+    # Written by someone else, e.g. another replica
+    other = await KAgentSessionService(controller.client()).append_event(
+        session, Event(invocation_id="inv-2", author="agent", actions=EventActions(state_delta={"k": "v"}))
+    )
+
+    reloaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+    assert "after" in controller.requests[-1].url.params
+    assert [e.id for e in reloaded.events][1:] == [own.id, other.id]
+    assert reloaded.state["k"] == "v"
+
+    # Nothing new: nothing to merge
+    again = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    assert [e.id for e in again.events] == [e.id for e in reloaded.events]
+
+
+@pytest.mark.asyncio
+async def test_incremental_load_keeps_events_sharing_the_cursor_timestamp():
+    controller = FakeKAgentController()
+    controller.tick = timedelta(0)
+    service = KAgentSessionService(controller.client(), KAgentSessionServiceConfig(incremental_load=True))
+    session = await _create_session(service)
+    await service.append_event(session, _text_event("first"))
+    await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+    # Stored by another replica with the same created_at as the cursor
+    other = await KAgentSessionService(controller.client()).append_event(session, _text_event("second"))
+    reloaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+    assert [e.id for e in reloaded.events] == [e.id for e in session.events]
+    assert reloaded.events[-1].id == other.id
+
+
+@pytest.mark.asyncio
+async def test_incremental_load_orders_merged_events_like_a_full_reload():
+    controller = FakeKAgentController()
+    config = KAgentSessionServiceConfig(incremental_load=True, write_behind=True, write_behind_flush_interval=60)
+    service = KAgentSessionService(controller.client(), config)
+    session = await _create_session(service)
+    await service.append_event(session, _text_event("hello"))
+    loaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+    # Our event is buffered, so another replica's event reaches the controller first
+    own = await service.append_event(
+        loaded, Event(invocation_id="inv-1", author="agent", actions=EventActions(state_delta={"k": "own"}))
+    )
+    other = await KAgentSessionService(controller.client()).append_event(
+        session, Event(invocation_id="inv-2", author="agent", actions=EventActions(state_delta={"k": "other"}))
+    )
+    reloaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    full = await KAgentSessionService(controller.client()).get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+    )
+
+    assert [e.id for e in reloaded.events][1:] == [other.id, own.id]
+    assert [e.id for e in reloaded.events] == [e.id for e in full.events]
+    assert reloaded.state == full.state == {"k": "own"}
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_incremental_load_cache_invalidation():
+    controller = FakeKAgentController()
+    service = KAgentSessionService(controller.client(), KAgentSessionServiceConfig(incremental_load=True))
+    session = await _create_session(service)
+    await service.append_event(session, _text_event("hello"))
+
+    loaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    service.invalidate_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    reloaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    assert reloaded is not loaded
+    assert "after" not in controller.requests[-1].url.params
+
+    await service.delete_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    assert await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id) is None
+
+
+@pytest.mark.asyncio
+async def test_session_cache_serves_copies_without_controller_round_trip():
+    controller = FakeKAgentController()
+    service = KAgentSessionService(controller.client(), KAgentSessionServiceConfig(session_cache=True))
+    session = await _create_session(service)
+    await service.append_event(
+        session, Event(invocation_id="inv-1", author="agent", actions=EventActions(state_delta={"headers": {"a": "b"}}))
+    )
+
+    first = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    reads = len(controller.requests_to("GET", f"/api/sessions/{session.id}"))
+
+    # Changes to a handed out copy do not leak into the cache
+    first.state["headers"]["a"] = "changed"
+    first.events.clear()
+
+    second = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    assert second is not first
+    assert second.state["headers"] == {"a": "b"}
+    assert len(second.events) == 1
+
+    # Appending through a fresh copy keeps the cached snapshot current
+    appended = await service.append_event(second, _text_event("hello"))
+    third = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    assert [e.id for e in third.events][-1] == appended.id
+
+    assert len(controller.requests_to("GET", f"/api/sessions/{session.id}")) == reads
+    stats = service.session_cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_session_cache_reloads_after_unreconciled_append():
+    controller = FakeKAgentController()
+    service = KAgentSessionService(controller.client(), KAgentSessionServiceConfig(session_cache=True))
+    session = await _create_session(service)
+
+    stale = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    fresh = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    await service.append_event(fresh, _text_event("one"))
+    # The stale copy missed "one", so the cache can't be patched and is dropped
+    await service.append_event(stale, _text_event("two"))
+
+    reloaded = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+    assert [e.id for e in reloaded.events] == controller.stored_event_ids(session.id)
+
+
+@pytest.mark.asyncio
+async def test_session_cache_is_bounded():
+    controller = FakeKAgentController()
+    config = KAgentSessionServiceConfig(session_cache=True, session_cache_max_entries=2)
+    service = KAgentSessionService(controller.client(), config)
+    for session_id in ("s1", "s2", "s3"):
+        await _create_session(service, session_id)
+        await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session_id)
+
+    stats = service.session_cache_stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+
+    # The least recently used session was evicted and is loaded again
+    await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id="s1")
+    assert service.session_cache_stats().misses == 4
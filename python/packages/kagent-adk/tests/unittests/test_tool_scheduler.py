@@ -0,0 +1,122 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.apps import App
+from google.adk.models import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from kagent.adk import ToolSchedulerConfig, ToolSchedulerPlugin
+
+
+class ToolCallingLlm(BaseLlm):
+    """Calls the given tools in one response, then answers with the results."""
+
+    calls: list[tuple[str, dict]]
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        last = llm_request.contents[-1]
+        if any(part.function_response for part in last.parts):
+            results = [part.function_response.response for part in last.parts]
+            yield LlmResponse(content=types.ModelContent(parts=[types.Part(text=str(results))]))
+            return
+        parts = [
+            types.Part(function_call=types.FunctionCall(id=f"call_{i}", name=name, args=args))
+            for i, (name, args) in enumerate(self.calls)
+        ]
+        yield LlmResponse(content=types.ModelContent(parts=parts))
+
+
+class Tracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.order: list[str] = []
+
+    async def run(self, label: str, seconds: float) -> str:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.order.append(f"start {label}")
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.running -= 1
+        self.order.append(f"end {label}")
+        return label
+
+
+async def _run(agent: LlmAgent, config: ToolSchedulerConfig) -> list[types.FunctionResponse]:
+    app = App(name="app", root_agent=agent, plugins=[ToolSchedulerPlugin(config)])
+    runner = Runner(app=app, session_service=InMemorySessionService())
+    session = await runner.session_service.create_session(app_name="app", user_id="user")
+    responses = []
+    async for event in runner.run_async(
+        user_id="user", session_id=session.id, new_message=types.UserContent(parts=[types.Part(text="go")])
+    ):
+        responses.extend(event.get_function_responses())
+    return responses
+
+
+@pytest.mark.asyncio
+async def test_per_tool_limit_bounds_concurrent_calls():
+    tracker = Tracker()
+
+    async def lookup(key: str) -> str:
+        return await tracker.run(key, 0.02)
+
+    llm = ToolCallingLlm(model="fake", calls=[("lookup", {"key": k}) for k in "abcd"])
+    config = ToolSchedulerConfig(tool_concurrency={"lookup": 2})
+
+    responses = await _run(LlmAgent(name="agent", model=llm, tools=[lookup]), config)
+
+    assert tracker.max_running == 2
+    # Results keep the order of the calls
+    assert [r.response["result"] for r in responses] == ["a", "b", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_time_out_with_an_error_result():
+    async def slow() -> str:
+        await asyncio.sleep(10)
+        return "done"
+
+    async def fast() -> str:
+        return "done"
+
+    llm = ToolCallingLlm(model="fake", calls=[("slow", {}), ("fast", {})])
+    config = ToolSchedulerConfig(tool_timeouts={"slow": 0.02})
+
+    responses = await _run(LlmAgent(name="agent", model=llm, tools=[slow, fast]), config)
+
+    assert responses[0].response == {"error": "Tool call timed out after 0.02s"}
+    assert responses[1].response == {"result": "done"}
+
+
+@pytest.mark.asyncio
+async def test_side_effecting_calls_run_one_at_a_time_in_order():
+    tracker = Tracker()
+
+    async def write(path: str) -> str:
+        return await tracker.run(f"write {path}", 0.02)
+
+    async def read(path: str) -> str:
+        return await tracker.run(f"read {path}", 0.01)
+
+    llm = ToolCallingLlm(
+        model="fake", calls=[("write", {"path": "a"}), ("read", {"path": "b"}), ("write", {"path": "c"})]
+    )
+    config = ToolSchedulerConfig(side_effecting_tools=["write"])
+
+    await _run(LlmAgent(name="agent", model=llm, tools=[write, read]), config)
+
+    writes = [step for step in tracker.order if "write" in step]
+    assert writes == ["start write a", "end write a", "start write c", "end write c"]
+    # Other tools still run alongside the serialized calls
+    assert tracker.order.index("start read b") < tracker.order.index("end write a")
@@ -1,4 +1,14 @@
+from ._cache import BoundedCache, CacheStats
 from ._config import KAgentConfig
+from ._http import HttpClientConfig, create_http_client, create_sync_http_client
 from .tracing import configure as configure_tracing
 
-__all__ = ["KAgentConfig", "configure_tracing"]
+__all__ = [
+    "BoundedCache",
+    "CacheStats",
+    "HttpClientConfig",
+    "KAgentConfig",
+    "configure_tracing",
+    "create_http_client",
+    "create_sync_http_client",
+]
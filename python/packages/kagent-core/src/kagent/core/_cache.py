@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from opentelemetry import metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+meter = metrics.get_meter("kagent.core")
+cache_hits_counter = meter.create_counter(
+    "kagent.cache.hits", description="Number of cache lookups that found an entry"
+)
+cache_misses_counter = meter.create_counter(
+    "kagent.cache.misses", description="Number of cache lookups that found no live entry"
+)
+cache_evictions_counter = meter.create_counter(
+    "kagent.cache.evictions", description="Number of cache entries evicted for size, memory or age"
+)
+
+
+@dataclass
+class CacheStats:
+    """Point-in-time counters of a BoundedCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class _CacheEntry(Generic[V]):
+    value: V
+    size: int
+    expires_at: Optional[float]
+
+
+class BoundedCache(Generic[K, V]):
+    """An in-process LRU cache bounded by entry count, age and approximate memory.
+
+    Lookups refresh an entry's recency but not its expiry. When a limit is
+    exceeded the least recently used entries are evicted first.
+
+    Args:
+        name: Name reported as the ``cache`` attribute on the cache metrics.
+        max_entries: Maximum number of entries kept. Unbounded if None.
+        ttl: Seconds an entry stays valid after it is set. Never expires if None.
+        max_bytes: Maximum total size of the entries as reported by ``sizeof``. Unbounded if None.
+        sizeof: Returns the approximate size in bytes of a value. Required for ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None,
+    ):
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("sizeof is required when max_bytes is set")
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[K, _CacheEntry[V]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._attributes = {"cache": name}
+
+    def get(self, key: K) -> Optional[V]:
+        """Returns the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._record_eviction()
+                entry = None
+            if entry is None:
+                self._misses += 1
+                cache_misses_counter.add(1, self._attributes)
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            cache_hits_counter.add(1, self._attributes)
+            return entry.value
+
+    def peek(self, key: K) -> Optional[V]:
+        """Like get, but without refreshing recency or counting a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry.expires_at is not None and entry.expires_at <= time.monotonic()):
+                return None
+            return entry.value
+
+    def set(self, key: K, value: V) -> None:
+        """Add or replace the value for key and evict entries over the limits."""
+        size = self._sizeof(value) if self._sizeof else 0
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _CacheEntry(value=value, size=size, expires_at=expires_at)
+            self._bytes += size
+            self._evict()
+
+    def resize(self, key: K) -> None:
+        """Re-measure the value for key after it was modified in place."""
+        if self._sizeof is None:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            size = self._sizeof(entry.value)
+            self._bytes += size - entry.size
+            entry.size = size
+            self._evict()
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove key from the cache, returning its value if it was cached."""
+        with self._lock:
+            entry = self._remove(key)
+            return entry.value if entry is not None else None
+
+    def keys(self) -> list[K]:
+        """The keys of the live entries, least recently used first."""
+        now = time.monotonic()
+        with self._lock:
+            return [key for key, entry in self._entries.items() if entry.expires_at is None or entry.expires_at > now]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: K) -> Optional[_CacheEntry[V]]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._record_eviction()
+
+    def _record_eviction(self) -> None:
+        self._evictions += 1
+        cache_evictions_counter.add(1, self._attributes)
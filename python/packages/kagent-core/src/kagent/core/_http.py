@@ -0,0 +1,218 @@
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+import weakref
+from typing import Any, Iterable, Optional
+
+import httpx
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Methods that can be resent after the controller answered without side effects
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+_RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+# Pools of the clients created by this module, observed by the pool gauges
+_pools: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _track_pool(transport: Any) -> None:
+    # The connection pool is private to httpx, so the gauges are only fed when it is there
+    pool = getattr(transport, "_pool", None)
+    if pool is not None and hasattr(pool, "connections"):
+        _pools.add(pool)
+
+
+def _observe_pool_connections(options: CallbackOptions) -> Iterable[Observation]:
+    active = idle = 0
+    for pool in list(_pools):
+        for connection in pool.connections:
+            if connection.is_idle():
+                idle += 1
+            else:
+                active += 1
+    return [Observation(active, {"state": "active"}), Observation(idle, {"state": "idle"})]
+
+
+meter = metrics.get_meter("kagent.core")
+meter.create_observable_gauge(
+    "kagent.http.pool.connections",
+    callbacks=[_observe_pool_connections],
+    description="Number of open connections in the kagent controller client pools, by state",
+)
+active_requests_counter = meter.create_up_down_counter(
+    "kagent.http.requests.active",
+    description="Number of requests to the kagent controller in flight",
+)
+retries_counter = meter.create_counter(
+    "kagent.http.retries",
+    description="Number of requests to the kagent controller that were retried",
+)
+
+
+class HttpClientConfig(BaseModel):
+    """Connection pool, timeout and retry settings of clients talking to the kagent controller."""
+
+    # Maximum number of concurrent connections per client
+    max_connections: int = 100
+
+    # Maximum number of idle connections kept alive per client
+    max_keepalive_connections: int = 20
+
+    # Seconds an idle connection is kept alive
+    keepalive_expiry: float = 30.0
+
+    # Seconds to wait for a connection to be established
+    connect_timeout: float = 5.0
+
+    # Seconds to wait for reads, writes and a free pooled connection
+    timeout: float = 5.0
+
+    # Use HTTP/2 if the h2 package is installed (httpx[http2])
+    http2: bool = False
+
+    # How often a failed request is retried. Connection failures are retried for every
+    # method, 502/503/504 responses and broken connections only for idempotent ones.
+    retries: int = 2
+
+    # Base and maximum delay in seconds of the exponential backoff with full jitter
+    retry_backoff: float = 0.1
+    retry_max_backoff: float = 2.0
+
+
+def _backoff(config: HttpClientConfig, attempt: int) -> float:
+    return random.uniform(0, min(config.retry_max_backoff, config.retry_backoff * 2**attempt))
+
+
+def _should_retry(request: httpx.Request, error: Optional[Exception], response: Optional[httpx.Response]) -> bool:
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        # The request never reached the controller
+        return True
+    if request.method not in _IDEMPOTENT_METHODS:
+        return False
+    if error is not None:
+        return isinstance(error, (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError))
+    return response is not None and response.status_code in _RETRYABLE_STATUS_CODES
+
+
+class _RetryingAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncHTTPTransport, config: HttpClientConfig):
+        self._transport = transport
+        self._config = config
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        active_requests_counter.add(1)
+        try:
+            for attempt in range(self._config.retries + 1):
+                last_attempt = attempt == self._config.retries
+                try:
+                    response = await self._transport.handle_async_request(request)
+                except httpx.TransportError as e:
+                    if last_attempt or not _should_retry(request, e, None):
+                        raise
+                    logger.debug("Retrying %s %s after %s", request.method, request.url, e)
+                else:
+                    if last_attempt or not _should_retry(request, None, response):
+                        return response
+                    await response.aclose()
+                    logger.debug("Retrying %s %s after status %d", request.method, request.url, response.status_code)
+                retries_counter.add(1, {"method": request.method})
+                await asyncio.sleep(_backoff(self._config, attempt))
+            raise AssertionError("unreachable")
+        finally:
+            active_requests_counter.add(-1)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _RetryingTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.HTTPTransport, config: HttpClientConfig):
+        self._transport = transport
+        self._config = config
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        active_requests_counter.add(1)
+        try:
+            for attempt in range(self._config.retries + 1):
+                last_attempt = attempt == self._config.retries
+                try:
+                    response = self._transport.handle_request(request)
+                except httpx.TransportError as e:
+                    if last_attempt or not _should_retry(request, e, None):
+                        raise
+                    logger.debug("Retrying %s %s after %s", request.method, request.url, e)
+                else:
+                    if last_attempt or not _should_retry(request, None, response):
+                        return response
+                    response.close()
+                    logger.debug("Retrying %s %s after status %d", request.method, request.url, response.status_code)
+                retries_counter.add(1, {"method": request.method})
+                time.sleep(_backoff(self._config, attempt))
+            raise AssertionError("unreachable")
+        finally:
+            active_requests_counter.add(-1)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+def _http2_enabled(config: HttpClientConfig) -> bool:
+    if config.http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+        return False
+    return config.http2
+
+
+def _client_options(config: HttpClientConfig) -> dict[str, Any]:
+    return {
+        "limits": httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        "http2": _http2_enabled(config),
+    }
+
+
+def create_http_client(base_url: str, config: Optional[HttpClientConfig] = None, **kwargs: Any) -> httpx.AsyncClient:
+    """Create a pooled async client for the kagent controller.
+
+    Args:
+        base_url: URL of the kagent controller.
+        config: Pool, timeout and retry settings. Defaults are used if None.
+        **kwargs: Passed on to httpx.AsyncClient, e.g. event_hooks or headers.
+    """
+    config = config or HttpClientConfig()
+    transport = httpx.AsyncHTTPTransport(**_client_options(config))
+    _track_pool(transport)
+    return httpx.AsyncClient(
+        base_url=base_url,
+        transport=_RetryingAsyncTransport(transport, config),
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        **kwargs,
+    )
+
+
+def create_sync_http_client(base_url: str, config: Optional[HttpClientConfig] = None, **kwargs: Any) -> httpx.Client:
+    """Create a pooled blocking client for the kagent controller.
+
+    Args:
+        base_url: URL of the kagent controller.
+        config: Pool, timeout and retry settings. Defaults are used if None.
+        **kwargs: Passed on to httpx.Client, e.g. event_hooks or headers.
+    """
+    config = config or HttpClientConfig()
+    transport = httpx.HTTPTransport(**_client_options(config))
+    _track_pool(transport)
+    return httpx.Client(
+        base_url=base_url,
+        transport=_RetryingTransport(transport, config),
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        **kwargs,
+    )
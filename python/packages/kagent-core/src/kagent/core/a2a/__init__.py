@@ -1,3 +1,5 @@
+from ._admission import AdmissionController, AdmissionControllerConfig
+from ._cancellation import TaskCancellationRegistry
 from ._consts import (
     A2A_DATA_PART_METADATA_IS_LONG_RUNNING_KEY,
     A2A_DATA_PART_METADATA_TYPE_CODE_EXECUTION_RESULT,
@@ -14,6 +16,7 @@ from ._consts import (
     KAGENT_HITL_RESUME_KEYWORDS_DENY,
     get_kagent_metadata_key,
 )
+from ._event_publisher import BackpressurePolicy, EventPublisher
 from ._hitl import (
     DecisionType,
     ToolApprovalRequest,
@@ -25,11 +28,15 @@ from ._hitl import (
 )
 from ._requests import KAgentRequestContextBuilder
 from ._task_result_aggregator import TaskResultAggregator
-from ._task_store import KAgentTaskStore
+from ._task_store import KAgentTaskStore, KAgentTaskStoreConfig
 
 __all__ = [
+    "AdmissionController",
+    "AdmissionControllerConfig",
     "KAgentRequestContextBuilder",
     "KAgentTaskStore",
+    "KAgentTaskStoreConfig",
+    "TaskCancellationRegistry",
     "get_kagent_metadata_key",
     "A2A_DATA_PART_METADATA_TYPE_KEY",
     "A2A_DATA_PART_METADATA_IS_LONG_RUNNING_KEY",
@@ -38,6 +45,8 @@ __all__ = [
     "A2A_DATA_PART_METADATA_TYPE_CODE_EXECUTION_RESULT",
     "A2A_DATA_PART_METADATA_TYPE_EXECUTABLE_CODE",
     "TaskResultAggregator",
+    "EventPublisher",
+    "BackpressurePolicy",
     # HITL constants
     "KAGENT_HITL_INTERRUPT_TYPE_TOOL_APPROVAL",
     "KAGENT_HITL_DECISION_TYPE_KEY",
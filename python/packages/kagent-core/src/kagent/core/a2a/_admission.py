@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Optional
+
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.agent_execution.context import RequestContext
+from a2a.server.events import EventQueue
+from a2a.types import Message, Part, Role, TaskState, TaskStatus, TaskStatusUpdateEvent, TextPart
+from opentelemetry import metrics
+from pydantic import BaseModel
+
+from ._cancellation import TaskCancellationRegistry
+from ._consts import get_kagent_metadata_key
+
+logger = logging.getLogger(__name__)
+
+meter = metrics.get_meter("kagent.core")
+active_requests_counter = meter.create_up_down_counter(
+    "kagent.a2a.admission.active",
+    description="Number of A2A requests admitted and executing",
+)
+queued_requests_counter = meter.create_up_down_counter(
+    "kagent.a2a.admission.queued",
+    description="Number of A2A requests waiting for an execution slot",
+)
+wait_time_histogram = meter.create_histogram(
+    "kagent.a2a.admission.wait_time",
+    unit="s",
+    description="Time A2A requests waited for an execution slot",
+)
+rejected_requests_counter = meter.create_counter(
+    "kagent.a2a.admission.rejected",
+    description="Number of A2A requests rejected because the agent was overloaded, by reason",
+)
+
+
+class AdmissionControllerConfig(BaseModel):
+    """Limits on the A2A requests an agent executes at once."""
+
+    # Maximum number of requests executed at once. 0 disables admission control.
+    max_concurrency: int = 0
+
+    # Maximum number of requests of one user executed at once. 0 means no per-user limit.
+    max_concurrency_per_user: int = 0
+
+    # Maximum number of requests waiting for a slot. Further requests are rejected right away.
+    max_queue_size: int = 100
+
+    # Seconds a request waits for a slot before it is rejected
+    queue_timeout: float = 30.0
+
+
+def _user_id(context: RequestContext) -> str:
+    # Set from the x-user-id header by KAgentRequestContextBuilder
+    call_context = context.call_context
+    if call_context is None or call_context.user is None:
+        return ""
+    return call_context.user.user_name
+
+
+def _rejected_event(context: RequestContext, reason: str) -> TaskStatusUpdateEvent:
+    return TaskStatusUpdateEvent(
+        task_id=context.task_id,
+        status=TaskStatus(
+            state=TaskState.rejected,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            message=Message(
+                message_id=str(uuid.uuid4()),
+                role=Role.agent,
+                parts=[Part(TextPart(text="The agent is handling too many requests, please retry later."))],
+                metadata={
+                    get_kagent_metadata_key("error_type"): "overloaded",
+                    get_kagent_metadata_key("error_detail"): reason,
+                },
+            ),
+        ),
+        context_id=context.context_id,
+        final=True,
+    )
+
+
+class AdmissionController(AgentExecutor):
+    """Wraps an AgentExecutor and bounds how many requests it executes at once.
+
+    Requests beyond max_concurrency wait in a bounded queue. Free slots go to the
+    waiting users in turn, so one user sending a burst of requests does not hold
+    back everybody else. A request that finds the queue full, or is still waiting
+    after queue_timeout, ends right away with a rejected status.
+
+    Args:
+        executor: The executor running the admitted requests.
+        config: The limits. Admission control is disabled if None.
+    """
+
+    def __init__(self, executor: AgentExecutor, config: Optional[AdmissionControllerConfig] = None):
+        self._executor = executor
+        self._config = config or AdmissionControllerConfig()
+        self._active = 0
+        self._active_per_user: Counter[str] = Counter()
+        # Waiting requests per user, users in the order they get the next free slot
+        self._waiting: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+        self._queued = 0
+        # Requests still waiting for a slot
+        self._cancellations = TaskCancellationRegistry()
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        if self._config.max_concurrency <= 0:
+            await self._executor.execute(context, event_queue)
+            return
+
+        user_id = _user_id(context)
+        rejection: Optional[str] = None
+        admitted = False
+        async with self._cancellations.track(context.task_id, context.context_id, event_queue):
+            rejection = await self._acquire(user_id)
+            admitted = rejection is None
+
+        if rejection is not None:
+            logger.warning("Rejected task %s of user %r: %s", context.task_id, user_id, rejection)
+            rejected_requests_counter.add(1, {"reason": rejection})
+            await event_queue.enqueue_event(_rejected_event(context, rejection))
+            return
+        if not admitted:
+            # Canceled while waiting, the canceled status is already published
+            return
+
+        try:
+            await self._executor.execute(context, event_queue)
+        finally:
+            self._release(user_id)
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        if self._cancellations.is_running(context.task_id):
+            await self._cancellations.cancel(context.task_id, context.context_id, event_queue)
+        else:
+            await self._executor.cancel(context, event_queue)
+
+    def _can_run(self, user_id: str) -> bool:
+        if self._active >= self._config.max_concurrency:
+            return False
+        per_user = self._config.max_concurrency_per_user
+        return per_user <= 0 or self._active_per_user[user_id] < per_user
+
+    def _admit(self, user_id: str) -> None:
+        self._active += 1
+        self._active_per_user[user_id] += 1
+        active_requests_counter.add(1)
+
+    async def _acquire(self, user_id: str) -> Optional[str]:
+        """Wait for an execution slot, returning the reason if the request is rejected."""
+        # Slots are handed to waiting requests as soon as they are released, so a
+        # free slot means no waiting request can use it
+        if self._can_run(user_id):
+            self._admit(user_id)
+            wait_time_histogram.record(0)
+            return None
+        if self._queued >= self._config.max_queue_size:
+            return "queue_full"
+
+        slot: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(user_id, deque()).append(slot)
+        self._queued += 1
+        queued_requests_counter.add(1)
+        started_at = time.monotonic()
+        try:
+            async with asyncio.timeout(self._config.queue_timeout):
+                await asyncio.shield(slot)
+        except TimeoutError:
+            if not slot.done():
+                return "queue_timeout"
+        except asyncio.CancelledError:
+            if slot.done():
+                # The slot was handed over at the same time
+                self._release(user_id)
+            raise
+        finally:
+            if not slot.done():
+                slot.cancel()
+                self._remove_waiter(user_id, slot)
+            wait_time_histogram.record(time.monotonic() - started_at)
+        return None
+
+    def _remove_waiter(self, user_id: str, slot: asyncio.Future[None]) -> None:
+        waiters = self._waiting.get(user_id)
+        if waiters is None or slot not in waiters:
+            return
+        waiters.remove(slot)
+        if not waiters:
+            del self._waiting[user_id]
+        self._queued -= 1
+        queued_requests_counter.add(-1)
+
+    def _release(self, user_id: str) -> None:
+        self._active -= 1
+        self._active_per_user[user_id] -= 1
+        if not self._active_per_user[user_id]:
+            del self._active_per_user[user_id]
+        active_requests_counter.add(-1)
+
+        # Hand the free slots to the next users in turn
+        while self._active < self._config.max_concurrency:
+            next_user = next((user for user in self._waiting if self._can_run(user)), None)
+            if next_user is None:
+                return
+            waiters = self._waiting[next_user]
+            slot = waiters.popleft()
+            self._queued -= 1
+            queued_requests_counter.add(-1)
+            if waiters:
+                self._waiting.move_to_end(next_user)
+            else:
+                del self._waiting[next_user]
+            self._admit(next_user)
+            slot.set_result(None)
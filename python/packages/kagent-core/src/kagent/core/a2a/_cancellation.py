@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+from a2a.server.events import EventQueue
+from a2a.types import TaskState, TaskStatus, TaskStatusUpdateEvent
+from opentelemetry import metrics
+
+logger = logging.getLogger(__name__)
+
+meter = metrics.get_meter("kagent.core")
+canceled_tasks_counter = meter.create_counter(
+    "kagent.a2a.tasks.canceled",
+    description="Number of running A2A task executions that were canceled",
+)
+
+
+def _canceled_event(task_id: str, context_id: str) -> TaskStatusUpdateEvent:
+    return TaskStatusUpdateEvent(
+        task_id=task_id,
+        status=TaskStatus(
+            state=TaskState.canceled,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        ),
+        context_id=context_id,
+        final=True,
+    )
+
+
+class TaskCancellationRegistry:
+    """Tracks the asyncio task running each A2A task, so that it can be canceled.
+
+    Executors run each request inside ``track``. ``cancel`` cancels the tracked
+    asyncio task, which raises asyncio.CancelledError wherever the agent is waiting
+    (model calls, MCP calls, subprocesses), waits for it to clean up and ends the
+    task with a final canceled status. Cancellations that were not requested
+    through the registry, e.g. on shutdown, are passed on unchanged.
+
+    Args:
+        cancel_timeout: Seconds cancel waits for the execution to stop.
+    """
+
+    def __init__(self, cancel_timeout: float = 10.0):
+        self._cancel_timeout = cancel_timeout
+        self._running: dict[str, asyncio.Task] = {}
+        self._cancel_requested: set[str] = set()
+
+    def is_running(self, task_id: str) -> bool:
+        """Whether an execution of the task is running in this process."""
+        return task_id in self._running
+
+    @asynccontextmanager
+    async def track(self, task_id: str, context_id: str, event_queue: EventQueue) -> AsyncIterator[None]:
+        """Run an execution of a task so it can be canceled.
+
+        A cancellation requested through ``cancel`` ends the block early and
+        publishes the final canceled status to the execution's event queue.
+        """
+        task = asyncio.current_task()
+        if task is None:
+            raise RuntimeError("Executions must run in an asyncio task to be cancelable")
+        if task_id in self._running:
+            logger.warning("Task %s is already running, only the latest execution can be canceled", task_id)
+        self._running[task_id] = task
+        try:
+            yield
+        except asyncio.CancelledError:
+            if task_id not in self._cancel_requested:
+                raise
+            # The cancellation was handled, the caller's task carries on normally
+            task.uncancel()
+            await event_queue.enqueue_event(_canceled_event(task_id, context_id))
+        finally:
+            if self._running.get(task_id) is task:
+                del self._running[task_id]
+                self._cancel_requested.discard(task_id)
+
+    async def cancel(self, task_id: str, context_id: str, event_queue: EventQueue) -> bool:
+        """Cancel the running execution of a task and wait for it to stop.
+
+        If the task is not running in this process, or its execution does not
+        stop in time, the canceled status is published to event_queue instead,
+        so that the cancel request gets its final event.
+
+        Returns:
+            True if a running execution was canceled, False otherwise.
+        """
+        task = self._running.get(task_id)
+        if task is None or task.done():
+            await event_queue.enqueue_event(_canceled_event(task_id, context_id))
+            return False
+
+        logger.info("Canceling execution of task %s", task_id)
+        self._cancel_requested.add(task_id)
+        task.cancel()
+        canceled_tasks_counter.add(1)
+        done, _ = await asyncio.wait({task}, timeout=self._cancel_timeout)
+        if not done:
+            logger.warning(
+                "Execution of task %s did not stop within %ss of being canceled", task_id, self._cancel_timeout
+            )
+            await event_queue.enqueue_event(_canceled_event(task_id, context_id))
+        return True
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from a2a.server.events import Event, EventQueue
+from a2a.types import Part, TaskStatusUpdateEvent, TextPart
+from opentelemetry import metrics
+
+logger = logging.getLogger(__name__)
+
+meter = metrics.get_meter("kagent.core")
+pending_events_counter = meter.create_up_down_counter(
+    "kagent.a2a.events.pending",
+    description="Number of A2A events produced by the agent and not yet handed to the event queue",
+)
+coalesced_events_counter = meter.create_counter(
+    "kagent.a2a.events.coalesced",
+    description="Number of partial A2A events merged into a pending event because the publish buffer was full",
+)
+dropped_events_counter = meter.create_counter(
+    "kagent.a2a.events.dropped",
+    description="Number of intermediate A2A events dropped because the publish buffer was full",
+)
+
+BackpressurePolicy = Literal["block", "coalesce", "drop"]
+
+
+@dataclass
+class _PendingEvent:
+    event: Event
+    intermediate: bool
+
+
+class EventPublisher:
+    """A bounded pipeline between an agent run and an A2A event queue.
+
+    Events are handed to the event queue in order by a background task, so a slow
+    consumer of the queue (task persistence, SSE clients) does not hold up the agent
+    until the buffer is full. What happens then depends on the backpressure policy:
+
+    - block: wait until the buffer has room.
+    - coalesce: merge an intermediate event's text into the intermediate event
+      waiting at the end of the buffer, otherwise wait.
+    - drop: discard intermediate events, wait for all others.
+
+    Only events published as intermediate, such as partial text chunks, are ever
+    coalesced or dropped. All other events are delivered in order.
+
+    Args:
+        event_queue: The queue to publish events to.
+        max_pending: Maximum number of buffered events. With 0, events are
+            enqueued inline by publish().
+        policy: What to do with events published while the buffer is full.
+    """
+
+    def __init__(self, event_queue: EventQueue, *, max_pending: int = 0, policy: BackpressurePolicy = "block"):
+        self._event_queue = event_queue
+        self._max_pending = max_pending
+        self._policy = policy
+        self._pending: deque[_PendingEvent] = deque()
+        # Events taken off the buffer and being handed to the event queue
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+    async def publish(self, event: Event, *, intermediate: bool = False) -> None:
+        """Publish an event.
+
+        Args:
+            event: The event to publish.
+            intermediate: Whether the event may be coalesced or dropped under backpressure.
+
+        Raises:
+            Exception: The error that stopped the background delivery, if any.
+        """
+        if self._max_pending <= 0:
+            await self._event_queue.enqueue_event(event)
+            return
+
+        if self._consumer is None:
+            self._consumer = asyncio.create_task(self._consume())
+
+        async with self._changed:
+            self._raise_if_failed()
+            if self._is_full() and intermediate:
+                if self._policy == "drop":
+                    dropped_events_counter.add(1)
+                    return
+                if (
+                    self._policy == "coalesce"
+                    and self._pending
+                    and self._pending[-1].intermediate
+                    and _merge_status_text(self._pending[-1].event, event)
+                ):
+                    coalesced_events_counter.add(1)
+                    return
+
+            await self._changed.wait_for(lambda: not self._is_full() or self._error is not None)
+            self._raise_if_failed()
+            self._pending.append(_PendingEvent(event=event, intermediate=intermediate))
+            pending_events_counter.add(1)
+            self._changed.notify_all()
+
+    async def close(self) -> None:
+        """Deliver all buffered events and stop the background delivery.
+
+        Raises:
+            Exception: The error that stopped the background delivery, if any.
+        """
+        if self._consumer is None:
+            return
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        await self._consumer
+        self._raise_if_failed()
+
+    async def abort(self) -> None:
+        """Stop the background delivery and discard buffered events."""
+        if self._consumer is None:
+            return
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+        pending_events_counter.add(-len(self._pending))
+        self._pending.clear()
+
+    async def __aenter__(self) -> "EventPublisher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.close()
+        elif issubclass(exc_type, Exception):
+            # Still deliver what the run produced before it failed
+            try:
+                await self.close()
+            except Exception as e:
+                logger.error("Failed to publish buffered events: %s", e, exc_info=True)
+        else:
+            await self.abort()
+
+    def _is_full(self) -> bool:
+        return len(self._pending) + self._in_flight >= self._max_pending
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    async def _consume(self) -> None:
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                pending = self._pending.popleft()
+                self._in_flight += 1
+            try:
+                await self._event_queue.enqueue_event(pending.event)
+            except Exception as e:
+                async with self._changed:
+                    self._error = e
+                    self._changed.notify_all()
+                return
+            finally:
+                pending_events_counter.add(-1)
+            async with self._changed:
+                self._in_flight -= 1
+                self._changed.notify_all()
+
+
+def _merge_status_text(target: Event, event: Event) -> bool:
+    """Append the text of a partial status update to another one, if both only carry text."""
+    if not isinstance(target, TaskStatusUpdateEvent) or not isinstance(event, TaskStatusUpdateEvent):
+        return False
+    if target.task_id != event.task_id or target.status.state != event.status.state:
+        return False
+    if target.status.message is None or event.status.message is None:
+        return False
+    parts = target.status.message.parts + event.status.message.parts
+    if not parts or not all(isinstance(part.root, TextPart) for part in parts):
+        return False
+    # Don't mix differently tagged text, e.g. thoughts and answers
+    metadata = parts[0].root.metadata
+    if any(part.root.metadata != metadata for part in parts):
+        return False
+    text = "".join(part.root.text for part in parts)
+    target.status.message.parts = [Part(TextPart(text=text, metadata=metadata))]
+    target.status.timestamp = event.status.timestamp
+    return True
@@ -1,11 +1,30 @@
 import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Optional
 
 import httpx
 from a2a.server.tasks import TaskStore
-from a2a.types import Task
+from a2a.types import Task, TaskState
 from pydantic import BaseModel
 from typing_extensions import override
 
+from .._cache import BoundedCache, CacheStats
+
+logger = logging.getLogger(__name__)
+
+# States that are written right away in debounced mode: the task either ended or
+# waits for the user, who may act on it immediately.
+_IMMEDIATE_SAVE_STATES = {
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+    TaskState.input_required,
+    TaskState.auth_required,
+}
+
 
 class KAgentTaskResponse(BaseModel):
     """Wrapper for KAgent controller API responses.
@@ -20,20 +39,72 @@ class KAgentTaskResponse(BaseModel):
     message: str | None = None
 
 
+class KAgentTaskStoreConfig(BaseModel):
+    """Configuration for the KAgentTaskStore."""
+
+    # Coalesce saves of the same task and only write its latest state once no save
+    # arrived for this many seconds. Terminal, input-required and auth-required
+    # states are written immediately. 0 writes every save.
+    save_debounce: float = 0.0
+
+    # Write a debounced task at most this many seconds after its first unsaved change,
+    # even if saves keep arriving.
+    save_max_delay: float = 1.0
+
+    # Keep recently saved and fetched tasks in memory and serve get() from there
+    # instead of the controller. Only safe while this replica is the only writer of
+    # the tasks it serves, or with a short TTL.
+    cache: bool = False
+
+    # Maximum number of tasks kept in the cache
+    cache_max_entries: int = 1024
+
+    # Seconds a task stays cached after it was last saved or fetched
+    cache_ttl: Optional[float] = 60.0
+
+
+@dataclass
+class _PendingTaskSave:
+    """The latest unsaved state of a task in debounced mode."""
+
+    task: Task
+    first_saved_at: float
+    last_saved_at: float
+    timer: asyncio.Task | None = None
+
+
+@dataclass
+class _TaskLock:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
 class KAgentTaskStore(TaskStore):
     """
     A task store that persists A2A tasks to KAgent via REST API.
+
+    In debounced mode, saves only record the latest task state and a background
+    timer writes it once the task has been quiet for a while. States that end the
+    task or wait for user input are written right away, get() returns the latest
+    unsaved state, and wait_for_save() is signalled when a task is actually written.
     """
 
-    def __init__(self, client: httpx.AsyncClient):
+    def __init__(self, client: httpx.AsyncClient, config: Optional[KAgentTaskStoreConfig] = None):
         """Initialize the task store.
 
         Args:
             client: HTTP client configured with KAgent base URL
+            config: Save behaviour of the store. Every save is written immediately if None.
         """
         self.client = client
+        self._config = config or KAgentTaskStoreConfig()
         # Event-based sync: track pending save operations
         self._save_events: dict[str, asyncio.Event] = {}
+        self._pending: dict[str, _PendingTaskSave] = {}
+        self._write_locks: dict[str, _TaskLock] = {}
+        self._task_cache: BoundedCache[str, Task] = BoundedCache(
+            "task", max_entries=self._config.cache_max_entries, ttl=self._config.cache_ttl
+        )
 
     @override
     async def save(self, task: Task, context=None) -> None:
@@ -46,8 +117,77 @@ class KAgentTaskStore(TaskStore):
         Raises:
             httpx.HTTPStatusError: If the API request fails
         """
-        response = await self.client.post("/api/tasks", json=task.model_dump(mode="json"))
-        response.raise_for_status()
+        if self._config.save_debounce <= 0 or task.status.state in _IMMEDIATE_SAVE_STATES:
+            self._cancel_pending(task.id)
+            await self._write(task)
+            return
+
+        now = time.monotonic()
+        pending = self._pending.get(task.id)
+        if pending is None:
+            pending = _PendingTaskSave(task=task, first_saved_at=now, last_saved_at=now)
+            self._pending[task.id] = pending
+            pending.timer = asyncio.create_task(self._write_when_quiet(pending))
+        else:
+            pending.task = task
+            pending.last_saved_at = now
+
+    async def flush(self, task_id: Optional[str] = None) -> None:
+        """Write debounced task states right away.
+
+        Args:
+            task_id: Only write this task. Writes all pending tasks if None.
+        """
+        task_ids = [task_id] if task_id is not None else list(self._pending)
+        for pending_task_id in task_ids:
+            pending = self._pending.get(pending_task_id)
+            if pending is None:
+                continue
+            self._cancel_pending(pending_task_id)
+            await self._write(pending.task)
+
+    async def close(self) -> None:
+        """Write all debounced task states."""
+        await self.flush()
+
+    async def _write_when_quiet(self, pending: _PendingTaskSave) -> None:
+        while True:
+            deadline = min(
+                pending.last_saved_at + self._config.save_debounce,
+                pending.first_saved_at + self._config.save_max_delay,
+            )
+            delay = deadline - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+
+        if self._pending.get(pending.task.id) is not pending:
+            return
+        del self._pending[pending.task.id]
+        try:
+            await self._write(pending.task)
+        except Exception as e:
+            logger.warning("Debounced save of task %s failed: %s", pending.task.id, e)
+
+    def _cancel_pending(self, task_id: str) -> None:
+        pending = self._pending.pop(task_id, None)
+        if pending is not None and pending.timer is not None and pending.timer is not asyncio.current_task():
+            pending.timer.cancel()
+
+    async def _write(self, task: Task) -> None:
+        # Writes of the same task must not overtake each other
+        task_lock = self._write_locks.setdefault(task.id, _TaskLock())
+        task_lock.users += 1
+        try:
+            async with task_lock.lock:
+                response = await self.client.post("/api/tasks", json=task.model_dump(mode="json"))
+                response.raise_for_status()
+                if self._config.cache:
+                    self._task_cache.set(task.id, task.model_copy(deep=True))
+        finally:
+            task_lock.users -= 1
+            if task_lock.users == 0:
+                self._write_locks.pop(task.id, None)
 
         # Signal that save completed (event-based sync)
         if task.id in self._save_events:
@@ -67,6 +207,16 @@ class KAgentTaskStore(TaskStore):
         Raises:
             httpx.HTTPStatusError: If the API request fails (except 404)
         """
+        pending = self._pending.get(task_id)
+        if pending is not None:
+            # Not written yet: the latest state only lives here
+            return pending.task.model_copy(deep=True)
+
+        if self._config.cache:
+            cached = self._task_cache.get(task_id)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
         response = await self.client.get(f"/api/tasks/{task_id}")
         if response.status_code == 404:
             return None
@@ -74,6 +224,8 @@ class KAgentTaskStore(TaskStore):
 
         # Unwrap the StandardResponse envelope from the Go controller
         wrapped = KAgentTaskResponse.model_validate(response.json())
+        if self._config.cache and wrapped.data is not None:
+            self._task_cache.set(task_id, wrapped.data.model_copy(deep=True))
         return wrapped.data
 
     @override
@@ -87,9 +239,15 @@ class KAgentTaskStore(TaskStore):
         Raises:
             httpx.HTTPStatusError: If the API request fails
         """
+        self._cancel_pending(task_id)
+        self._task_cache.pop(task_id)
         response = await self.client.delete(f"/api/tasks/{task_id}")
         response.raise_for_status()
 
+    def task_cache_stats(self) -> CacheStats:
+        """Returns the hit, miss and eviction counters and the current size of the task cache."""
+        return self._task_cache.stats()
+
     async def wait_for_save(self, task_id: str, timeout: float = 5.0) -> None:
         """Wait for a task to be saved (event-based sync).
 
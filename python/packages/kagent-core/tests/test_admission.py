@@ -0,0 +1,156 @@
+"""Tests for AdmissionController."""
+
+import asyncio
+
+import pytest
+from a2a.auth.user import User
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.agent_execution.context import RequestContext
+from a2a.server.context import ServerCallContext
+from a2a.server.events import EventQueue
+from a2a.types import Message, MessageSendParams, Part, Role, TaskState, TextPart
+
+from kagent.core.a2a import AdmissionController, AdmissionControllerConfig
+
+
+class NamedUser(User):
+    def __init__(self, name: str):
+        self.name = name
+
+    @property
+    def is_authenticated(self) -> bool:
+        return False
+
+    @property
+    def user_name(self) -> str:
+        return self.name
+
+
+class BlockingExecutor(AgentExecutor):
+    """Runs each request until it is released, recording the order they started in."""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.release = asyncio.Event()
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        self.started.append(context.task_id)
+        await self.release.wait()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        pass
+
+
+def _context(task_id: str, user: str = "alice") -> RequestContext:
+    return RequestContext(
+        request=MessageSendParams(
+            message=Message(message_id=task_id, role=Role.user, parts=[Part(TextPart(text="hi"))])
+        ),
+        task_id=task_id,
+        context_id=f"ctx-{task_id}",
+        call_context=ServerCallContext(user=NamedUser(user)),
+    )
+
+
+async def _states(queue: EventQueue) -> list[TaskState]:
+    states = []
+    while not queue.queue.empty():
+        states.append((await queue.dequeue_event()).status.state)
+    return states
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_the_limit_wait_for_a_slot():
+    inner = BlockingExecutor()
+    controller = AdmissionController(inner, AdmissionControllerConfig(max_concurrency=2))
+
+    runs = [asyncio.create_task(controller.execute(_context(f"t{i}"), EventQueue())) for i in range(3)]
+    await asyncio.sleep(0.01)
+    assert inner.started == ["t0", "t1"]
+
+    inner.release.set()
+    await asyncio.gather(*runs)
+    assert inner.started == ["t0", "t1", "t2"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_right_away():
+    inner = BlockingExecutor()
+    controller = AdmissionController(inner, AdmissionControllerConfig(max_concurrency=1, max_queue_size=1))
+    running = asyncio.create_task(controller.execute(_context("t0"), EventQueue()))
+    waiting = asyncio.create_task(controller.execute(_context("t1"), EventQueue()))
+    await asyncio.sleep(0.01)
+
+    queue = EventQueue()
+    await controller.execute(_context("t2"), queue)
+
+    assert await _states(queue) == [TaskState.rejected]
+    inner.release.set()
+    await asyncio.gather(running, waiting)
+    assert inner.started == ["t0", "t1"]
+
+
+@pytest.mark.asyncio
+async def test_waiting_too_long_is_rejected():
+    inner = BlockingExecutor()
+    controller = AdmissionController(inner, AdmissionControllerConfig(max_concurrency=1, queue_timeout=0.02))
+    running = asyncio.create_task(controller.execute(_context("t0"), EventQueue()))
+    await asyncio.sleep(0)
+
+    queue = EventQueue()
+    await controller.execute(_context("t1"), queue)
+
+    assert await _states(queue) == [TaskState.rejected]
+    inner.release.set()
+    await running
+    assert inner.started == ["t0"]
+
+
+@pytest.mark.asyncio
+async def test_free_slots_go_to_waiting_users_in_turn():
+    inner = BlockingExecutor()
+    controller = AdmissionController(inner, AdmissionControllerConfig(max_concurrency=1))
+    runs = [asyncio.create_task(controller.execute(_context("a0", "alice"), EventQueue()))]
+    await asyncio.sleep(0)
+    # Alice queues a burst before Bob sends his request
+    for task_id, user in [("a1", "alice"), ("a2", "alice"), ("b1", "bob")]:
+        runs.append(asyncio.create_task(controller.execute(_context(task_id, user), EventQueue())))
+        await asyncio.sleep(0)
+
+    inner.release.set()
+    await asyncio.gather(*runs)
+
+    assert inner.started == ["a0", "a1", "b1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_per_user_limit():
+    inner = BlockingExecutor()
+    controller = AdmissionController(inner, AdmissionControllerConfig(max_concurrency=3, max_concurrency_per_user=1))
+    runs = [
+        asyncio.create_task(controller.execute(_context(task_id, user), EventQueue()))
+        for task_id, user in [("a0", "alice"), ("a1", "alice"), ("b0", "bob")]
+    ]
+    await asyncio.sleep(0.01)
+    assert inner.started == ["a0", "b0"]
+
+    inner.release.set()
+    await asyncio.gather(*runs)
+
+
+@pytest.mark.asyncio
+async def test_cancel_while_waiting():
+    inner = BlockingExecutor()
+    controller = AdmissionController(inner, AdmissionControllerConfig(max_concurrency=1))
+    running = asyncio.create_task(controller.execute(_context("t0"), EventQueue()))
+    queue = EventQueue()
+    waiting = asyncio.create_task(controller.execute(_context("t1"), queue))
+    await asyncio.sleep(0.01)
+
+    await controller.cancel(_context("t1"), EventQueue())
+    await waiting
+
+    assert await _states(queue) == [TaskState.canceled]
+    inner.release.set()
+    await running
+    assert inner.started == ["t0"]
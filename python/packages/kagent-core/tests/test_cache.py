@@ -0,0 +1,73 @@
+"""Tests for the bounded in-process cache."""
+
+import time
+
+import pytest
+
+from kagent.core import BoundedCache
+
+
+def test_evicts_least_recently_used_entry():
+    cache = BoundedCache("test", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (3, 0, 1, 2)
+
+
+def test_evicts_entries_over_memory_limit():
+    cache = BoundedCache("test", max_bytes=10, sizeof=len)
+    cache.set("a", "x" * 4)
+    cache.set("b", "x" * 4)
+    assert cache.stats().bytes == 8
+
+    cache.set("c", "x" * 4)
+    assert "a" not in cache
+    assert cache.stats().bytes == 8
+
+
+def test_resize_after_in_place_update():
+    cache = BoundedCache("test", max_bytes=10, sizeof=len)
+    cache.set("a", ["x"])
+    cache.set("b", ["x"])
+
+    cache.peek("b").extend(["x"] * 9)
+    cache.resize("b")
+
+    assert "a" not in cache
+    assert cache.stats().bytes == 10
+
+
+def test_entries_expire_after_ttl():
+    cache = BoundedCache("test", ttl=0.01)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats.misses, stats.evictions, stats.entries) == (1, 1, 0)
+
+
+def test_keys_lists_live_entries_by_recency():
+    cache = BoundedCache("test", ttl=0.01)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    assert cache.keys() == ["b", "a"]
+
+    time.sleep(0.02)
+
+    assert cache.keys() == []
+
+
+def test_max_bytes_requires_sizeof():
+    with pytest.raises(ValueError):
+        BoundedCache("test", max_bytes=10)
@@ -0,0 +1,101 @@
+"""Tests for TaskCancellationRegistry."""
+
+import asyncio
+
+import pytest
+from a2a.server.events import EventQueue
+from a2a.types import TaskState
+
+from kagent.core.a2a import TaskCancellationRegistry
+
+
+async def _drain(queue: EventQueue) -> list:
+    events = []
+    while not queue.queue.empty():
+        events.append(await queue.dequeue_event())
+    return events
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_the_execution_and_publishes_canceled():
+    registry = TaskCancellationRegistry()
+    queue = EventQueue()
+    cleaned_up = asyncio.Event()
+
+    async def execute():
+        async with registry.track("task-1", "ctx-1", queue):
+            try:
+                await asyncio.sleep(60)
+            finally:
+                cleaned_up.set()
+        return "returned"
+
+    execution = asyncio.create_task(execute())
+    await asyncio.sleep(0)
+    assert registry.is_running("task-1")
+
+    assert await registry.cancel("task-1", "ctx-1", EventQueue())
+
+    assert cleaned_up.is_set()
+    # The execution ends normally, so the request handler can close its queue
+    assert await execution == "returned"
+    assert not registry.is_running("task-1")
+    events = await _drain(queue)
+    assert events[-1].status.state == TaskState.canceled
+    assert events[-1].final
+
+
+@pytest.mark.asyncio
+async def test_cancel_of_a_task_that_is_not_running_publishes_canceled():
+    registry = TaskCancellationRegistry()
+    queue = EventQueue()
+
+    assert not await registry.cancel("task-1", "ctx-1", queue)
+
+    events = await _drain(queue)
+    assert [e.status.state for e in events] == [TaskState.canceled]
+
+
+@pytest.mark.asyncio
+async def test_cancel_publishes_canceled_when_the_execution_does_not_stop_in_time():
+    registry = TaskCancellationRegistry(cancel_timeout=0.01)
+    stop = asyncio.Event()
+
+    async def execute():
+        async with registry.track("task-1", "ctx-1", EventQueue()):
+            try:
+                await asyncio.sleep(60)
+            finally:
+                # Cleanup that outlasts the cancel timeout
+                await stop.wait()
+
+    execution = asyncio.create_task(execute())
+    await asyncio.sleep(0)
+    cancel_queue = EventQueue()
+
+    assert await registry.cancel("task-1", "ctx-1", cancel_queue)
+
+    events = await _drain(cancel_queue)
+    assert [e.status.state for e in events] == [TaskState.canceled]
+    assert events[0].final
+    stop.set()
+    await execution
+
+
+@pytest.mark.asyncio
+async def test_other_cancellations_are_passed_on():
+    registry = TaskCancellationRegistry()
+    queue = EventQueue()
+
+    async def execute():
+        async with registry.track("task-1", "ctx-1", queue):
+            await asyncio.sleep(60)
+
+    execution = asyncio.create_task(execute())
+    await asyncio.sleep(0)
+    execution.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await execution
+    assert await _drain(queue) == []
+    assert not registry.is_running("task-1")
@@ -0,0 +1,128 @@
+"""Tests for the bounded A2A event publisher."""
+
+import asyncio
+
+import pytest
+from a2a.server.events import EventQueue
+from a2a.types import Message, Part, Role, TaskState, TaskStatus, TaskStatusUpdateEvent, TextPart
+
+from kagent.core.a2a import EventPublisher
+
+
+class GatedEventQueue(EventQueue):
+    """An event queue whose consumer only accepts events while the gate is open."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.received = []
+
+    async def enqueue_event(self, event):
+        await self.gate.wait()
+        self.received.append(event)
+
+
+def _status(text: str, state: TaskState = TaskState.working, final: bool = False) -> TaskStatusUpdateEvent:
+    return TaskStatusUpdateEvent(
+        task_id="task-1",
+        context_id="ctx-1",
+        status=TaskStatus(
+            state=state,
+            message=Message(message_id=text, role=Role.agent, parts=[Part(TextPart(text=text))]),
+        ),
+        final=final,
+    )
+
+
+def _texts(events) -> list[str]:
+    return [e.status.message.parts[0].root.text for e in events]
+
+
+@pytest.mark.asyncio
+async def test_inline_publish_without_buffer():
+    queue = GatedEventQueue()
+    queue.gate.set()
+    publisher = EventPublisher(queue)
+
+    await publisher.publish(_status("a"))
+
+    assert _texts(queue.received) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_buffered_events_are_delivered_in_order():
+    queue = GatedEventQueue()
+    async with EventPublisher(queue, max_pending=8) as publisher:
+        for text in ("a", "b", "c"):
+            await publisher.publish(_status(text))
+        # The producer was not held up by the closed gate
+        assert queue.received == []
+        queue.gate.set()
+
+    assert _texts(queue.received) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_room():
+    queue = GatedEventQueue()
+    publisher = EventPublisher(queue, max_pending=2)
+    await publisher.publish(_status("a"))
+    await publisher.publish(_status("b"))
+
+    blocked = asyncio.create_task(publisher.publish(_status("c"), intermediate=True))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    queue.gate.set()
+    await blocked
+    await publisher.close()
+    assert _texts(queue.received) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_merges_partial_text():
+    queue = GatedEventQueue()
+    publisher = EventPublisher(queue, max_pending=2, policy="coalesce")
+    await publisher.publish(_status("a"), intermediate=True)  # in flight
+    for text in ("b", "c", "d"):
+        await publisher.publish(_status(text), intermediate=True)
+
+    final = asyncio.create_task(publisher.publish(_status("done", TaskState.completed, final=True)))
+    await asyncio.sleep(0.01)
+    queue.gate.set()
+    await final
+    await publisher.close()
+
+    assert _texts(queue.received) == ["a", "bcd", "done"]
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_only_drops_intermediate_events():
+    queue = GatedEventQueue()
+    publisher = EventPublisher(queue, max_pending=1, policy="drop")
+    await publisher.publish(_status("a"))
+    await publisher.publish(_status("partial"), intermediate=True)
+
+    state_change = asyncio.create_task(publisher.publish(_status("input", TaskState.input_required)))
+    await asyncio.sleep(0.01)
+    queue.gate.set()
+    await state_change
+    await publisher.close()
+
+    assert _texts(queue.received) == ["a", "input"]
+
+
+@pytest.mark.asyncio
+async def test_delivery_error_is_raised_to_the_producer():
+    class FailingEventQueue(EventQueue):
+        async def enqueue_event(self, event):
+            raise RuntimeError("consumer gone")
+
+    publisher = EventPublisher(FailingEventQueue(), max_pending=1)
+    await publisher.publish(_status("a"))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(RuntimeError, match="consumer gone"):
+        await publisher.publish(_status("b"))
+    with pytest.raises(RuntimeError, match="consumer gone"):
+        await publisher.close()
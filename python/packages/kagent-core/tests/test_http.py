@@ -0,0 +1,112 @@
+"""Tests for the kagent controller HTTP client factory."""
+
+import httpx
+import pytest
+
+from kagent.core import HttpClientConfig, create_http_client, create_sync_http_client
+from kagent.core._http import (
+    _observe_pool_connections,
+    _pools,
+    _RetryingAsyncTransport,
+    _RetryingTransport,
+    _track_pool,
+)
+
+_FAST_RETRIES = HttpClientConfig(retries=2, retry_backoff=0, retry_max_backoff=0)
+
+
+class FlakyController:
+    """Fails the first requests with the given error or status code."""
+
+    def __init__(self, failures: int, error: Exception | None = None, status_code: int = 503):
+        self.failures = failures
+        self.error = error
+        self.status_code = status_code
+        self.calls = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.calls <= self.failures:
+            if self.error is not None:
+                raise self.error
+            return httpx.Response(self.status_code)
+        return httpx.Response(200, json={"ok": True})
+
+
+def _async_client(controller: FlakyController) -> httpx.AsyncClient:
+    transport = _RetryingAsyncTransport(httpx.MockTransport(controller.handle), _FAST_RETRIES)
+    return httpx.AsyncClient(base_url="http://kagent.test", transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_retries_unavailable_controller_for_idempotent_requests():
+    controller = FlakyController(failures=2)
+    async with _async_client(controller) as client:
+        response = await client.get("/api/tasks/1")
+
+    assert response.status_code == 200
+    assert controller.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_does_not_resend_non_idempotent_requests_after_a_response():
+    controller = FlakyController(failures=1)
+    async with _async_client(controller) as client:
+        response = await client.post("/api/tasks", json={})
+
+    assert response.status_code == 503
+    assert controller.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_connection_failures_for_every_method():
+    controller = FlakyController(failures=1, error=httpx.ConnectError("refused"))
+    async with _async_client(controller) as client:
+        response = await client.post("/api/tasks", json={})
+
+    assert response.status_code == 200
+    assert controller.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_the_configured_retries():
+    controller = FlakyController(failures=5, error=httpx.ConnectError("refused"))
+    async with _async_client(controller) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("/health")
+
+    assert controller.calls == 3
+
+
+def test_sync_transport_retries():
+    controller = FlakyController(failures=1, status_code=502)
+    transport = _RetryingTransport(httpx.MockTransport(controller.handle), _FAST_RETRIES)
+    with httpx.Client(base_url="http://kagent.test", transport=transport) as client:
+        assert client.delete("/api/crewai/memory").status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_factories_apply_the_config():
+    config = HttpClientConfig(timeout=7, connect_timeout=2, http2=True)
+    async with create_http_client("http://kagent.test", config) as client:
+        assert client.timeout == httpx.Timeout(7, connect=2)
+        assert str(client.base_url) == "http://kagent.test"
+    with create_sync_http_client("http://kagent.test", config, headers={"X-Agent-Name": "a"}) as client:
+        assert client.headers["X-Agent-Name"] == "a"
+
+
+@pytest.mark.asyncio
+async def test_default_timeouts_match_httpx():
+    async with create_http_client("http://kagent.test") as client:
+        assert client.timeout == httpx.Timeout(5.0)
+
+
+def test_pool_gauge_only_tracks_transports_with_a_pool():
+    tracked = len(_pools)
+    _track_pool(httpx.MockTransport(lambda request: httpx.Response(200)))
+    assert len(_pools) == tracked
+
+    transport = httpx.HTTPTransport()
+    _track_pool(transport)
+    assert len(_pools) == tracked + 1
+    assert [observation.value for observation in _observe_pool_connections(None)] == [0, 0]
@@ -0,0 +1,138 @@
+"""Tests for KAgentTaskStore save behaviour."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from a2a.types import Message, Part, Role, Task, TaskState, TaskStatus, TextPart
+
+from kagent.core.a2a import KAgentTaskStore, KAgentTaskStoreConfig
+
+
+class FakeTaskAPI:
+    """Records task writes made against the controller task API."""
+
+    def __init__(self):
+        self.tasks: dict[str, dict] = {}
+        self.requests: list[httpx.Request] = []
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url="http://kagent.test", transport=httpx.MockTransport(self.handle))
+
+    def writes(self) -> list[httpx.Request]:
+        return [r for r in self.requests if r.method == "POST"]
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/api/tasks" and request.method == "POST":
+            task = json.loads(request.content)
+            self.tasks[task["id"]] = task
+            return httpx.Response(201, json={"error": False, "data": task})
+        if path.startswith("/api/tasks/") and request.method == "DELETE":
+            self.tasks.pop(path.rsplit("/", 1)[-1], None)
+            return httpx.Response(200, json={"error": False, "data": None})
+        if path.startswith("/api/tasks/") and request.method == "GET":
+            task = self.tasks.get(path.rsplit("/", 1)[-1])
+            if task is None:
+                return httpx.Response(404, json={"error": True, "message": "Task not found"})
+            return httpx.Response(200, json={"error": False, "data": task})
+        return httpx.Response(404, text="404 page not found")
+
+
+def _message(text: str) -> Message:
+    return Message(message_id=text, role=Role.agent, parts=[Part(TextPart(text=text))])
+
+
+def _task(*texts: str, state: TaskState = TaskState.working) -> Task:
+    return Task(
+        id="task-1",
+        context_id="ctx-1",
+        status=TaskStatus(state=state),
+        history=[_message(text) for text in texts],
+    )
+
+
+@pytest.mark.asyncio
+async def test_every_save_is_written_by_default():
+    api = FakeTaskAPI()
+    store = KAgentTaskStore(api.client())
+
+    await store.save(_task("a"))
+    await store.save(_task("a", "b"))
+
+    assert len(api.writes()) == 2
+
+
+@pytest.mark.asyncio
+async def test_debounced_saves_write_the_latest_state_once():
+    api = FakeTaskAPI()
+    store = KAgentTaskStore(api.client(), KAgentTaskStoreConfig(save_debounce=0.02))
+
+    for count in range(1, 4):
+        await store.save(_task(*[str(i) for i in range(count)]))
+
+    assert api.writes() == []
+    # Reads see the state that was not written yet
+    assert len((await store.get("task-1")).history) == 3
+
+    await asyncio.sleep(0.05)
+
+    assert len(api.writes()) == 1
+    assert len(api.tasks["task-1"]["history"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_input_required_is_written_immediately_and_signals_waiters():
+    api = FakeTaskAPI()
+    store = KAgentTaskStore(api.client(), KAgentTaskStoreConfig(save_debounce=60))
+    await store.save(_task("a"))
+
+    waiter = asyncio.create_task(store.wait_for_save("task-1", timeout=1))
+    await asyncio.sleep(0)
+    await store.save(_task("a", "approve?", state=TaskState.input_required))
+    await waiter
+
+    assert len(api.writes()) == 1
+    assert api.tasks["task-1"]["status"]["state"] == "input-required"
+
+
+@pytest.mark.asyncio
+async def test_close_writes_pending_saves():
+    api = FakeTaskAPI()
+    store = KAgentTaskStore(api.client(), KAgentTaskStoreConfig(save_debounce=60))
+    await store.save(_task("a"))
+
+    await store.close()
+
+    assert len(api.writes()) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_saved_tasks_without_a_controller_read():
+    api = FakeTaskAPI()
+    store = KAgentTaskStore(api.client(), KAgentTaskStoreConfig(cache=True))
+    await store.save(_task("a"))
+
+    task = await store.get("task-1")
+    # Callers get their own copy
+    task.history.append(_message("b"))
+
+    assert [m.message_id for m in (await store.get("task-1")).history] == ["a"]
+    assert [r for r in api.requests if r.method == "GET"] == []
+    assert store.task_cache_stats().hits == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_reads_through_and_drops_deleted_tasks():
+    api = FakeTaskAPI()
+    await KAgentTaskStore(api.client()).save(_task("a"))
+    store = KAgentTaskStore(api.client(), KAgentTaskStoreConfig(cache=True))
+
+    await store.get("task-1")
+    await store.get("task-1")
+    assert len([r for r in api.requests if r.method == "GET"]) == 1
+
+    await store.delete("task-1")
+    assert await store.get("task-1") is None
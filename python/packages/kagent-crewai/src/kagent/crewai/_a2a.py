@@ -1,9 +1,9 @@
 import faulthandler
 import logging
 import os
+from contextlib import asynccontextmanager
 from typing import Union
 
-import httpx
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.types import AgentCard
@@ -12,8 +12,20 @@ from fastapi.responses import PlainTextResponse
 from opentelemetry.instrumentation.crewai import CrewAIInstrumentor
 
 from crewai import Crew, Flow
-from kagent.core import KAgentConfig, configure_tracing
-from kagent.core.a2a import KAgentRequestContextBuilder, KAgentTaskStore
+from kagent.core import (
+    HttpClientConfig,
+    KAgentConfig,
+    configure_tracing,
+    create_http_client,
+    create_sync_http_client,
+)
+from kagent.core.a2a import (
+    AdmissionController,
+    AdmissionControllerConfig,
+    KAgentRequestContextBuilder,
+    KAgentTaskStore,
+    KAgentTaskStoreConfig,
+)
 
 from ._executor import CrewAIAgentExecutor, CrewAIAgentExecutorConfig
 
@@ -41,25 +53,37 @@ class KAgentApp:
         agent_card: AgentCard,
         config: KAgentConfig = KAgentConfig(),
         executor_config: CrewAIAgentExecutorConfig | None = None,
+        task_store_config: KAgentTaskStoreConfig | None = None,
+        http_config: HttpClientConfig | None = None,
+        admission_config: AdmissionControllerConfig | None = None,
         tracing: bool = True,
     ):
         self._crew = crew
         self.agent_card = AgentCard.model_validate(agent_card)
         self.config = config
         self.executor_config = executor_config or CrewAIAgentExecutorConfig()
+        self.task_store_config = task_store_config
+        self.http_config = http_config
+        self.admission_config = admission_config
         self.tracing = tracing
 
     def build(self) -> FastAPI:
-        http_client = httpx.AsyncClient(base_url=self.config.url)
-
-        agent_executor = CrewAIAgentExecutor(
-            crew=self._crew,
-            app_name=self.config.app_name,
-            config=self.executor_config,
-            http_client=http_client,
+        http_client = create_http_client(self.config.url, self.http_config)
+        # CrewAI memory and flow persistence are called synchronously
+        sync_http_client = create_sync_http_client(self.config.url, self.http_config)
+
+        agent_executor = AdmissionController(
+            CrewAIAgentExecutor(
+                crew=self._crew,
+                app_name=self.config.app_name,
+                config=self.executor_config,
+                http_client=http_client,
+                sync_http_client=sync_http_client,
+            ),
+            self.admission_config,
         )
 
-        task_store = KAgentTaskStore(http_client)
+        task_store = KAgentTaskStore(http_client, self.task_store_config)
         request_context_builder = KAgentRequestContextBuilder(task_store=task_store)
         request_handler = DefaultRequestHandler(
             agent_executor=agent_executor,
@@ -72,11 +96,22 @@ class KAgentApp:
             http_handler=request_handler,
         )
 
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            try:
+                yield
+            finally:
+                # Don't lose debounced task saves on shutdown
+                await task_store.close()
+                await http_client.aclose()
+                sync_http_client.close()
+
         faulthandler.enable()
         app = FastAPI(
             title=f"KAgent CrewAI: {self.config.app_name}",
             description=f"CrewAI agent with KAgent integration: {self.agent_card.description}",
             version=self.agent_card.version,
+            lifespan=lifespan,
         )
 
         if self.tracing:
@@ -23,6 +23,8 @@ from pydantic import BaseModel
 
 from crewai import Crew, Flow
 from crewai.memory import LongTermMemory
+from kagent.core import BoundedCache
+from kagent.core.a2a import TaskCancellationRegistry
 
 from ._listeners import A2ACrewAIListener
 from ._memory import KagentMemoryStorage
@@ -34,6 +36,14 @@ logger = logging.getLogger(__name__)
 class CrewAIAgentExecutorConfig(BaseModel):
     execution_timeout: float = 300.0
 
+    # Number of long-term memory saves buffered and written together. 1 writes every save.
+    memory_batch_size: int = 1
+
+    # Keep flow states in process per flow_uuid so loads skip the controller
+    flow_state_cache: bool = False
+    flow_state_cache_max_entries: int = 1024
+    flow_state_cache_ttl: float = 300.0
+
 
 class CrewAIAgentExecutor(AgentExecutor):
     def __init__(
@@ -43,22 +53,44 @@ class CrewAIAgentExecutor(AgentExecutor):
         app_name: str,
         config: CrewAIAgentExecutorConfig | None = None,
         http_client: httpx.AsyncClient,
+        sync_http_client: httpx.Client | None = None,
     ):
         super().__init__()
         self._crew = crew
         self.app_name = app_name
         self._config = config or CrewAIAgentExecutorConfig()
         self._http_client = http_client
+        self._sync_http_client = sync_http_client
+        self._flow_state_cache = (
+            BoundedCache(
+                "crewai_flow_state",
+                max_entries=self._config.flow_state_cache_max_entries,
+                ttl=self._config.flow_state_cache_ttl,
+            )
+            if self._config.flow_state_cache
+            else None
+        )
+        self._cancellations = TaskCancellationRegistry()
 
     @override
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
-        raise NotImplementedError("Cancellation is not implemented")
+        # The task ends right away. A crew step already running in a worker thread
+        # can't be interrupted and finishes in the background.
+        await self._cancellations.cancel(context.task_id, context.context_id, event_queue)
 
     @override
     async def execute(
         self,
         context: RequestContext,
         event_queue: EventQueue,
+    ):
+        async with self._cancellations.track(context.task_id, context.context_id, event_queue):
+            await self._execute(context, event_queue)
+
+    async def _execute(
+        self,
+        context: RequestContext,
+        event_queue: EventQueue,
     ):
         if not context.message:
             raise ValueError("A2A request must have a message")
@@ -116,6 +148,9 @@ class CrewAIAgentExecutor(AgentExecutor):
                     thread_id=session_id,
                     user_id=user_id,
                     base_url=str(self._http_client.base_url),
+                    client=self._sync_http_client,
+                    async_client=self._http_client,
+                    cache=self._flow_state_cache,
                 )
                 flow_instance = flow_class()
                 flow_instance.persistence = persistence
@@ -123,20 +158,31 @@ class CrewAIAgentExecutor(AgentExecutor):
                 # setting "id" in flow input will enable reusing persisted flow state
                 # if no flow state is persisted or if persistence is not enabled, this works like a normal kickoff
                 inputs["id"] = session_id
+                if self._flow_state_cache is not None:
+                    # Load the state without blocking the event loop, the flow then reads it from the cache
+                    await persistence.aload_state(session_id)
 
                 # output_text will be None if the last method in the flow does not return anything but updates the state instead
                 output_text = await flow_instance.kickoff_async(inputs=inputs)
                 result_text = output_text or flow_instance.state.model_dump_json()
             else:
+                memory_storage = None
                 if self._crew.memory:
-                    self._crew.long_term_memory = LongTermMemory(
-                        KagentMemoryStorage(
-                            thread_id=session_id,
-                            user_id=user_id,
-                            base_url=str(self._http_client.base_url),
-                        )
+                    memory_storage = KagentMemoryStorage(
+                        thread_id=session_id,
+                        user_id=user_id,
+                        base_url=str(self._http_client.base_url),
+                        client=self._sync_http_client,
+                        async_client=self._http_client,
+                        batch_size=self._config.memory_batch_size,
                     )
-                result = await self._crew.kickoff_async(inputs=inputs)
+                    self._crew.long_term_memory = LongTermMemory(memory_storage)
+                try:
+                    result = await self._crew.kickoff_async(inputs=inputs)
+                finally:
+                    # Saves buffered before a failure are kept as well
+                    if memory_storage is not None:
+                        await memory_storage.aflush()
                 result_text = str(result.raw or "No response was generated.")
 
             await event_queue.enqueue_event(
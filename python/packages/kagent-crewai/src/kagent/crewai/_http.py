@@ -0,0 +1,11 @@
+import functools
+
+import httpx
+
+from kagent.core import create_sync_http_client
+
+
+@functools.cache
+def shared_sync_client(base_url: str) -> httpx.Client:
+    """Pooled client for storages created without one, shared per controller URL."""
+    return create_sync_http_client(base_url)
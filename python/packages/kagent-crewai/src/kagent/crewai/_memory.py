@@ -1,9 +1,13 @@
+import asyncio
 import logging
+import threading
 from typing import Any, Dict, List
 
 import httpx
 from pydantic import BaseModel
 
+from ._http import shared_sync_client
+
 
 class KagentMemoryPayload(BaseModel):
     thread_id: str
@@ -19,20 +23,34 @@ class KagentMemoryStorage:
     """
     KagentMemoryStorage is a custom storage class for CrewAI's LongTermMemory.
     It persists memory items to the Kagent backend, scoped by thread_id and user_id.
+
+    With a batch_size above 1, saves are buffered and posted to the backend in one
+    request once the batch is full, before the next load or reset, or when
+    flush/aflush is called. aflush uses the shared async client and doesn't block
+    the event loop.
     """
 
-    def __init__(self, thread_id: str, user_id: str, base_url: str):
+    def __init__(
+        self,
+        thread_id: str,
+        user_id: str,
+        base_url: str,
+        client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+        batch_size: int = 1,
+    ):
         self.thread_id = thread_id
         self.user_id = user_id
         self.base_url = base_url
-
-    def save(self, task_description: str, metadata: dict, timestamp: str, score: float) -> None:
-        """
-        Saves a memory item to the Kagent backend.
-        The agent_id is expected to be in the metadata.
-        """
-        url = f"{self.base_url}/api/crewai/memory"
-        payload = KagentMemoryPayload(
+        self.client = client or shared_sync_client(base_url)
+        self.async_client = async_client
+        self.batch_size = max(batch_size, 1)
+        self._pending: List[KagentMemoryPayload] = []
+        # CrewAI calls save from its worker threads
+        self._lock = threading.Lock()
+
+    def _payload(self, task_description: str, metadata: dict, timestamp: str, score: float) -> KagentMemoryPayload:
+        return KagentMemoryPayload(
             thread_id=self.thread_id,
             user_id=self.user_id,
             memory_data={
@@ -43,51 +61,111 @@ class KagentMemoryStorage:
             },
         )
 
-        logging.info(f"Saving memory to Kagent backend: {payload}")
+    def _add_pending(self, payload: KagentMemoryPayload) -> List[KagentMemoryPayload]:
+        """Buffers a save, returning the batch to write if it is full."""
+        with self._lock:
+            self._pending.append(payload)
+            if len(self._pending) < self.batch_size:
+                return []
+            pending, self._pending = self._pending, []
+        return pending
+
+    def _take_pending(self) -> List[KagentMemoryPayload]:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    @staticmethod
+    def _body(payloads: List[KagentMemoryPayload]) -> Dict[str, Any] | List[Dict[str, Any]]:
+        # The backend stores a single payload or a list of them
+        if len(payloads) == 1:
+            return payloads[0].model_dump()
+        return [payload.model_dump() for payload in payloads]
+
+    def _write(self, payloads: List[KagentMemoryPayload]) -> None:
+        if not payloads:
+            return
+        url = f"{self.base_url}/api/crewai/memory"
+        logging.info(f"Saving {len(payloads)} memories to Kagent backend: {payloads}")
+        try:
+            response = self.client.post(url, json=self._body(payloads), headers={"X-User-ID": self.user_id})
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logging.error(f"Error saving memory to Kagent backend: {e}")
+            raise
+
+    def save(self, task_description: str, metadata: dict, timestamp: str, score: float) -> None:
+        """
+        Saves a memory item to the Kagent backend.
+        The agent_id is expected to be in the metadata.
+        """
+        self._write(self._add_pending(self._payload(task_description, metadata, timestamp, score)))
+
+    def flush(self) -> None:
+        """Writes all buffered saves."""
+        self._write(self._take_pending())
 
+    async def aflush(self) -> None:
+        """Async variant of flush."""
+        payloads = self._take_pending()
+        if self.async_client is None:
+            await asyncio.to_thread(self._write, payloads)
+            return
+        if not payloads:
+            return
+
+        url = f"{self.base_url}/api/crewai/memory"
+        logging.info(f"Saving {len(payloads)} memories to Kagent backend: {payloads}")
         try:
-            with httpx.Client() as client:
-                response = client.post(url, json=payload.model_dump(), headers={"X-User-ID": self.user_id})
-                response.raise_for_status()
+            response = await self.async_client.post(url, json=self._body(payloads), headers={"X-User-ID": self.user_id})
+            response.raise_for_status()
         except httpx.HTTPError as e:
             logging.error(f"Error saving memory to Kagent backend: {e}")
             raise
 
+    def _load_params(self, task_description: str, latest_n: int) -> Dict[str, Any]:
+        # Use task_description as the query parameter to search across all agents for this session
+        return {"q": task_description, "limit": latest_n, "thread_id": self.thread_id}
+
+    @staticmethod
+    def _parse_memories(response: httpx.Response) -> List[Dict[str, Any]] | None:
+        response.raise_for_status()
+
+        # Parse response and convert to the format expected by the original interface
+        memory_response = KagentMemoryResponse.model_validate_json(response.text)
+        if not memory_response.data:
+            return None
+
+        # Convert to the format expected by LongTermMemory: list of dicts with metadata, datetime, score
+        results = []
+        for item in memory_response.data:
+            memory_data = item.memory_data
+            # The memory_data contains: task_description, score, metadata, datetime
+            # We want to return items in the format that LongTermMemory expects
+            results.append(
+                {
+                    "metadata": memory_data.get("metadata", {}),
+                    "datetime": memory_data.get("datetime", ""),
+                    "score": memory_data.get("score", 0.0),
+                }
+            )
+
+        return results if results else None
+
     def load(self, task_description: str, latest_n: int) -> List[Dict[str, Any]] | None:
         """
         Loads memory items from the Kagent backend.
         Returns memory items matching the task description, up to latest_n items.
         """
+        # Buffered saves must be visible to the search
+        self.flush()
         url = f"{self.base_url}/api/crewai/memory"
-        # Use task_description as the query parameter to search across all agents for this session
-        params = {"q": task_description, "limit": latest_n, "thread_id": self.thread_id}
+        params = self._load_params(task_description, latest_n)
 
         logging.debug(f"Loading memory from Kagent backend with params: {params}")
         try:
-            with httpx.Client() as client:
-                response = client.get(url, params=params, headers={"X-User-ID": self.user_id})
-                response.raise_for_status()
-
-            # Parse response and convert to the format expected by the original interface
-            memory_response = KagentMemoryResponse.model_validate_json(response.text)
-            if not memory_response.data:
-                return None
-
-            # Convert to the format expected by LongTermMemory: list of dicts with metadata, datetime, score
-            results = []
-            for item in memory_response.data:
-                memory_data = item.memory_data
-                # The memory_data contains: task_description, score, metadata, datetime
-                # We want to return items in the format that LongTermMemory expects
-                results.append(
-                    {
-                        "metadata": memory_data.get("metadata", {}),
-                        "datetime": memory_data.get("datetime", ""),
-                        "score": memory_data.get("score", 0.0),
-                    }
-                )
-
-            return results if results else None
+            response = self.client.get(url, params=params, headers={"X-User-ID": self.user_id})
+            return self._parse_memories(response)
         except httpx.HTTPError as e:
             logging.error(f"Error loading memory from Kagent backend: {e}")
             return None
@@ -96,14 +174,15 @@ class KagentMemoryStorage:
         """
         Resets the memory storage by deleting all memories for this session.
         """
+        # Buffered saves would be deleted right away
+        self._take_pending()
         url = f"{self.base_url}/api/crewai/memory"
         params = {"thread_id": self.thread_id}
 
         logging.info(f"Resetting memory for session {self.thread_id}")
         try:
-            with httpx.Client() as client:
-                response = client.delete(url, params=params, headers={"X-User-ID": self.user_id})
-                response.raise_for_status()
+            response = self.client.delete(url, params=params, headers={"X-User-ID": self.user_id})
+            response.raise_for_status()
             logging.info(f"Successfully reset memory for session {self.thread_id}")
         except httpx.HTTPError as e:
             logging.error(f"Error resetting memory for session {self.thread_id}: {e}")
@@ -1,3 +1,5 @@
+import asyncio
+import copy
 import logging
 from typing import Any, Dict, Optional, Union
 
@@ -5,6 +7,9 @@ import httpx
 from pydantic import BaseModel, Field
 
 from crewai.flow.persistence import FlowPersistence
+from kagent.core import BoundedCache
+
+from ._http import shared_sync_client
 
 
 class KagentFlowStatePayload(BaseModel):
@@ -22,12 +27,58 @@ class KagentFlowPersistence(FlowPersistence):
     """
     KagentFlowPersistence is a custom persistence class for CrewAI Flows.
     It saves and loads the flow state to the Kagent backend.
+
+    If a cache is given, saved and loaded states are kept in it per flow_uuid, so
+    load_state only reaches the backend for flows it hasn't seen. The cache may be
+    shared between instances. aload_state uses the shared async client.
     """
 
-    def __init__(self, thread_id: str, user_id: str, base_url: str):
+    def __init__(
+        self,
+        thread_id: str,
+        user_id: str,
+        base_url: str,
+        client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+        cache: BoundedCache[tuple[str, str, str], Dict[str, Any]] | None = None,
+    ):
         self.thread_id = thread_id
         self.user_id = user_id
         self.base_url = base_url
+        self.client = client or shared_sync_client(base_url)
+        self.async_client = async_client
+        self.cache = cache
+
+    def _cache_key(self, flow_uuid: str) -> tuple[str, str, str]:
+        return (self.user_id, self.thread_id, flow_uuid)
+
+    def _cached_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        state = self.cache.get(self._cache_key(flow_uuid))
+        # Callers may mutate the returned state
+        return copy.deepcopy(state) if state is not None else None
+
+    def _cache_state(self, flow_uuid: str, state_data: Dict[str, Any]) -> None:
+        if self.cache is not None:
+            self.cache.set(self._cache_key(flow_uuid), copy.deepcopy(state_data))
+
+    def _payload(
+        self, flow_uuid: str, method_name: str, state_data: Union[Dict[str, Any], BaseModel]
+    ) -> KagentFlowStatePayload:
+        return KagentFlowStatePayload(
+            thread_id=self.thread_id,
+            flow_uuid=flow_uuid,
+            method_name=method_name,
+            state_data=state_data.model_dump() if isinstance(state_data, BaseModel) else state_data,
+        )
+
+    @staticmethod
+    def _parse_state(response: httpx.Response) -> Optional[Dict[str, Any]]:
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return KagentFlowStateResponse.model_validate_json(response.text).data.state_data
 
     def init_db(self) -> None:
         """This is handled by the Kagent backend, so no action is needed here."""
@@ -36,35 +87,56 @@ class KagentFlowPersistence(FlowPersistence):
     def save_state(self, flow_uuid: str, method_name: str, state_data: Union[Dict[str, Any], BaseModel]) -> None:
         """Saves the flow state to the Kagent backend."""
         url = f"{self.base_url}/api/crewai/flows/state"
-        payload = KagentFlowStatePayload(
-            thread_id=self.thread_id,
-            flow_uuid=flow_uuid,
-            method_name=method_name,
-            state_data=state_data.model_dump() if isinstance(state_data, BaseModel) else state_data,
-        )
+        payload = self._payload(flow_uuid, method_name, state_data)
         logging.info(f"Saving flow state to Kagent backend: {payload}")
 
         try:
-            with httpx.Client() as client:
-                response = client.post(url, json=payload.model_dump(), headers={"X-User-ID": self.user_id})
-                response.raise_for_status()
+            response = self.client.post(url, json=payload.model_dump(), headers={"X-User-ID": self.user_id})
+            response.raise_for_status()
         except httpx.HTTPError as e:
             logging.error(f"Error saving flow state to Kagent backend: {e}")
             raise
+        self._cache_state(flow_uuid, payload.state_data)
 
     def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
         """Loads the flow state from the Kagent backend."""
+        cached = self._cached_state(flow_uuid)
+        if cached is not None:
+            return cached
+
         url = f"{self.base_url}/api/crewai/flows/state"
         params = {"thread_id": self.thread_id, "flow_uuid": flow_uuid}
         logging.info(f"Loading flow state from Kagent backend with params: {params}")
 
         try:
-            with httpx.Client() as client:
-                response = client.get(url, params=params, headers={"X-User-ID": self.user_id})
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            return KagentFlowStateResponse.model_validate_json(response.text).data.state_data
+            state_data = self._parse_state(self.client.get(url, params=params, headers={"X-User-ID": self.user_id}))
+        except httpx.HTTPError as e:
+            logging.error(f"Error loading flow state from Kagent backend: {e}")
+            return None
+        if state_data is not None:
+            self._cache_state(flow_uuid, state_data)
+        return state_data
+
+    async def aload_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
+        """Async variant of load_state."""
+        if self.async_client is None:
+            return await asyncio.to_thread(self.load_state, flow_uuid)
+
+        cached = self._cached_state(flow_uuid)
+        if cached is not None:
+            return cached
+
+        url = f"{self.base_url}/api/crewai/flows/state"
+        params = {"thread_id": self.thread_id, "flow_uuid": flow_uuid}
+        logging.info(f"Loading flow state from Kagent backend with params: {params}")
+
+        try:
+            state_data = self._parse_state(
+                await self.async_client.get(url, params=params, headers={"X-User-ID": self.user_id})
+            )
         except httpx.HTTPError as e:
             logging.error(f"Error loading flow state from Kagent backend: {e}")
             return None
+        if state_data is not None:
+            self._cache_state(flow_uuid, state_data)
+        return state_data
@@ -0,0 +1,108 @@
+"""Tests for KagentMemoryStorage batching."""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+pytest.importorskip("crewai")
+
+from kagent.crewai._memory import KagentMemoryStorage  # noqa: E402
+
+BASE_URL = "http://kagent.test"
+
+
+class FakeMemoryAPI:
+    """Records the memories written to the controller memory API."""
+
+    def __init__(self):
+        self.saved: list[dict] = []
+        self.posts = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            self.posts += 1
+            body = json.loads(request.content)
+            self.saved.extend(body if isinstance(body, list) else [body])
+            return httpx.Response(201, json={"error": False})
+        if request.method == "GET":
+            return httpx.Response(200, json={"data": self.saved})
+        return httpx.Response(200, json={"error": False})
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self.handle))
+
+    def async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+
+def _save(storage: KagentMemoryStorage, i: int) -> None:
+    storage.save(f"task {i}", {"agent": "a"}, "2025-01-01T00:00:00", 0.5)
+
+
+def _descriptions(api: FakeMemoryAPI) -> list[str]:
+    return [memory["memory_data"]["task_description"] for memory in api.saved]
+
+
+def _run_with_timeout(target) -> None:
+    # A deadlocked save would hang the test run
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "save did not return"
+
+
+def test_saves_are_written_right_away_by_default():
+    api = FakeMemoryAPI()
+    storage = KagentMemoryStorage("thread", "user", BASE_URL, client=api.client())
+
+    _run_with_timeout(lambda: [_save(storage, i) for i in range(3)])
+
+    assert _descriptions(api) == ["task 0", "task 1", "task 2"]
+
+
+def test_saves_are_written_in_batches_and_on_flush():
+    api = FakeMemoryAPI()
+    storage = KagentMemoryStorage("thread", "user", BASE_URL, client=api.client(), batch_size=2)
+
+    _run_with_timeout(lambda: [_save(storage, i) for i in range(3)])
+    assert _descriptions(api) == ["task 0", "task 1"]
+
+    storage.flush()
+    assert _descriptions(api) == ["task 0", "task 1", "task 2"]
+    # One request per batch
+    assert api.posts == 2
+
+
+def test_load_writes_buffered_saves_first():
+    api = FakeMemoryAPI()
+    storage = KagentMemoryStorage("thread", "user", BASE_URL, client=api.client(), batch_size=10)
+    _save(storage, 0)
+
+    assert storage.load("task 0", 5) == [{"metadata": {"agent": "a"}, "datetime": "2025-01-01T00:00:00", "score": 0.5}]
+
+
+@pytest.mark.asyncio
+async def test_aflush_writes_the_buffered_saves_in_one_request():
+    api = FakeMemoryAPI()
+    storage = KagentMemoryStorage(
+        "thread", "user", BASE_URL, client=api.client(), async_client=api.async_client(), batch_size=10
+    )
+    for i in range(3):
+        _save(storage, i)
+    assert api.saved == []
+
+    await storage.aflush()
+    assert _descriptions(api) == ["task 0", "task 1", "task 2"]
+    assert api.posts == 1
+
+    await storage.aflush()
+    assert api.posts == 1
+
+
+def test_storages_without_a_client_share_one_pooled_client():
+    first = KagentMemoryStorage("thread", "user", BASE_URL)
+    second = KagentMemoryStorage("other", "user", BASE_URL)
+
+    assert first.client is second.client
@@ -0,0 +1,96 @@
+"""Tests for KagentFlowPersistence and its state cache."""
+
+import json
+
+import httpx
+import pytest
+
+pytest.importorskip("crewai")
+
+from kagent.core import BoundedCache  # noqa: E402
+from kagent.crewai._state import KagentFlowPersistence  # noqa: E402
+
+BASE_URL = "http://kagent.test"
+
+
+class FakeFlowStateAPI:
+    """Serves flow states like the controller flow state API."""
+
+    def __init__(self):
+        self.states: dict[str, dict] = {}
+        self.requests: list[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "POST":
+            payload = json.loads(request.content)
+            self.states[payload["flow_uuid"]] = payload
+            return httpx.Response(201, json={"error": False})
+        payload = self.states.get(request.url.params["flow_uuid"])
+        if payload is None:
+            return httpx.Response(404, json={"error": True})
+        return httpx.Response(200, json={"data": payload})
+
+    def gets(self) -> int:
+        return sum(1 for r in self.requests if r.method == "GET")
+
+
+def _persistence(api: FakeFlowStateAPI, cache=None) -> KagentFlowPersistence:
+    return KagentFlowPersistence(
+        "thread",
+        "user",
+        BASE_URL,
+        client=httpx.Client(transport=httpx.MockTransport(api.handle)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(api.handle)),
+        cache=cache,
+    )
+
+
+def test_saved_state_is_loaded_from_the_cache():
+    api = FakeFlowStateAPI()
+    persistence = _persistence(api, BoundedCache("flow_state", max_entries=16))
+
+    persistence.save_state("flow-1", "step", {"count": 1})
+    state = persistence.load_state("flow-1")
+
+    assert state == {"count": 1}
+    assert api.gets() == 0
+    # Callers get their own copy
+    state["count"] = 2
+    assert persistence.load_state("flow-1") == {"count": 1}
+
+
+def test_cache_is_shared_between_instances_and_scoped_by_thread():
+    api = FakeFlowStateAPI()
+    cache = BoundedCache("flow_state", max_entries=16)
+    _persistence(api, cache).save_state("flow-1", "step", {"count": 1})
+
+    assert _persistence(api, cache).load_state("flow-1") == {"count": 1}
+    assert api.gets() == 0
+
+    other_thread = KagentFlowPersistence(
+        "other", "user", BASE_URL, client=httpx.Client(transport=httpx.MockTransport(api.handle)), cache=cache
+    )
+    other_thread.load_state("flow-1")
+    assert api.gets() == 1
+
+
+def test_load_without_cache_reads_the_backend():
+    api = FakeFlowStateAPI()
+    persistence = _persistence(api)
+
+    assert persistence.load_state("missing") is None
+    persistence.save_state("flow-1", "step", {"count": 1})
+    assert persistence.load_state("flow-1") == {"count": 1}
+    assert api.gets() == 2
+
+
+@pytest.mark.asyncio
+async def test_async_load_uses_the_cache():
+    api = FakeFlowStateAPI()
+    persistence = _persistence(api, BoundedCache("flow_state", max_entries=16))
+
+    persistence.save_state("flow-1", "step", {"count": 1})
+
+    assert await persistence.aload_state("flow-1") == {"count": 1}
+    assert api.gets() == 0
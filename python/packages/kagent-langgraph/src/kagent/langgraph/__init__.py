@@ -4,8 +4,8 @@ This package provides LangGraph integration for KAgent with A2A server support.
 """
 
 from ._a2a import KAgentApp
-from ._checkpointer import KAgentCheckpointer
+from ._checkpointer import KAgentCheckpointer, KAgentCheckpointerConfig
 from ._executor import LangGraphAgentExecutor
 
-__all__ = ["KAgentApp", "KAgentCheckpointer", "LangGraphAgentExecutor"]
+__all__ = ["KAgentApp", "KAgentCheckpointer", "KAgentCheckpointerConfig", "LangGraphAgentExecutor"]
 __version__ = "0.1.0"
@@ -6,18 +6,25 @@ with A2A protocol support for LangGraph workflows.
 
 import faulthandler
 import logging
+from contextlib import asynccontextmanager
 
-import httpx
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.types import AgentCard
 from fastapi import FastAPI, Request
 from fastapi.responses import PlainTextResponse
 
-from kagent.core import KAgentConfig, configure_tracing
-from kagent.core.a2a import KAgentRequestContextBuilder, KAgentTaskStore
+from kagent.core import HttpClientConfig, KAgentConfig, configure_tracing, create_http_client
+from kagent.core.a2a import (
+    AdmissionController,
+    AdmissionControllerConfig,
+    KAgentRequestContextBuilder,
+    KAgentTaskStore,
+    KAgentTaskStoreConfig,
+)
 from langgraph.graph.state import CompiledStateGraph
 
+from ._checkpointer import KAgentCheckpointer
 from ._executor import LangGraphAgentExecutor, LangGraphAgentExecutorConfig
 
 # --- Configure Logging ---
@@ -53,6 +60,9 @@ class KAgentApp:
         agent_card: AgentCard,
         config: KAgentConfig,
         executor_config: LangGraphAgentExecutorConfig | None = None,
+        task_store_config: KAgentTaskStoreConfig | None = None,
+        http_config: HttpClientConfig | None = None,
+        admission_config: AdmissionControllerConfig | None = None,
         tracing: bool = True,
     ):
         """Initialize the KAgent application.
@@ -62,6 +72,9 @@ class KAgentApp:
             agent_card: Agent card configuration for A2A protocol
             config: KAgent configuration
             executor_config: Optional executor configuration
+            task_store_config: Optional task store configuration
+            http_config: Optional connection pool configuration of the KAgent API client
+            admission_config: Optional limits on the requests executed at once
             tracing: Enable OpenTelemetry tracing/logging via kagent.core.tracing
 
         """
@@ -70,6 +83,9 @@ class KAgentApp:
         self.config = config
 
         self.executor_config = executor_config or LangGraphAgentExecutorConfig()
+        self.task_store_config = task_store_config
+        self.http_config = http_config
+        self.admission_config = admission_config
         self._enable_tracing = tracing
 
     def build(self) -> FastAPI:
@@ -80,17 +96,20 @@ class KAgentApp:
         """
 
         # Create HTTP client for KAgent API
-        http_client = httpx.AsyncClient(base_url=self.config.url)
-
-        # Create agent executor
-        agent_executor = LangGraphAgentExecutor(
-            graph=self._graph,
-            app_name=self.config.app_name,
-            config=self.executor_config,
+        http_client = create_http_client(self.config.url, self.http_config)
+
+        # Create agent executor, limiting the requests it executes at once
+        agent_executor = AdmissionController(
+            LangGraphAgentExecutor(
+                graph=self._graph,
+                app_name=self.config.app_name,
+                config=self.executor_config,
+            ),
+            self.admission_config,
         )
 
         # Create task store
-        task_store = KAgentTaskStore(http_client)
+        task_store = KAgentTaskStore(http_client, self.task_store_config)
 
         # Create request context builder
         request_context_builder = KAgentRequestContextBuilder(task_store=task_store)
@@ -108,6 +127,17 @@ class KAgentApp:
             http_handler=request_handler,
         )
 
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            try:
+                yield
+            finally:
+                # Don't lose debounced task saves or buffered checkpoints on shutdown
+                await task_store.close()
+                if isinstance(self._graph.checkpointer, KAgentCheckpointer):
+                    await self._graph.checkpointer.aflush()
+                await http_client.aclose()
+
         # Enable fault handler for debugging
         faulthandler.enable()
 
@@ -116,6 +146,7 @@ class KAgentApp:
             title=f"KAgent LangGraph: {self.config.app_name}",
             description=f"LangGraph agent with KAgent integration: {self.agent_card.description}",
             version=self.agent_card.version,
+            lifespan=lifespan,
         )
 
         # Configure tracing/instrumentation if enabled
@@ -4,17 +4,22 @@ This module implements a remote checkpointer that calls the KAgent Go service
 for LangGraph checkpoint persistence via HTTP API.
 """
 
+import asyncio
 import base64
 import json
 import logging
 import random
+import threading
 from collections.abc import AsyncIterator, Iterator, Sequence
-from typing import Any, cast, override
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, Literal, cast, override
 
 import httpx
+import ormsgpack
 from langchain_core.runnables import RunnableConfig
-from pydantic import BaseModel
+from pydantic import BaseModel, BeforeValidator, PlainSerializer
 
+from kagent.core import BoundedCache
 from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
     BaseCheckpointSaver,
@@ -29,16 +34,104 @@ from langgraph.checkpoint.base import (
 from langgraph.checkpoint.serde.base import SerializerProtocol
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Prefix of the type_ of checkpoints stored as per-channel blobs
+BLOBS_TYPE_PREFIX = "blobs+"
+
+# Blob of a channel that was updated to an empty value
+_EMPTY_BLOB = ("empty", b"")
+
+
+class _ChainEntry(BaseModel):
+    """Position of a blob checkpoint in its chain and the channel versions it refers to."""
+
+    depth: int
+    channel_versions: dict[str, Any]
+
+
+def _extends(value: list, base: list) -> bool:
+    """Whether value is base with items appended."""
+    return len(value) >= len(base) and all(a is b or a == b for a, b in zip(base, value))
+
+
+def _decode_blob(value: Any) -> Any:
+    # JSON carries blobs base64 encoded, msgpack as raw bytes
+    if isinstance(value, str):
+        return base64.b64decode(value.encode("ascii"))
+    return value
+
+
+def _encode_blob(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+
+# Serialized bytes, base64 encoded as a string in JSON
+Blob = Annotated[bytes, BeforeValidator(_decode_blob), PlainSerializer(_encode_blob, when_used="json")]
+
+
+class KAgentCheckpointerConfig(BaseModel):
+    """Storage, caching and wire format settings of KAgentCheckpointer."""
+
+    # "msgpack" sends checkpoints and writes as raw bytes in a msgpack body instead of
+    # base64 strings in JSON. Falls back to JSON if the controller rejects msgpack.
+    # The kagent controller only decodes JSON bodies so far: against it, the first
+    # request is rejected and every later one is sent as JSON.
+    transport: Literal["json", "msgpack"] = "json"
+
+    # Compress request bodies of at least this many bytes with zstd. Needs the
+    # zstandard package and a controller that decodes zstd bodies, which the kagent
+    # controller does not yet. Disabled if None.
+    compression_threshold: int | None = None
+    compression_level: int = 3
+
+    # Store checkpoints as per-channel blobs and upload only the channels listed in
+    # new_versions. Unchanged channels are resolved by version from earlier checkpoints.
+    delta_checkpoints: bool = False
+
+    # Every this many checkpoints in a chain carries all channel blobs, bounding the
+    # number of parents a read has to fetch
+    keyframe_interval: int = 20
+
+    # Maximum size of the serialized channel blobs kept in process for reassembly
+    blob_cache_max_bytes: int = 64 * 1024 * 1024
+
+    # Keep the latest checkpoint of each thread in process, so runs start without a
+    # controller read. Assumes this process is the only writer of its threads: a
+    # checkpoint another replica stores is not seen until the entry expires.
+    cache_latest: bool = False
+    cache_max_entries: int = 1024
+    cache_ttl: float = 300.0
+
+    # When checkpoints and writes reach the controller. "sync" writes each call before
+    # it returns. "async" buffers them and writes a superstep's writes and the
+    # checkpoint that closes it in the background. "exit" buffers everything until
+    # aflush, which the executor calls when a run ends. Both only defer the writes:
+    # each checkpoint and each set of writes is still its own request. Reads of a
+    # thread write its buffered checkpoints first. A failed background write is
+    # retried by the next flush of its thread, which raises if it fails again.
+    durability: Literal["sync", "async", "exit"] = "sync"
+
+    # Number of checkpoints alist requests per page. Paging needs a controller that
+    # honours the before cursor, which the kagent controller does not yet, so by
+    # default alist fetches the thread in one request.
+    list_page_size: int | None = None
+
 
 class KAgentCheckpointPayload(BaseModel):
     thread_id: str
     checkpoint_ns: str
     checkpoint_id: str
     parent_checkpoint_id: str | None = None
-    checkpoint: str  # Serialized as UTF-8 string, not bytes
-    metadata: str  # Serialized as UTF-8 string, not bytes
+    checkpoint: Blob
+    metadata: Blob
     type_: str
     version: int
 
@@ -47,7 +140,7 @@ class KagentCheckpointWrite(BaseModel):
     idx: int
     channel: str
     type_: str
-    value: str  # Serialized as UTF-8 string, not bytes
+    value: Blob
 
 
 class KAgentCheckpointWritePayload(BaseModel):
@@ -63,8 +156,8 @@ class KAgentCheckpointTuple(BaseModel):
     checkpoint_ns: str
     checkpoint_id: str
     parent_checkpoint_id: str | None = None
-    checkpoint: str  # Serialized as UTF-8 string, not bytes
-    metadata: str  # Serialized as UTF-8 string, not bytes
+    checkpoint: Blob
+    metadata: Blob
     type_: str
     writes: KAgentCheckpointWritePayload | None = None
 
@@ -73,6 +166,27 @@ class KAgentCheckpointTupleResponse(BaseModel):
     data: list[KAgentCheckpointTuple] | None = None
 
 
+def _path(payload: BaseModel) -> str:
+    if isinstance(payload, KAgentCheckpointWritePayload):
+        return "/api/langgraph/checkpoints/writes"
+    return "/api/langgraph/checkpoints"
+
+
+class _ThreadLock:
+    """Write lock of a thread, dropped when no flush uses it."""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class _LatestCheckpoint(BaseModel):
+    """The latest checkpoint of a thread with the writes made against it so far."""
+
+    checkpoint_tuple: KAgentCheckpointTuple
+    writes: list[tuple[str, KagentCheckpointWrite]] = []
+
+
 class KAgentCheckpointer(BaseCheckpointSaver[str]):
     """A remote checkpointer that stores LangGraph state in KAgent via the Go service.
 
@@ -85,17 +199,271 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         client: httpx.AsyncClient,
         app_name: str,
         serde: SerializerProtocol | None = None,
+        config: KAgentCheckpointerConfig | None = None,
     ):
         """Initialize the checkpointer.
 
         Args:
             client: HTTP client configured with KAgent base URL
             app_name: Application name (used for checkpoint namespace if not specified)
+            config: Wire format settings, JSON without compression if None
         """
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
         self.client = client
         self.app_name = app_name
+        self.config = config or KAgentCheckpointerConfig()
+
+        self._binary = self.config.transport == "msgpack"
+        self._compressor = None
+        if self.config.compression_threshold is not None:
+            if zstandard is None:
+                logger.warning("Checkpoint compression requested but the zstandard package is not installed")
+            else:
+                self._compressor = zstandard.ZstdCompressor(level=self.config.compression_level)
+        # Set once the controller accepted a request in the configured format
+        self._negotiated = not self._binary and self._compressor is None
+
+        # Serialized channel values by (user, thread, namespace, channel, version). A blob
+        # of an append-only list holds the appended items and the version it extends.
+        self._blobs: BoundedCache[tuple, tuple] = BoundedCache(
+            "langgraph_channel_blobs",
+            max_bytes=self.config.blob_cache_max_bytes,
+            sizeof=lambda blob: len(blob[1]),
+        )
+        # Chain position of blob checkpoints by (user, thread, namespace, checkpoint id)
+        self._chains: BoundedCache[tuple, _ChainEntry] = BoundedCache("langgraph_checkpoint_chains", max_entries=10_000)
+        # Last uploaded list value and its version by (user, thread, namespace, channel)
+        self._lists: BoundedCache[tuple, tuple[Any, list]] = BoundedCache("langgraph_channel_lists", max_entries=1024)
+
+        # Latest checkpoint by (user, thread, namespace)
+        self._latest: BoundedCache[tuple, _LatestCheckpoint] | None = None
+        if self.config.cache_latest:
+            self._latest = BoundedCache(
+                "langgraph_latest_checkpoints",
+                max_entries=self.config.cache_max_entries,
+                ttl=self.config.cache_ttl,
+            )
+        # Checkpoints and writes not sent yet by (user, thread), in call order
+        self._pending: dict[tuple[str, str], list[KAgentCheckpointPayload | KAgentCheckpointWritePayload]] = {}
+        # Locks serializing the writes of each (user, thread), with their number of users
+        self._flush_locks: dict[tuple[str, str], _ThreadLock] = {}
+        # Running background flushes by (user, thread)
+        self._flush_tasks: dict[tuple[str, str], asyncio.Task] = {}
+        # Cleared if the controller ignores the alist page cursor
+        self._list_cursor_supported = True
+
+        # Event loop the async client, the flush locks and the background flushes are
+        # used on. It also serves the sync methods.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+
+    def _bind_loop(self) -> None:
+        """Make the running loop the one this checkpointer is used on.
+
+        Raises:
+            RuntimeError: If it is used on another loop that is still open
+        """
+        loop = asyncio.get_running_loop()
+        with self._loop_lock:
+            if self._loop is loop:
+                return
+            if self._loop is not None and not self._loop.is_closed():
+                raise RuntimeError(
+                    "KAgentCheckpointer is already used on another event loop, e.g. by synchronous calls made "
+                    "before any async call. Use either the sync or the async methods, or one checkpointer per loop."
+                )
+            self._use_loop(loop)
+
+    def _use_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Locks and tasks of a previous loop can't be used on this one. Buffered
+        # checkpoints are kept and written by the next flush.
+        self._loop = loop
+        self._flush_locks = {}
+        self._flush_tasks = {}
+
+    def _start_loop(self) -> asyncio.AbstractEventLoop:
+        """Start a loop thread for sync calls made while no loop runs the client."""
+        with self._loop_lock:
+            if self._loop is None or not self._loop.is_running():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="kagent-checkpointer", daemon=True).start()
+                self._use_loop(loop)
+            return self._loop
+
+    def _run_sync(self, coro: Any) -> Any:
+        """Run a coroutine of this checkpointer from synchronous code and wait for its result."""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            loop = self._start_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise asyncio.InvalidStateError(
+                "Synchronous calls to KAgentCheckpointer are only allowed from a different thread than the "
+                "event loop it runs on. Use the async methods (e.g. graph.ainvoke) there instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _encode(self, payload: BaseModel) -> tuple[bytes, dict[str, str]]:
+        """Encode a request body in the negotiated format."""
+        if self._binary:
+            body = ormsgpack.packb(payload.model_dump())
+            headers = {"Content-Type": MSGPACK_CONTENT_TYPE}
+        else:
+            body = payload.model_dump_json().encode()
+            headers = {"Content-Type": "application/json"}
+        if self._compressor is not None and len(body) >= self.config.compression_threshold:
+            body = self._compressor.compress(body)
+            headers["Content-Encoding"] = "zstd"
+        return body, headers
+
+    async def _post(self, path: str, payload: BaseModel, user_id: str) -> None:
+        (await self._send(path, payload, user_id)).raise_for_status()
+
+    async def _send(self, path: str, payload: BaseModel, user_id: str) -> httpx.Response:
+        body, headers = self._encode(payload)
+        response = await self.client.post(path, content=body, headers={"X-User-ID": user_id, **headers})
+        if not self._negotiated and response.status_code in (400, 415):
+            # Controllers without binary support can't decode the body, use the plain format from now on
+            logger.warning(
+                "Controller rejected %s checkpoint request (encoding %s), falling back to uncompressed JSON",
+                headers["Content-Type"],
+                headers.get("Content-Encoding", "identity"),
+            )
+            self._binary = False
+            self._compressor = None
+            self._negotiated = True
+            body, headers = self._encode(payload)
+            response = await self.client.post(path, content=body, headers={"X-User-ID": user_id, **headers})
+        if response.is_success:
+            self._negotiated = True
+        return response
+
+    async def _store(self, user_id: str, payload: KAgentCheckpointPayload | KAgentCheckpointWritePayload) -> None:
+        """Send a checkpoint or writes according to the durability mode."""
+        if self.config.durability == "sync":
+            await self._post(_path(payload), payload, user_id)
+            return
+
+        key = (user_id, payload.thread_id)
+        self._pending.setdefault(key, []).append(payload)
+        # A checkpoint closes a superstep: send it and the writes before it
+        if self.config.durability == "async" and isinstance(payload, KAgentCheckpointPayload):
+            task = self._flush_tasks.get(key)
+            if task is None or task.done():
+                self._flush_tasks[key] = asyncio.create_task(self._flush_in_background(key))
+
+    async def _flush_in_background(self, key: tuple[str, str]) -> None:
+        try:
+            await self._write_pending(key)
+        except Exception as e:
+            # Only the run of the thread sees the error, from its next flush if the retry fails too
+            logger.warning(f"Error writing checkpoints of thread {key[1]} to KAgent, retrying on the next flush: {e}")
+        finally:
+            if self._flush_tasks.get(key) is asyncio.current_task():
+                del self._flush_tasks[key]
+
+    async def aflush(self, config: RunnableConfig | None = None) -> None:
+        """Write buffered checkpoints and writes to the controller.
+
+        Args:
+            config: LangGraph runnable config of the thread to write. All threads if None.
+
+        Raises:
+            Exception: The error of the first write that failed. The checkpoints that were
+                not written stay buffered for the next flush.
+        """
+        self._bind_loop()
+        if config is not None:
+            thread_id, user_id, _ = self._extract_config_values(config)
+            keys = [(user_id, thread_id)]
+        else:
+            keys = list(self._pending.keys() | self._flush_tasks.keys())
+        error = None
+        for key in keys:
+            try:
+                await self._flush_thread(key)
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+
+    async def _flush_thread(self, key: tuple[str, str]) -> None:
+        if (task := self._flush_tasks.get(key)) is not None:
+            # Errors of the background flush are retried below
+            await task
+        await self._write_pending(key)
+
+    @asynccontextmanager
+    async def _thread_lock(self, key: tuple[str, str]) -> AsyncIterator[None]:
+        """Hold the write lock of a thread, so flushes of other threads run concurrently."""
+        thread_lock = self._flush_locks.get(key)
+        if thread_lock is None:
+            thread_lock = self._flush_locks[key] = _ThreadLock()
+        thread_lock.users += 1
+        try:
+            async with thread_lock.lock:
+                yield
+        finally:
+            thread_lock.users -= 1
+            if thread_lock.users == 0 and self._flush_locks.get(key) is thread_lock:
+                del self._flush_locks[key]
+
+    async def _write_pending(self, key: tuple[str, str]) -> None:
+        async with self._thread_lock(key):
+            while pending := self._pending.pop(key, None):
+                for i, payload in enumerate(pending):
+                    try:
+                        await self._post(_path(payload), payload, key[0])
+                    except Exception:
+                        # Keep the unwritten ones, in order, for the next flush
+                        self._pending[key] = pending[i:] + self._pending.get(key, [])
+                        raise
+
+    def _cache_latest(self, user_id: str, payload: KAgentCheckpointPayload) -> None:
+        if self._latest is None:
+            return
+        checkpoint_tuple = KAgentCheckpointTuple(**payload.model_dump(exclude={"version"}))
+        self._latest.set(
+            (user_id, payload.thread_id, payload.checkpoint_ns),
+            _LatestCheckpoint(checkpoint_tuple=checkpoint_tuple),
+        )
+
+    def _cache_latest_writes(self, user_id: str, payload: KAgentCheckpointWritePayload) -> None:
+        if self._latest is None:
+            return
+        latest = self._latest.peek((user_id, payload.thread_id, payload.checkpoint_ns))
+        if latest is None or latest.checkpoint_tuple.checkpoint_id != payload.checkpoint_id:
+            return
+        written = {(task_id, write.idx) for task_id, write in latest.writes}
+        latest.writes.extend(
+            (payload.task_id, write) for write in payload.writes if (payload.task_id, write.idx) not in written
+        )
+
+    def _read_headers(self, user_id: str) -> dict[str, str]:
+        headers = {"X-User-ID": user_id}
+        if self._binary:
+            headers["Accept"] = f"{MSGPACK_CONTENT_TYPE}, application/json;q=0.9"
+        return headers
+
+    @staticmethod
+    def _decode_tuple_items(response: httpx.Response) -> list[Any]:
+        """Decode a list response without validating its items."""
+        if response.headers.get("Content-Type", "").startswith(MSGPACK_CONTENT_TYPE):
+            data = ormsgpack.unpackb(response.content)
+        else:
+            data = json.loads(response.content)
+        return data.get("data") or []
+
+    @staticmethod
+    def _decode_tuples(response: httpx.Response) -> KAgentCheckpointTupleResponse:
+        if response.headers.get("Content-Type", "").startswith(MSGPACK_CONTENT_TYPE):
+            return KAgentCheckpointTupleResponse.model_validate(ormsgpack.unpackb(response.content))
+        return KAgentCheckpointTupleResponse.model_validate_json(response.content)
 
     def _extract_config_values(self, config: RunnableConfig) -> tuple[str, str, str]:
         """Extract required values from config.
@@ -139,9 +507,15 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         Returns:
             Updated config with checkpoint ID
         """
+        self._bind_loop()
         thread_id, user_id, checkpoint_ns = self._extract_config_values(config)
 
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        if self.config.delta_checkpoints:
+            type_, serialized_checkpoint = self._dump_blobs(
+                (user_id, thread_id, checkpoint_ns), config, checkpoint, new_versions
+            )
+        else:
+            type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
         # Serialize metadata as JSON (simpler, no type needed)
         serialized_metadata = json.dumps(get_checkpoint_metadata(config, metadata)).encode()
         # Prepare request data
@@ -150,25 +524,15 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
             checkpoint_ns=checkpoint_ns,
             checkpoint_id=checkpoint["id"],
             parent_checkpoint_id=config.get("configurable", {}).get("checkpoint_id"),
-            checkpoint=base64.b64encode(serialized_checkpoint).decode(
-                "ascii"
-            ),  # Base64 encode bytes to string for JSON serialization
-            metadata=base64.b64encode(serialized_metadata).decode(
-                "ascii"
-            ),  # Base64 encode bytes to string for JSON serialization
+            checkpoint=serialized_checkpoint,
+            metadata=serialized_metadata,
             type_=type_,
             version=checkpoint["v"],
         )
 
-        # TODO: Deal with new_versions
-
         # Call the Go service
-        response = await self.client.post(
-            "/api/langgraph/checkpoints",
-            json=request_data.model_dump(),
-            headers={"X-User-ID": user_id},
-        )
-        response.raise_for_status()
+        self._cache_latest(user_id, request_data)
+        await self._store(user_id, request_data)
 
         logger.debug(f"Stored checkpoint {checkpoint['id']} for thread {thread_id}")
 
@@ -189,6 +553,7 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         task_path: str = "",
     ) -> None:
         """Store intermediate writes linked to a checkpoint."""
+        self._bind_loop()
         thread_id, user_id, checkpoint_ns = self._extract_config_values(config)
         checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
         if not checkpoint_id:
@@ -202,9 +567,7 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
                     idx=WRITES_IDX_MAP.get(channel, idx),
                     channel=channel,
                     type_=type_,
-                    value=base64.b64encode(serialized_value).decode(
-                        "ascii"
-                    ),  # Base64 encode bytes to string for JSON serialization
+                    value=serialized_value,
                 )
             )
 
@@ -216,27 +579,192 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
             writes=writes_data,
         )
 
-        response = await self.client.post(
-            "/api/langgraph/checkpoints/writes",
-            json=request_data.model_dump(),
-            headers={"X-User-ID": user_id},
+        self._cache_latest_writes(user_id, request_data)
+        await self._store(user_id, request_data)
+
+        logger.debug(f"Stored writes for checkpoint {checkpoint_id} for thread {thread_id}")
+
+    def _dump_blobs(
+        self,
+        thread_key: tuple[str, str, str],
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        new_versions: ChannelVersions,
+    ) -> tuple[str, bytes]:
+        """Serialize a checkpoint with its channel values stored as separate blobs.
+
+        Only channels in new_versions are included, except for keyframes which carry
+        every channel in full. A list that only grew since the parent checkpoint is
+        stored as the appended items.
+        """
+        parent = None
+        if parent_id := config.get("configurable", {}).get("checkpoint_id"):
+            parent = self._chains.get((*thread_key, parent_id))
+        # Without a known parent chain the checkpoint must stand on its own
+        keyframe = parent is None or parent.depth + 1 >= self.config.keyframe_interval
+        depth = 0 if keyframe else parent.depth + 1
+
+        values = checkpoint["channel_values"]
+        versions = checkpoint["channel_versions"]
+        blobs = {}
+        for channel in versions if keyframe else new_versions:
+            if channel not in values:
+                blob = _EMPTY_BLOB
+            elif isinstance(values[channel], list):
+                blob = self._dump_list(thread_key, channel, values[channel], versions[channel], parent, keyframe)
+            else:
+                blob = self.serde.dumps_typed(values[channel])
+            blobs[channel] = blob
+            self._blobs.set((*thread_key, channel, versions[channel]), blob)
+        self._chains.set((*thread_key, checkpoint["id"]), _ChainEntry(depth=depth, channel_versions=dict(versions)))
+
+        payload = {"checkpoint": {**checkpoint, "channel_values": {}}, "blobs": blobs, "keyframe": keyframe}
+        type_, serialized = self.serde.dumps_typed(payload)
+        return BLOBS_TYPE_PREFIX + type_, serialized
+
+    def _dump_list(
+        self,
+        thread_key: tuple[str, str, str],
+        channel: str,
+        value: list,
+        version: Any,
+        parent: _ChainEntry | None,
+        keyframe: bool,
+    ) -> tuple:
+        last = self._lists.get((*thread_key, channel))
+        self._lists.set((*thread_key, channel), (version, list(value)))
+        # The base must be the parent's version, so that reads find it in the chain
+        if keyframe or last is None or parent.channel_versions.get(channel) != last[0] or not _extends(value, last[1]):
+            return self.serde.dumps_typed(value)
+        return (*self.serde.dumps_typed(value[len(last[1]) :]), last[0])
+
+    def _load_blobs(
+        self, thread_key: tuple[str, str, str], checkpoint_tuple: KAgentCheckpointTuple, blobs: dict[tuple, tuple]
+    ) -> dict[str, Any]:
+        """Deserialize a blob checkpoint, adding its blobs to blobs and the cache."""
+        payload = self.serde.loads_typed(
+            (checkpoint_tuple.type_.removeprefix(BLOBS_TYPE_PREFIX), checkpoint_tuple.checkpoint)
         )
+        versions = payload["checkpoint"]["channel_versions"]
+        for channel, blob in payload["blobs"].items():
+            blobs[(channel, versions[channel])] = tuple(blob)
+            self._blobs.set((*thread_key, channel, versions[channel]), tuple(blob))
+        if payload["keyframe"]:
+            self._chains.set(
+                (*thread_key, checkpoint_tuple.checkpoint_id), _ChainEntry(depth=0, channel_versions=versions)
+            )
+        return payload
+
+    def _resolve(self, thread_key: tuple[str, str, str], channel: str, version: Any, blobs: dict[tuple, tuple]) -> bool:
+        """Whether all blobs needed for a channel version are known, taking cached ones into blobs.
+
+        Blobs are collected for the read, so that evictions while it walks the chain
+        can't lose them.
+        """
+        while True:
+            blob = blobs.get((channel, version)) or self._blobs.get((*thread_key, channel, version))
+            if blob is None:
+                return False
+            blobs[(channel, version)] = blob
+            if len(blob) < 3:
+                return True
+            version = blob[2]
+
+    def _load_value(self, channel: str, version: Any, blobs: dict[tuple, tuple]) -> Any:
+        blob = blobs[(channel, version)]
+        if blob[0] == _EMPTY_BLOB[0]:
+            return None
+        value = self.serde.loads_typed(blob[:2])
+        if len(blob) == 3:
+            return self._load_value(channel, blob[2], blobs) + value
+        return value
+
+    async def _load_checkpoint(self, user_id: str, checkpoint_tuple: KAgentCheckpointTuple) -> Checkpoint:
+        """Deserialize a checkpoint, reassembling its channel values if it is stored as blobs.
+
+        Raises:
+            ValueError: If the stored chain of a blob checkpoint does not hold all its channel values
+        """
+        if not checkpoint_tuple.type_.startswith(BLOBS_TYPE_PREFIX):
+            return self.serde.loads_typed((checkpoint_tuple.type_, checkpoint_tuple.checkpoint))
+
+        thread_key = (user_id, checkpoint_tuple.thread_id, checkpoint_tuple.checkpoint_ns)
+        blobs: dict[tuple, tuple] = {}
+        payload = self._load_blobs(thread_key, checkpoint_tuple, blobs)
+        checkpoint: Checkpoint = payload["checkpoint"]
+        versions = checkpoint["channel_versions"]
+        missing = {channel for channel in versions if not self._resolve(thread_key, channel, versions[channel], blobs)}
+
+        # Walk back to the last keyframe until every channel version has been seen
+        keyframe = payload["keyframe"]
+        parent_id = checkpoint_tuple.parent_checkpoint_id
+        depth = 0
+        while missing and not keyframe and parent_id:
+            parent = await self._fetch_tuple(
+                user_id, checkpoint_tuple.thread_id, checkpoint_tuple.checkpoint_ns, parent_id
+            )
+            if parent is None or not parent.type_.startswith(BLOBS_TYPE_PREFIX):
+                break
+            keyframe = self._load_blobs(thread_key, parent, blobs)["keyframe"]
+            missing = {
+                channel for channel in missing if not self._resolve(thread_key, channel, versions[channel], blobs)
+            }
+            parent_id = parent.parent_checkpoint_id
+            depth += 1
+        if missing:
+            raise ValueError(
+                f"Checkpoint {checkpoint_tuple.checkpoint_id} of thread {checkpoint_tuple.thread_id} can't be "
+                f"restored, its stored chain ends at {parent_id} without channels {sorted(missing)}"
+            )
+        if keyframe:
+            # Later checkpoints of this chain can be stored as deltas again
+            self._chains.set(
+                (*thread_key, checkpoint_tuple.checkpoint_id), _ChainEntry(depth=depth, channel_versions=versions)
+            )
+
+        values = {}
+        for channel, version in versions.items():
+            if (value := self._load_value(channel, version, blobs)) is not None:
+                values[channel] = value
+        checkpoint["channel_values"] = values
+        return checkpoint
+
+    async def _fetch_tuple(
+        self, user_id: str, thread_id: str, checkpoint_ns: str, checkpoint_id: str | None
+    ) -> KAgentCheckpointTuple | None:
+        """Fetch a checkpoint as stored, the latest of the thread if checkpoint_id is None."""
+        # Reads must see buffered checkpoints
+        await self._flush_thread((user_id, thread_id))
+        params = {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "limit": "1"}
+        if checkpoint_id:
+            params["checkpoint_id"] = checkpoint_id
+
+        response = await self.client.get(
+            "/api/langgraph/checkpoints",
+            params=params,
+            headers=self._read_headers(user_id),
+        )
+        if response.status_code == 404:
+            return None
+
         response.raise_for_status()
 
-        logger.debug(f"Stored writes for checkpoint {checkpoint_id} for thread {thread_id}")
+        data = self._decode_tuples(response)
+        return data.data[0] if data.data else None
 
     def _convert_to_checkpoint_tuple(
-        self, config: RunnableConfig, checkpoint_tuple: KAgentCheckpointTuple
+        self,
+        config: RunnableConfig,
+        checkpoint_tuple: KAgentCheckpointTuple,
+        checkpoint: Checkpoint,
+        writes: list[tuple[str, KagentCheckpointWrite]] | None = None,
     ) -> CheckpointTuple:
+        if writes is None and checkpoint_tuple.writes:
+            writes = [(checkpoint_tuple.writes.task_id, write) for write in checkpoint_tuple.writes.writes]
         return CheckpointTuple(
             config=config,
-            checkpoint=self.serde.loads_typed(
-                (checkpoint_tuple.type_, base64.b64decode(checkpoint_tuple.checkpoint.encode("ascii")))
-            ),
-            metadata=cast(
-                CheckpointMetadata,
-                json.loads(base64.b64decode(checkpoint_tuple.metadata.encode("ascii"))),
-            ),
+            checkpoint=checkpoint,
+            metadata=cast(CheckpointMetadata, json.loads(checkpoint_tuple.metadata)),
             parent_config=(
                 {
                     "configurable": {
@@ -250,17 +778,11 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
             ),
             pending_writes=(
                 [
-                    PendingWrite(
-                        (
-                            checkpoint_tuple.writes.task_id,
-                            write.channel,
-                            self.serde.loads_typed((write.type_, base64.b64decode(write.value.encode("ascii")))),
-                        )
-                    )
-                    for write in checkpoint_tuple.writes.writes
+                    PendingWrite((task_id, write.channel, self.serde.loads_typed((write.type_, write.value))))
+                    for task_id, write in writes
                 ]
             )
-            if checkpoint_tuple.writes
+            if writes
             else None,
         )
 
@@ -274,29 +796,33 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         Returns:
             CheckpointTuple if found, None otherwise
         """
+        self._bind_loop()
         thread_id, user_id, checkpoint_ns = self._extract_config_values(config)
+        checkpoint_id = get_checkpoint_id(config)
+
+        if self._latest is not None:
+            latest = self._latest.get((user_id, thread_id, checkpoint_ns))
+            if latest is not None and checkpoint_id in (None, latest.checkpoint_tuple.checkpoint_id):
+                checkpoint_tuple = latest.checkpoint_tuple
+                return self._convert_to_checkpoint_tuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_tuple.checkpoint_id,
+                        }
+                    }
+                    if not checkpoint_id
+                    else config,
+                    checkpoint_tuple,
+                    await self._load_checkpoint(user_id, checkpoint_tuple),
+                    list(latest.writes),
+                )
 
-        params = {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "limit": "1"}
-        if checkpoint_id := get_checkpoint_id(config):
-            params["checkpoint_id"] = checkpoint_id
-
-        response = await self.client.get(
-            "/api/langgraph/checkpoints",
-            params=params,
-            headers={"X-User-ID": user_id},
-        )
-        if response.status_code == 404:
-            return None
-
-        response.raise_for_status()
-
-        data = KAgentCheckpointTupleResponse.model_validate_json(response.text)
-
-        if not data.data:
+        checkpoint_tuple = await self._fetch_tuple(user_id, thread_id, checkpoint_ns, checkpoint_id)
+        if checkpoint_tuple is None:
             return None
 
-        checkpoint_tuple = data.data[0]
-
         if not checkpoint_id:
             config = {
                 "configurable": {
@@ -306,7 +832,19 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
                 }
             }
 
-        return self._convert_to_checkpoint_tuple(config, checkpoint_tuple)
+            if self._latest is not None:
+                self._latest.set(
+                    (user_id, thread_id, checkpoint_ns),
+                    _LatestCheckpoint(
+                        checkpoint_tuple=checkpoint_tuple.model_copy(update={"writes": None}),
+                        writes=[(checkpoint_tuple.writes.task_id, write) for write in checkpoint_tuple.writes.writes]
+                        if checkpoint_tuple.writes
+                        else [],
+                    ),
+                )
+
+        checkpoint = await self._load_checkpoint(user_id, checkpoint_tuple)
+        return self._convert_to_checkpoint_tuple(config, checkpoint_tuple, checkpoint)
 
     @override
     async def alist(
@@ -317,11 +855,14 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         before: RunnableConfig | None = None,
         limit: int | None = None,
     ) -> AsyncIterator[CheckpointTuple]:
-        """List checkpoints for a thread.
+        """List checkpoints for a thread, newest first.
+
+        Checkpoints are decoded as the caller reaches them, and requested in pages
+        if list_page_size is set.
 
         Args:
             config: LangGraph runnable config
-            filter: Optional filter criteria (not implemented)
+            filter: Only return checkpoints whose metadata has these values
             before: Return checkpoints before this config
             limit: Maximum number of checkpoints to return
 
@@ -331,23 +872,78 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         if not config:
             raise ValueError("config is required")
 
+        self._bind_loop()
         thread_id, user_id, checkpoint_ns = self._extract_config_values(config)
+        thread_key = (user_id, thread_id, checkpoint_ns)
+        before_id = get_checkpoint_id(before) if before else None
+
+        await self._flush_thread((user_id, thread_id))
+
+        remaining = limit or None
+        cursor = before_id
+        while True:
+            paged = self.config.list_page_size is not None and self._list_cursor_supported
+            if paged:
+                page_size = self.config.list_page_size
+                if remaining is not None and not filter:
+                    page_size = min(page_size, remaining)
+            else:
+                # Without a cursor only the first page can be requested: fetch it all, unless
+                # the controller's limit applies as is
+                page_size = remaining if remaining is not None and not filter and not cursor else -1
+            params = {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "limit": str(page_size)}
+            if cursor and paged:
+                params["before"] = cursor
+            if filter:
+                params["metadata"] = json.dumps(filter)
+
+            response = await self.client.get(
+                "/api/langgraph/checkpoints",
+                params=params,
+                headers=self._read_headers(user_id),
+            )
+            response.raise_for_status()
+            items = self._decode_tuple_items(response)
+
+            if cursor and paged and items and items[0]["checkpoint_id"] >= cursor:
+                logger.info("Controller does not support paged checkpoint lists, fetching whole threads")
+                self._list_cursor_supported = False
+                continue
+
+            if self.config.delta_checkpoints:
+                # Blobs of the page's checkpoints resolve each other without fetching parents
+                for item in items:
+                    if item["type_"].startswith(BLOBS_TYPE_PREFIX):
+                        self._load_blobs(thread_key, KAgentCheckpointTuple.model_validate(item), {})
+
+            for item in items:
+                # Filters are applied here too, in case the controller ignored them
+                if cursor and item["checkpoint_id"] >= cursor:
+                    continue
+                checkpoint_tuple = KAgentCheckpointTuple.model_validate(item)
+                metadata = json.loads(checkpoint_tuple.metadata)
+                if filter and any(metadata.get(key) != value for key, value in filter.items()):
+                    continue
+                checkpoint = await self._load_checkpoint(user_id, checkpoint_tuple)
+                yield self._convert_to_checkpoint_tuple(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_tuple.checkpoint_id,
+                        }
+                    },
+                    checkpoint_tuple,
+                    checkpoint,
+                )
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
 
-        # Return all checkpoints if limit is not specified
-        limit = limit if limit else -1
-
-        response = await self.client.get(
-            "/api/langgraph/checkpoints",
-            params={"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "limit": str(limit)},
-            headers={"X-User-ID": user_id},
-        )
-        response.raise_for_status()
-
-        data = KAgentCheckpointTupleResponse.model_validate_json(response.text)
-
-        if data.data:
-            for checkpoint_tuple in data.data:
-                yield self._convert_to_checkpoint_tuple(config, checkpoint_tuple)
+            if page_size < 0 or len(items) < page_size:
+                return
+            cursor = items[-1]["checkpoint_id"]
 
     def get_next_version(self, current: str | None, channel: None) -> str:
         """Generate the next version ID for a channel.
@@ -370,7 +966,14 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         next_h = random.random()
         return f"{next_v:032}.{next_h:016}"
 
-    # Synchronous methods (delegate to async versions)
+    # Synchronous methods, run on the event loop of the async client so they share its
+    # connection pool. They must be called from a thread other than that loop's. If no
+    # loop runs the client, they start their own, and async calls from other loops are
+    # refused while it is open.
+    def flush(self, config: RunnableConfig | None = None) -> None:
+        """Synchronous version of aflush."""
+        self._run_sync(self.aflush(config))
+
     @override
     def put(
         self,
@@ -380,7 +983,7 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         new_versions: ChannelVersions,
     ) -> RunnableConfig:
         """Synchronous version of aput."""
-        raise NotImplementedError("Use async version (aput) instead")
+        return self._run_sync(self.aput(config, checkpoint, metadata, new_versions))
 
     @override
     def put_writes(
@@ -390,13 +993,13 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         task_id: str,
         task_path: str = "",
     ) -> None:
-        """Store intermediate writes linked to a checkpoint."""
-        raise NotImplementedError("Not implemented")
+        """Synchronous version of aput_writes."""
+        self._run_sync(self.aput_writes(config, writes, task_id, task_path))
 
     @override
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Synchronous version of aget_tuple."""
-        raise NotImplementedError("Use async version (aget_tuple) instead")
+        return self._run_sync(self.aget_tuple(config))
 
     @override
     def list(
@@ -408,4 +1011,13 @@ class KAgentCheckpointer(BaseCheckpointSaver[str]):
         limit: int | None = None,
     ) -> Iterator[CheckpointTuple]:
         """Synchronous version of alist."""
-        raise NotImplementedError("Use async version (alist) instead")
+        iterator = self.alist(config, filter=filter, before=before, limit=limit)
+        try:
+            while True:
+                try:
+                    yield self._run_sync(anext(iterator))
+                except StopAsyncIteration:
+                    break
+        finally:
+            # Also when the caller stops early, so the generator doesn't wait for garbage collection on the loop
+            self._run_sync(iterator.aclose())
@@ -5,15 +5,20 @@ within the A2A (Agent-to-Agent) protocol, converting graph events to A2A events.
 """
 
 import hashlib
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
 from a2a.types import (
+    Artifact,
     DataPart,
     Message,
     Part,
     Role,
+    TaskArtifactUpdateEvent,
     TaskState,
     TaskStatus,
     TaskStatusUpdateEvent,
@@ -21,6 +26,7 @@ from a2a.types import (
 )
 from langchain_core.messages import (
     AIMessage,
+    AIMessageChunk,
     HumanMessage,
     ToolMessage,
 )
@@ -35,16 +41,158 @@ from kagent.core.a2a import (
 from ._metadata_utils import get_rich_event_metadata
 
 
+def _content_hash(message: Any) -> str:
+    msg_content = f"{type(message).__name__}:{message.content}"
+    if hasattr(message, "tool_calls") and message.tool_calls:
+        msg_content += f":tools:{len(message.tool_calls)}"
+    return hashlib.md5(msg_content.encode()).hexdigest()
+
+
+class MessageDeduplicator:
+    """Remembers which messages of a graph run were already converted.
+
+    Messages are recognized by id. Messages a node already returned in its previous
+    update, e.g. when it returns its whole message list, are skipped by position.
+    Only messages without an id are hashed, and at most max_hashes hashes are kept.
+    """
+
+    def __init__(self, max_hashes: int = 1024):
+        self._ids: set[str] = set()
+        # Length and last message of each node's previous update
+        self._node_updates: dict[str, tuple[int, Any]] = {}
+        self._hashes: OrderedDict[str, None] = OrderedDict()
+        self._max_hashes = max_hashes
+
+    def new_messages(self, node_name: str, messages: list[Any]) -> list[Any]:
+        """Return the messages of a node update that were not converted before."""
+        start = 0
+        if previous := self._node_updates.get(node_name):
+            length, last = previous
+            if len(messages) >= length and messages[length - 1] is last:
+                start = length
+        if messages:
+            self._node_updates[node_name] = (len(messages), messages[-1])
+        return [message for message in messages[start:] if self._add(message)]
+
+    def _add(self, message: Any) -> bool:
+        if message_id := getattr(message, "id", None):
+            if message_id in self._ids:
+                return False
+            self._ids.add(message_id)
+            return True
+
+        digest = _content_hash(message)
+        if digest in self._hashes:
+            self._hashes.move_to_end(digest)
+            return False
+        self._hashes[digest] = None
+        if len(self._hashes) > self._max_hashes:
+            self._hashes.popitem(last=False)
+        return True
+
+
+# Marks that no streamed message is in progress; chunk ids may be None
+_NO_MESSAGE = object()
+
+
+class TokenChunkCoalescer:
+    """Turns the LLM token chunks of a graph run into partial A2A artifact updates.
+
+    All partial updates go to one artifact, which the caller replaces with the final
+    result, or clears if there is none. The first chunk of each streamed message
+    replaces the artifact's parts and is published right away, so the first token is
+    not held back. Following chunks are merged for up to window seconds or max_bytes
+    and appended. Only the text the converter puts into the final message is
+    streamed, i.e. string content of AI messages; tool call chunks are skipped.
+
+    Args:
+        task_id: A2A task the updates belong to.
+        context_id: A2A context of the task.
+        artifact_id: Artifact the partial text is streamed to.
+        window: Seconds to merge chunks for, counted from the first held chunk. 0 publishes every chunk.
+        max_bytes: Publish the merged text as soon as it reaches this many bytes.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        context_id: str,
+        artifact_id: str,
+        window: float,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._task_id = task_id
+        self._context_id = context_id
+        self._artifact_id = artifact_id
+        self._window = window
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._message_id: Any = _NO_MESSAGE
+        self._texts: list[str] = []
+        self._bytes = 0
+        self._started_at = 0.0
+        self._published = False
+
+    @property
+    def published(self) -> bool:
+        """Whether any update was returned, i.e. the artifact was created."""
+        return self._published
+
+    def add(self, chunk: Any) -> list[TaskArtifactUpdateEvent]:
+        """Add a chunk of the messages stream, returning the updates that are ready to be published."""
+        if not isinstance(chunk, AIMessageChunk) or not isinstance(chunk.content, str) or not chunk.content:
+            return []
+
+        if chunk.id != self._message_id:
+            ready = self.flush()
+            self._message_id = chunk.id
+            ready.append(self._update(chunk.content, append=False))
+            return ready
+
+        if not self._texts:
+            self._started_at = self._clock()
+        self._texts.append(chunk.content)
+        self._bytes += len(chunk.content.encode())
+        if self._bytes >= self._max_bytes or self._clock() - self._started_at >= self._window:
+            return self._release()
+        return []
+
+    def flush(self) -> list[TaskArtifactUpdateEvent]:
+        """Release the held text, if any. The next chunk starts a new message."""
+        ready = self._release()
+        self._message_id = _NO_MESSAGE
+        return ready
+
+    def _release(self) -> list[TaskArtifactUpdateEvent]:
+        if not self._texts:
+            return []
+        text = "".join(self._texts)
+        self._texts = []
+        self._bytes = 0
+        return [self._update(text, append=True)]
+
+    def _update(self, text: str, append: bool) -> TaskArtifactUpdateEvent:
+        self._published = True
+        return TaskArtifactUpdateEvent(
+            task_id=self._task_id,
+            context_id=self._context_id,
+            append=append,
+            last_chunk=False,
+            artifact=Artifact(artifact_id=self._artifact_id, parts=[Part(TextPart(text=text))]),
+        )
+
+
 async def _convert_langgraph_event_to_a2a(
     langgraph_event: dict[str, Any],
     task_id: str,
     context_id: str,
     app_name: str,
-    sent_message_ids: set[str],
+    sent_messages: MessageDeduplicator,
 ) -> list[TaskStatusUpdateEvent]:
     """Convert a LangGraph event to A2A events.
 
-    Deduplicates messages using sent_message_ids to avoid replaying history.
+    Deduplicates messages using sent_messages to avoid replaying history.
     """
     a2a_events: list[TaskStatusUpdateEvent] = []
 
@@ -57,17 +205,7 @@ async def _convert_langgraph_event_to_a2a(
         if not isinstance(messages, list):
             continue
 
-        for message in messages:
-            # Deduplicate using content hash (message.id is often None)
-            msg_content = f"{type(message).__name__}:{message.content}"
-            if hasattr(message, "tool_calls") and message.tool_calls:
-                msg_content += f":tools:{len(message.tool_calls)}"
-            msg_id = hashlib.md5(msg_content.encode()).hexdigest()
-
-            if msg_id in sent_message_ids:
-                continue
-            sent_message_ids.add(msg_id)
-
+        for message in sent_messages.new_messages(node_name, messages):
             if isinstance(message, AIMessage):
                 # Handle AI messages (assistant responses)
                 a2a_message = Message(message_id=str(uuid.uuid4()), role=Role.agent, parts=[])
@@ -30,6 +30,7 @@ from pydantic import BaseModel
 
 from kagent.core.a2a import (
     KAGENT_HITL_DECISION_TYPE_DENY,
+    TaskCancellationRegistry,
     TaskResultAggregator,
     ToolApprovalRequest,
     extract_decision_from_message,
@@ -40,7 +41,8 @@ from kagent.core.a2a import (
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 
-from ._converters import _convert_langgraph_event_to_a2a
+from ._checkpointer import KAgentCheckpointer
+from ._converters import MessageDeduplicator, TokenChunkCoalescer, _convert_langgraph_event_to_a2a
 from ._error_mappings import get_error_metadata, get_user_friendly_error_message
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,19 @@ class LangGraphAgentExecutorConfig(BaseModel):
     # Whether to stream intermediate results
     enable_streaming: bool = True
 
+    # Stream LLM tokens as partial artifact updates while a node runs, in addition to
+    # the messages of finished nodes. The final message is the same either way. Runs
+    # the graph with the "messages" stream mode, which adds callback overhead to every
+    # LLM call.
+    stream_tokens: bool = False
+
+    # Merge streamed tokens for up to this many seconds before publishing them.
+    # 0 publishes every token chunk. The first token of a message is never held back.
+    partial_event_window: float = 0.1
+
+    # Publish merged tokens as soon as they reach this many bytes
+    partial_event_max_bytes: int = 4096
+
 
 class LangGraphAgentExecutor(AgentExecutor):
     """An AgentExecutor that runs LangGraph workflows against A2A requests.
@@ -81,6 +96,7 @@ class LangGraphAgentExecutor(AgentExecutor):
         self._graph = graph
         self.app_name = app_name
         self._config = config or LangGraphAgentExecutorConfig()
+        self._cancellations = TaskCancellationRegistry()
 
     def _create_graph_config(self, context: RequestContext) -> RunnableConfig:
         """Create LangGraph config from A2A request context."""
@@ -124,28 +140,60 @@ class LangGraphAgentExecutor(AgentExecutor):
         # Track final state for interrupt detection
         final_state: dict[str, Any] | None = None
 
-        # Track message IDs we've already sent to avoid duplicates
-        sent_message_ids: set[str] = set()
+        # Track messages we've already sent to avoid duplicates
+        sent_messages = MessageDeduplicator()
+
+        # Streamed tokens and the final result go to the same artifact, so the
+        # final result replaces the partial text in the task
+        artifact_id = str(uuid.uuid4())
+        coalescer: TokenChunkCoalescer | None = None
+        stream_mode: Any = "updates"
+        if self._config.stream_tokens:
+            coalescer = TokenChunkCoalescer(
+                context.task_id,
+                context.context_id,
+                artifact_id,
+                self._config.partial_event_window,
+                self._config.partial_event_max_bytes,
+            )
+            stream_mode = ["messages", "updates"]
 
         # Stream events from the graph
-        async for event in graph.astream(
-            input_data,
-            config,
-            stream_mode="updates",
-        ):
-            # Store final state
-            final_state = event
-
-            # Convert LangGraph events to A2A events
-            a2a_events = await _convert_langgraph_event_to_a2a(
-                event, context.task_id, context.context_id, self.app_name, sent_message_ids
-            )
-            for a2a_event in a2a_events:
-                task_result_aggregator.process_event(a2a_event)
-                await event_queue.enqueue_event(a2a_event)
+        try:
+            async for item in graph.astream(input_data, config, stream_mode=stream_mode):
+                if coalescer is not None:
+                    mode, item = item
+                    if mode == "messages":
+                        # Partial text is only a preview and is not aggregated
+                        for update in coalescer.add(item[0]):
+                            await event_queue.enqueue_event(update)
+                        continue
+                    for update in coalescer.flush():
+                        await event_queue.enqueue_event(update)
+                event = item
+
+                # Store final state
+                final_state = event
+
+                # Convert LangGraph events to A2A events
+                a2a_events = await _convert_langgraph_event_to_a2a(
+                    event, context.task_id, context.context_id, self.app_name, sent_messages
+                )
+                for a2a_event in a2a_events:
+                    task_result_aggregator.process_event(a2a_event)
+                    await event_queue.enqueue_event(a2a_event)
+            if coalescer is not None:
+                for update in coalescer.flush():
+                    await event_queue.enqueue_event(update)
+        except BaseException:
+            await self._close_partial_artifact(coalescer, artifact_id, context, event_queue)
+            await self._flush_checkpoints(graph, config, failed=True)
+            raise
+        await self._flush_checkpoints(graph, config)
 
         # Check for interrupts after streaming completes
         if final_state and final_state.get("__interrupt__"):
+            await self._close_partial_artifact(coalescer, artifact_id, context, event_queue)
             interrupt_data = final_state["__interrupt__"]
             await self._handle_interrupt(
                 interrupt_data=interrupt_data,
@@ -173,7 +221,7 @@ class LangGraphAgentExecutor(AgentExecutor):
                     last_chunk=True,
                     context_id=context.context_id,
                     artifact=Artifact(
-                        artifact_id=str(uuid.uuid4()),
+                        artifact_id=artifact_id,
                         parts=task_result_aggregator.task_status_message.parts,
                     ),
                 )
@@ -191,6 +239,7 @@ class LangGraphAgentExecutor(AgentExecutor):
                 )
             )
         else:
+            await self._close_partial_artifact(coalescer, artifact_id, context, event_queue)
             await event_queue.enqueue_event(
                 TaskStatusUpdateEvent(
                     task_id=context.task_id,
@@ -204,6 +253,39 @@ class LangGraphAgentExecutor(AgentExecutor):
                 )
             )
 
+    async def _close_partial_artifact(
+        self,
+        coalescer: TokenChunkCoalescer | None,
+        artifact_id: str,
+        context: RequestContext,
+        event_queue: EventQueue,
+    ) -> None:
+        """Clear and close the artifact tokens were streamed to, for runs that end without a final result."""
+        if coalescer is None or not coalescer.published:
+            return
+        await event_queue.enqueue_event(
+            TaskArtifactUpdateEvent(
+                task_id=context.task_id,
+                last_chunk=True,
+                context_id=context.context_id,
+                artifact=Artifact(artifact_id=artifact_id, parts=[]),
+            )
+        )
+
+    async def _flush_checkpoints(self, graph: CompiledStateGraph, config: RunnableConfig, failed: bool = False) -> None:
+        """Store the checkpoints buffered by the checkpointer's durability mode before the task ends.
+
+        If the run failed, errors are logged so that they don't replace the run's error.
+        """
+        if not isinstance(graph.checkpointer, KAgentCheckpointer):
+            return
+        try:
+            await graph.checkpointer.aflush(config)
+        except Exception:
+            if not failed:
+                raise
+            logger.error("Error storing the checkpoints of a failed run", exc_info=True)
+
     async def _handle_interrupt(
         self,
         interrupt_data: list[Any],
@@ -259,9 +341,8 @@ class LangGraphAgentExecutor(AgentExecutor):
 
     @override
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
-        """Cancel the execution."""
-        # TODO: Implement proper cancellation logic if needed
-        raise NotImplementedError("Cancellation is not implemented")
+        """Cancel the running graph execution of the task and publish its canceled status."""
+        await self._cancellations.cancel(context.task_id, context.context_id, event_queue)
 
     def _is_resume_command(self, context: RequestContext) -> bool:
         """Check if message is a resume command for an interrupted task.
@@ -386,6 +467,14 @@ class LangGraphAgentExecutor(AgentExecutor):
         event_queue: EventQueue,
     ):
         """Execute the LangGraph workflow and publish updates to the event queue."""
+        async with self._cancellations.track(context.task_id, context.context_id, event_queue):
+            await self._execute(context, event_queue)
+
+    async def _execute(
+        self,
+        context: RequestContext,
+        event_queue: EventQueue,
+    ):
         if not context.message:
             raise ValueError("A2A request must have a message")
 
@@ -0,0 +1,588 @@
+"""Tests for KAgentCheckpointer against an in-memory controller checkpoint API."""
+
+import asyncio
+import json
+
+import httpx
+import ormsgpack
+import pytest
+import zstandard
+from langgraph.checkpoint.base import empty_checkpoint
+
+from kagent.langgraph import KAgentCheckpointer
+from kagent.langgraph._checkpointer import (
+    MSGPACK_CONTENT_TYPE,
+    KAgentCheckpointerConfig,
+    KAgentCheckpointPayload,
+    KAgentCheckpointTuple,
+    KAgentCheckpointWritePayload,
+)
+
+
+class FakeCheckpointAPI:
+    """In-memory fake of the controller LangGraph checkpoint API.
+
+    Args:
+        binary: Whether msgpack and zstd request bodies are understood. Without it
+            they fail to decode as JSON, like on controllers that predate them.
+        cursor: Whether list requests honour the before cursor.
+    """
+
+    def __init__(self, binary: bool = True, cursor: bool = True):
+        self.binary = binary
+        self.cursor = cursor
+        self.checkpoints: list[KAgentCheckpointTuple] = []
+        # Threads whose writes fail as if the controller was unavailable
+        self.failing_threads: set[str] = set()
+        self.requests: list[httpx.Request] = []
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url="http://kagent.test", transport=httpx.MockTransport(self.handle))
+
+    def writes(self) -> list[httpx.Request]:
+        return [r for r in self.requests if r.method == "POST"]
+
+    def reads(self) -> list[httpx.Request]:
+        return [r for r in self.requests if r.method == "GET"]
+
+    def stored(self, thread_id: str = "thread-1") -> list[str]:
+        return [c.checkpoint_id for c in self.checkpoints if c.thread_id == thread_id]
+
+    def _decode(self, request: httpx.Request) -> dict | None:
+        body = request.content
+        binary = request.headers.get("Content-Encoding") == "zstd" or request.headers["Content-Type"].startswith(
+            MSGPACK_CONTENT_TYPE
+        )
+        if binary and not self.binary:
+            return None
+        if request.headers.get("Content-Encoding") == "zstd":
+            body = zstandard.ZstdDecompressor().decompress(body)
+        if request.headers["Content-Type"].startswith(MSGPACK_CONTENT_TYPE):
+            return ormsgpack.unpackb(body)
+        return json.loads(body)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if request.method == "POST" and path in ("/api/langgraph/checkpoints", "/api/langgraph/checkpoints/writes"):
+            data = self._decode(request)
+            if data is None:
+                return httpx.Response(400, json={"error": True, "message": "invalid request body"})
+            if data["thread_id"] in self.failing_threads:
+                return httpx.Response(503, json={"error": True, "message": "unavailable"})
+            if path.endswith("/writes"):
+                writes = KAgentCheckpointWritePayload.model_validate(data)
+                for checkpoint in self.checkpoints:
+                    if checkpoint.checkpoint_id == writes.checkpoint_id:
+                        checkpoint.writes = writes
+            else:
+                payload = KAgentCheckpointPayload.model_validate(data)
+                self.checkpoints.append(KAgentCheckpointTuple(**payload.model_dump(exclude={"version"})))
+            return httpx.Response(201, json={"error": False})
+        if request.method == "GET" and path == "/api/langgraph/checkpoints":
+            return self._list(request)
+        return httpx.Response(404, text="404 page not found")
+
+    def _list(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        items = [
+            c
+            for c in self.checkpoints
+            if c.thread_id == params["thread_id"] and c.checkpoint_ns == params.get("checkpoint_ns", "")
+        ]
+        items.sort(key=lambda c: c.checkpoint_id, reverse=True)
+        if checkpoint_id := params.get("checkpoint_id"):
+            items = [c for c in items if c.checkpoint_id == checkpoint_id]
+        if self.cursor and (before := params.get("before")):
+            items = [c for c in items if c.checkpoint_id < before]
+        if (limit := int(params.get("limit", "-1"))) >= 0:
+            items = items[:limit]
+        if not items and params.get("checkpoint_id"):
+            return httpx.Response(404, json={"error": True, "message": "checkpoint not found"})
+
+        if MSGPACK_CONTENT_TYPE in request.headers.get("Accept", "") and self.binary:
+            content = ormsgpack.packb({"data": [c.model_dump() for c in items]})
+            return httpx.Response(200, content=content, headers={"Content-Type": MSGPACK_CONTENT_TYPE})
+        return httpx.Response(200, json={"data": [c.model_dump(mode="json") for c in items]})
+
+
+def _config(checkpoint_id: str | None = None, thread_id: str = "thread-1") -> dict:
+    configurable = {"thread_id": thread_id, "user_id": "user", "checkpoint_ns": ""}
+    if checkpoint_id:
+        configurable["checkpoint_id"] = checkpoint_id
+    return {"configurable": configurable}
+
+
+def _checkpoint(messages: list[str]) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"messages": messages}
+    checkpoint["channel_versions"] = {"messages": len(messages)}
+    return checkpoint
+
+
+async def _put(checkpointer: KAgentCheckpointer, messages: list[str], parent_id: str | None = None) -> dict:
+    return await checkpointer.aput(_config(parent_id), _checkpoint(messages), {"step": len(messages)}, {"messages": 1})
+
+
+@pytest.mark.asyncio
+async def test_json_transport_round_trips_checkpoints_and_writes():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app")
+
+    config = await _put(checkpointer, ["hi"])
+    await checkpointer.aput_writes(config, [("messages", "pending")], "task-1")
+    checkpoint_tuple = await checkpointer.aget_tuple(_config())
+
+    assert api.writes()[0].headers["Content-Type"] == "application/json"
+    assert checkpoint_tuple.checkpoint["channel_values"] == {"messages": ["hi"]}
+    assert checkpoint_tuple.metadata["step"] == 1
+    assert checkpoint_tuple.pending_writes == [("task-1", "messages", "pending")]
+
+
+@pytest.mark.asyncio
+async def test_msgpack_transport_with_compression_round_trips():
+    api = FakeCheckpointAPI()
+    config = KAgentCheckpointerConfig(transport="msgpack", compression_threshold=0)
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+
+    await _put(checkpointer, ["x" * 1000])
+    checkpoint_tuple = await checkpointer.aget_tuple(_config())
+
+    request = api.writes()[0]
+    assert request.headers["Content-Type"] == MSGPACK_CONTENT_TYPE
+    assert request.headers["Content-Encoding"] == "zstd"
+    assert MSGPACK_CONTENT_TYPE in api.reads()[0].headers["Accept"]
+    assert checkpoint_tuple.checkpoint["channel_values"] == {"messages": ["x" * 1000]}
+
+
+@pytest.mark.asyncio
+async def test_small_bodies_are_not_compressed():
+    api = FakeCheckpointAPI()
+    config = KAgentCheckpointerConfig(transport="msgpack", compression_threshold=1 << 20)
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+
+    await _put(checkpointer, ["hi"])
+
+    assert "Content-Encoding" not in api.writes()[0].headers
+
+
+@pytest.mark.asyncio
+async def test_rejected_binary_request_falls_back_to_json_for_good():
+    api = FakeCheckpointAPI(binary=False)
+    config = KAgentCheckpointerConfig(transport="msgpack", compression_threshold=0)
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+
+    first = await _put(checkpointer, ["a"])
+    await _put(checkpointer, ["a", "b"], first["configurable"]["checkpoint_id"])
+    checkpoint_tuple = await checkpointer.aget_tuple(_config())
+
+    content_types = [r.headers["Content-Type"] for r in api.writes()]
+    assert content_types == [MSGPACK_CONTENT_TYPE, "application/json", "application/json"]
+    assert "Content-Encoding" not in api.writes()[-1].headers
+    assert checkpoint_tuple.checkpoint["channel_values"] == {"messages": ["a", "b"]}
+
+
+@pytest.mark.asyncio
+async def test_errors_after_negotiation_do_not_change_the_format():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(transport="msgpack"))
+    await _put(checkpointer, ["a"])
+
+    api.binary = False
+    with pytest.raises(httpx.HTTPStatusError):
+        await _put(checkpointer, ["a", "b"])
+
+    assert [r.headers["Content-Type"] for r in api.writes()] == [MSGPACK_CONTENT_TYPE, MSGPACK_CONTENT_TYPE]
+
+
+async def _put_chain(checkpointer: KAgentCheckpointer, count: int) -> list[str]:
+    ids = []
+    parent_id = None
+    for i in range(count):
+        config = await _put(checkpointer, [str(n) for n in range(i + 1)], parent_id)
+        parent_id = config["configurable"]["checkpoint_id"]
+        ids.append(parent_id)
+    return ids
+
+
+async def _list_ids(checkpointer: KAgentCheckpointer, **kwargs) -> list[str]:
+    return [t.config["configurable"]["checkpoint_id"] async for t in checkpointer.alist(_config(), **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_alist_fetches_the_thread_in_one_request_by_default():
+    api = FakeCheckpointAPI(cursor=False)
+    checkpointer = KAgentCheckpointer(api.client(), "app")
+    ids = await _put_chain(checkpointer, 5)
+
+    assert await _list_ids(checkpointer) == ids[::-1]
+    assert await _list_ids(checkpointer, before=_config(ids[3]), limit=2) == ids[2:0:-1]
+    assert [r.url.params["limit"] for r in api.reads()] == ["-1", "-1"]
+    assert all("before" not in r.url.params for r in api.reads())
+
+
+@pytest.mark.asyncio
+async def test_alist_pages_with_the_before_cursor():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(list_page_size=2))
+    ids = await _put_chain(checkpointer, 5)
+
+    listed = await _list_ids(checkpointer)
+
+    assert listed == ids[::-1]
+    pages = [dict(r.url.params) for r in api.reads()]
+    assert [p["limit"] for p in pages] == ["2", "2", "2"]
+    assert [p.get("before") for p in pages] == [None, ids[3], ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_alist_requests_only_the_pages_it_yields():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(list_page_size=2))
+    ids = await _put_chain(checkpointer, 5)
+
+    async for _ in checkpointer.alist(_config()):
+        break
+    assert len(api.reads()) == 1
+
+    assert await _list_ids(checkpointer, limit=3) == ids[:1:-1]
+    assert [r.url.params["limit"] for r in api.reads()[1:]] == ["2", "1"]
+
+
+@pytest.mark.asyncio
+async def test_alist_honours_before_and_filter():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(list_page_size=2))
+    ids = await _put_chain(checkpointer, 5)
+
+    assert await _list_ids(checkpointer, before=_config(ids[3])) == ids[2::-1]
+    # The fake ignores metadata filters, so they are applied to the results
+    assert await _list_ids(checkpointer, filter={"step": 2}) == [ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_alist_detects_a_controller_without_cursor_support():
+    api = FakeCheckpointAPI(cursor=False)
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(list_page_size=2))
+    ids = await _put_chain(checkpointer, 5)
+
+    assert await _list_ids(checkpointer) == ids[::-1]
+    # The second page repeated the first, so the whole thread was fetched instead
+    assert [r.url.params["limit"] for r in api.reads()] == ["2", "2", "-1"]
+    assert "before" not in api.reads()[-1].url.params
+
+    assert await _list_ids(checkpointer, before=_config(ids[2]), limit=1) == [ids[1]]
+    assert api.reads()[-1].url.params["limit"] == "-1"
+
+
+async def _put_delta_chain(checkpointer: KAgentCheckpointer, count: int) -> list[str]:
+    """Store a chain where messages grows every step and settings only changes in the first."""
+    ids = []
+    parent_id = None
+    for i in range(count):
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": [str(n) for n in range(i + 1)], "settings": {"model": "m"}}
+        checkpoint["channel_versions"] = {"messages": i + 1, "settings": 1}
+        new_versions = {"messages": i + 1, "settings": 1} if i == 0 else {"messages": i + 1}
+        config = await checkpointer.aput(_config(parent_id), checkpoint, {"step": i}, new_versions)
+        parent_id = config["configurable"]["checkpoint_id"]
+        ids.append(parent_id)
+    return ids
+
+
+def _stored_blobs(checkpointer: KAgentCheckpointer, api: FakeCheckpointAPI, checkpoint_id: str) -> dict:
+    stored = next(c for c in api.checkpoints if c.checkpoint_id == checkpoint_id)
+    return checkpointer.serde.loads_typed((stored.type_.removeprefix("blobs+"), stored.checkpoint))
+
+
+@pytest.mark.asyncio
+async def test_delta_checkpoints_store_changed_channels_and_keyframes():
+    api = FakeCheckpointAPI()
+    config = KAgentCheckpointerConfig(delta_checkpoints=True, keyframe_interval=3)
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+
+    ids = await _put_delta_chain(checkpointer, 5)
+
+    stored = [_stored_blobs(checkpointer, api, checkpoint_id) for checkpoint_id in ids]
+    assert [payload["keyframe"] for payload in stored] == [True, False, False, True, False]
+    assert set(stored[1]["blobs"]) == {"messages"}
+    assert set(stored[3]["blobs"]) == {"messages", "settings"}
+    # The grown list is stored as the appended item on top of the parent's version
+    assert checkpointer.serde.loads_typed(tuple(stored[4]["blobs"]["messages"][:2])) == ["4"]
+    assert stored[4]["blobs"]["messages"][2] == 4
+
+
+@pytest.mark.asyncio
+async def test_delta_chain_is_restored_by_a_new_checkpointer_up_to_the_keyframe():
+    api = FakeCheckpointAPI()
+    config = KAgentCheckpointerConfig(delta_checkpoints=True, keyframe_interval=3)
+    ids = await _put_delta_chain(KAgentCheckpointer(api.client(), "app", config=config), 6)
+
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+    latest = await checkpointer.aget_tuple(_config())
+
+    assert latest.checkpoint["channel_values"] == {
+        "messages": ["0", "1", "2", "3", "4", "5"],
+        "settings": {"model": "m"},
+    }
+    # The latest checkpoint, its parent and the keyframe before them
+    assert [r.url.params.get("checkpoint_id") for r in api.reads()] == [None, ids[4], ids[3]]
+
+    # Blobs read before resolve older checkpoints of the chain
+    restored = await checkpointer.aget_tuple(_config(ids[4]))
+    assert restored.checkpoint["channel_values"]["messages"] == ["0", "1", "2", "3", "4"]
+    assert len(api.reads()) == 4
+
+
+@pytest.mark.asyncio
+async def test_delta_chain_is_restored_when_the_blob_cache_holds_nothing():
+    api = FakeCheckpointAPI()
+    config = KAgentCheckpointerConfig(delta_checkpoints=True, keyframe_interval=3, blob_cache_max_bytes=1)
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+    await _put_delta_chain(checkpointer, 5)
+
+    latest = await checkpointer.aget_tuple(_config())
+
+    assert latest.checkpoint["channel_values"] == {"messages": ["0", "1", "2", "3", "4"], "settings": {"model": "m"}}
+
+
+@pytest.mark.asyncio
+async def test_delta_checkpoint_with_a_broken_chain_is_not_restored_partially():
+    api = FakeCheckpointAPI()
+    config = KAgentCheckpointerConfig(delta_checkpoints=True, keyframe_interval=10)
+    ids = await _put_delta_chain(KAgentCheckpointer(api.client(), "app", config=config), 3)
+    api.checkpoints = [c for c in api.checkpoints if c.checkpoint_id != ids[0]]
+
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+    with pytest.raises(ValueError, match="settings"):
+        await checkpointer.aget_tuple(_config())
+
+
+async def _put_step(checkpointer: KAgentCheckpointer, thread_id: str = "thread-1", parent_id: str | None = None) -> str:
+    """Store the writes of a superstep and the checkpoint closing it."""
+    config = _config(parent_id, thread_id)
+    if parent_id:
+        await checkpointer.aput_writes(config, [("messages", "pending")], "task-1")
+    config = await checkpointer.aput(config, _checkpoint(["a"]), {}, {"messages": 1})
+    return config["configurable"]["checkpoint_id"]
+
+
+@pytest.mark.asyncio
+async def test_sync_durability_writes_every_call_before_it_returns():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app")
+
+    first = await _put_step(checkpointer)
+    await _put_step(checkpointer, parent_id=first)
+
+    assert [r.url.path for r in api.writes()] == [
+        "/api/langgraph/checkpoints",
+        "/api/langgraph/checkpoints/writes",
+        "/api/langgraph/checkpoints",
+    ]
+    api.failing_threads.add("thread-1")
+    with pytest.raises(httpx.HTTPStatusError):
+        await _put_step(checkpointer)
+
+
+@pytest.mark.asyncio
+async def test_async_durability_writes_supersteps_in_the_background():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="async"))
+
+    first = await _put_step(checkpointer)
+    await checkpointer.aput_writes(_config(first), [("messages", "pending")], "task-1")
+    assert api.writes() == []
+
+    await checkpointer.aput(_config(first), _checkpoint(["a", "b"]), {}, {"messages": 2})
+    await checkpointer.aflush(_config())
+
+    assert [r.url.path.rsplit("/", 1)[-1] for r in api.writes()] == ["checkpoints", "writes", "checkpoints"]
+    latest = await checkpointer.aget_tuple(_config())
+    assert latest.checkpoint["channel_values"] == {"messages": ["a", "b"]}
+
+
+@pytest.mark.asyncio
+async def test_async_durability_reads_checkpoints_of_other_writers():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="async"))
+    first = await _put_step(checkpointer)
+    assert (await checkpointer.aget_tuple(_config())).checkpoint["id"] == first
+
+    # Another replica continues the thread
+    replica = KAgentCheckpointer(api.client(), "app")
+    second = await _put_step(replica, parent_id=first)
+
+    assert (await checkpointer.aget_tuple(_config())).checkpoint["id"] == second
+
+
+@pytest.mark.asyncio
+async def test_latest_checkpoint_cache_serves_reads_when_enabled():
+    api = FakeCheckpointAPI()
+    config = KAgentCheckpointerConfig(durability="async", cache_latest=True)
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=config)
+
+    first = await _put_step(checkpointer)
+    await checkpointer.aflush()
+
+    assert (await checkpointer.aget_tuple(_config())).checkpoint["id"] == first
+    assert api.reads() == []
+
+
+@pytest.mark.asyncio
+async def test_flushes_of_other_threads_do_not_wait_for_each_other():
+    api = FakeCheckpointAPI()
+    released = asyncio.Event()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if b"thread-1" in request.content:
+            await released.wait()
+        return api.handle(request)
+
+    client = httpx.AsyncClient(base_url="http://kagent.test", transport=httpx.MockTransport(handle))
+    checkpointer = KAgentCheckpointer(client, "app", config=KAgentCheckpointerConfig(durability="exit"))
+    await _put_step(checkpointer, "thread-1")
+    await _put_step(checkpointer, "thread-2")
+
+    blocked = asyncio.create_task(checkpointer.aflush(_config(thread_id="thread-1")))
+    await asyncio.sleep(0.01)
+    await asyncio.wait_for(checkpointer.aflush(_config(thread_id="thread-2")), timeout=1)
+    assert len(api.stored("thread-2")) == 1
+    assert not blocked.done()
+
+    released.set()
+    await blocked
+    assert len(api.stored("thread-1")) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_durability_errors_only_reach_the_flush_of_their_thread():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="async"))
+    api.failing_threads.add("thread-1")
+
+    failed = await _put_step(checkpointer, "thread-1")
+    await _put_step(checkpointer, "thread-2")
+    # Other threads neither see nor wait for the error
+    await checkpointer.aflush(_config(thread_id="thread-2"))
+    await _put_step(checkpointer, "thread-2")
+    await checkpointer.aflush(_config(thread_id="thread-2"))
+    assert len(api.stored("thread-2")) == 2
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await checkpointer.aflush(_config(thread_id="thread-1"))
+
+    # The failed checkpoint is retried by the next flush
+    api.failing_threads.clear()
+    await checkpointer.aflush(_config(thread_id="thread-1"))
+    assert api.stored("thread-1") == [failed]
+
+
+@pytest.mark.asyncio
+async def test_async_durability_background_error_is_retried():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="async"))
+    api.failing_threads.add("thread-1")
+
+    first = await _put_step(checkpointer)
+    await asyncio.sleep(0.01)
+    api.failing_threads.clear()
+    second = await _put_step(checkpointer, parent_id=first)
+    await checkpointer.aflush(_config())
+
+    assert api.stored() == [first, second]
+
+
+@pytest.mark.asyncio
+async def test_exit_durability_buffers_until_flush():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="exit"))
+
+    first = await _put_step(checkpointer, "thread-1")
+    second = await _put_step(checkpointer, "thread-1", parent_id=first)
+    other = await _put_step(checkpointer, "thread-2")
+    await asyncio.sleep(0.01)
+    assert api.writes() == []
+
+    await checkpointer.aflush()
+
+    assert api.stored("thread-1") == [first, second]
+    assert api.stored("thread-2") == [other]
+    # Reads flush the thread they read
+    third = await _put_step(checkpointer, "thread-1", parent_id=second)
+    assert [t.checkpoint["id"] async for t in checkpointer.alist(_config(), limit=1)] == [third]
+
+
+def test_sync_methods_run_on_their_own_loop_without_a_running_one():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="exit"))
+
+    config = checkpointer.put(_config(), _checkpoint(["a"]), {"step": 0}, {"messages": 1})
+    checkpointer.put_writes(_config(config["configurable"]["checkpoint_id"]), [("messages", "pending")], "task-1")
+    checkpointer.flush()
+
+    assert checkpointer.get_tuple(_config()).pending_writes == [("task-1", "messages", "pending")]
+    assert [t.checkpoint["channel_values"] for t in checkpointer.list(_config())] == [{"messages": ["a"]}]
+
+
+@pytest.mark.asyncio
+async def test_sync_calls_from_worker_threads_share_the_running_loop():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app")
+    await _put(checkpointer, ["a"])
+
+    checkpoint_tuple = await asyncio.to_thread(checkpointer.get_tuple, _config())
+
+    assert checkpoint_tuple.checkpoint["channel_values"] == {"messages": ["a"]}
+    assert await checkpointer.aget_tuple(_config()) is not None
+    # From the loop's own thread the sync call would deadlock
+    with pytest.raises(asyncio.InvalidStateError):
+        checkpointer.get_tuple(_config())
+
+
+@pytest.mark.asyncio
+async def test_async_calls_are_refused_while_the_sync_loop_holds_the_client():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app")
+    # No loop used the checkpointer yet, so the sync call starts its own
+    await asyncio.to_thread(checkpointer.put, _config(), _checkpoint(["a"]), {}, {"messages": 1})
+
+    with pytest.raises(RuntimeError, match="another event loop"):
+        await checkpointer.aget_tuple(_config())
+    with pytest.raises(RuntimeError, match="another event loop"):
+        await checkpointer.aflush()
+
+
+def test_async_calls_rebind_once_the_previous_loop_is_closed():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="exit"))
+
+    asyncio.run(_put(checkpointer, ["a"]))
+    asyncio.run(checkpointer.aflush())
+
+    assert len(api.stored()) == 1
+
+
+def test_list_closes_the_async_generator_when_the_caller_stops():
+    api = FakeCheckpointAPI()
+    checkpointer = KAgentCheckpointer(api.client(), "app")
+    for messages in (["a"], ["a", "b"]):
+        checkpointer.put(_config(), _checkpoint(messages), {}, {"messages": 1})
+    closed = []
+    alist = checkpointer.alist
+
+    async def tracking_alist(*args, **kwargs):
+        try:
+            async for item in alist(*args, **kwargs):
+                yield item
+        finally:
+            # Only seen right away if list waits for the generator to close
+            await asyncio.sleep(0.05)
+            closed.append(True)
+
+    checkpointer.alist = tracking_alist
+    iterator = checkpointer.list(_config())
+    next(iterator)
+    iterator.close()
+
+    assert closed == [True]
@@ -0,0 +1,126 @@
+"""Tests for the LangGraph event conversion helpers."""
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+
+from kagent.langgraph._converters import MessageDeduplicator, TokenChunkCoalescer, _convert_langgraph_event_to_a2a
+
+
+def test_messages_are_deduplicated_by_id():
+    dedup = MessageDeduplicator()
+    first = AIMessage(content="same", id="a")
+    second = AIMessage(content="same", id="b")
+
+    assert dedup.new_messages("agent", [first]) == [first]
+    # Equal content with another id is a new message
+    assert dedup.new_messages("agent", [second]) == [second]
+    assert dedup.new_messages("tools", [AIMessage(content="other", id="a")]) == []
+
+
+def test_messages_a_node_returned_before_are_skipped_by_position():
+    # No hashes are kept, so only the position recognizes messages without id
+    dedup = MessageDeduplicator(max_hashes=0)
+    history = [HumanMessage(content="hi"), AIMessage(content="hello")]
+
+    assert dedup.new_messages("agent", history) == history
+    reply = AIMessage(content="bye")
+    assert dedup.new_messages("agent", [*history, reply]) == [reply]
+    # A list that does not extend the previous update is taken as new
+    assert dedup.new_messages("agent", [reply]) == [reply]
+
+
+def test_messages_without_id_are_hashed_within_a_bound():
+    dedup = MessageDeduplicator(max_hashes=2)
+
+    assert len(dedup.new_messages("a", [AIMessage(content="x")])) == 1
+    assert dedup.new_messages("b", [AIMessage(content="x")]) == []
+    dedup.new_messages("c", [AIMessage(content="y")])
+    dedup.new_messages("d", [AIMessage(content="z")])
+    # The oldest hash was evicted
+    assert len(dedup.new_messages("e", [AIMessage(content="x")])) == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_node_updates_are_converted_once():
+    dedup = MessageDeduplicator()
+    call = AIMessage(content="", id="1", tool_calls=[{"id": "call", "name": "lookup", "args": {}}])
+    result = ToolMessage(content="42", tool_call_id="call", name="lookup", id="2")
+
+    events = []
+    for update in ({"agent": {"messages": [call]}}, {"tools": {"messages": [call, result]}}):
+        events += await _convert_langgraph_event_to_a2a(update, "task", "ctx", "app", dedup)
+
+    data = [event.status.message.parts[0].root.data for event in events]
+    assert data == [{"id": "call", "name": "lookup", "args": {}}, {"id": "call", "name": "lookup", "response": "42"}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _texts(updates) -> list[tuple[str, bool]]:
+    return [(update.artifact.parts[0].root.text, update.append) for update in updates]
+
+
+def test_first_chunk_of_a_message_is_published_right_away():
+    coalescer = TokenChunkCoalescer("task", "ctx", "artifact", window=1.0, max_bytes=1024, clock=FakeClock())
+
+    updates = coalescer.add(AIMessageChunk(content="Hel", id="m1"))
+
+    assert _texts(updates) == [("Hel", False)]
+    assert updates[0].artifact.artifact_id == "artifact"
+    assert updates[0].last_chunk is False
+
+
+def test_chunks_are_merged_within_the_window():
+    clock = FakeClock()
+    coalescer = TokenChunkCoalescer("task", "ctx", "artifact", window=1.0, max_bytes=1024, clock=clock)
+    coalescer.add(AIMessageChunk(content="a", id="m1"))
+
+    assert coalescer.add(AIMessageChunk(content="b", id="m1")) == []
+    assert coalescer.add(AIMessageChunk(content="c", id="m1")) == []
+    clock.now = 1.0
+    assert _texts(coalescer.add(AIMessageChunk(content="d", id="m1"))) == [("bcd", True)]
+    assert coalescer.flush() == []
+
+
+def test_chunks_are_published_when_they_reach_max_bytes():
+    coalescer = TokenChunkCoalescer("task", "ctx", "artifact", window=1.0, max_bytes=4, clock=FakeClock())
+    coalescer.add(AIMessageChunk(content="a", id="m1"))
+
+    assert coalescer.add(AIMessageChunk(content="bc", id="m1")) == []
+    assert _texts(coalescer.add(AIMessageChunk(content="de", id="m1"))) == [("bcde", True)]
+
+
+def test_a_new_message_releases_held_text_and_replaces_the_parts():
+    coalescer = TokenChunkCoalescer("task", "ctx", "artifact", window=1.0, max_bytes=1024, clock=FakeClock())
+    coalescer.add(AIMessageChunk(content="a", id="m1"))
+    coalescer.add(AIMessageChunk(content="b", id="m1"))
+
+    updates = coalescer.add(AIMessageChunk(content="c", id="m2"))
+
+    assert _texts(updates) == [("b", True), ("c", False)]
+
+
+def test_flush_releases_held_text_and_ends_the_message():
+    coalescer = TokenChunkCoalescer("task", "ctx", "artifact", window=1.0, max_bytes=1024, clock=FakeClock())
+    coalescer.add(AIMessageChunk(content="a", id=None))
+    coalescer.add(AIMessageChunk(content="b", id=None))
+
+    assert _texts(coalescer.flush()) == [("b", True)]
+    # Chunks without id after a flush start a new message
+    assert _texts(coalescer.add(AIMessageChunk(content="c", id=None))) == [("c", False)]
+
+
+def test_only_text_chunks_are_streamed():
+    coalescer = TokenChunkCoalescer("task", "ctx", "artifact", window=0, max_bytes=1024, clock=FakeClock())
+
+    assert coalescer.add(AIMessageChunk(content="", id="m1", tool_call_chunks=[{"name": "lookup", "args": "{"}])) == []
+    assert coalescer.add(AIMessageChunk(content=[{"type": "text", "text": "x"}], id="m1")) == []
+    assert coalescer.add(ToolMessage(content="42", tool_call_id="call")) == []
+    assert _texts(coalescer.add(AIMessageChunk(content="a", id="m1"))) == [("a", False)]
+    assert _texts(coalescer.add(AIMessageChunk(content="b", id="m1"))) == [("b", True)]
@@ -0,0 +1,176 @@
+"""Tests for LangGraphAgentExecutor."""
+
+import httpx
+import pytest
+from a2a.server.agent_execution.context import RequestContext
+from a2a.server.events.event_queue import EventQueue
+from a2a.types import (
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import START, MessagesState, StateGraph
+from langgraph.types import interrupt
+from test_checkpointer import FakeCheckpointAPI
+
+from kagent.core.a2a import get_kagent_metadata_key
+from kagent.langgraph import KAgentCheckpointer, KAgentCheckpointerConfig, LangGraphAgentExecutor
+from kagent.langgraph._executor import LangGraphAgentExecutorConfig
+
+
+def _request_context(text: str = "hi") -> RequestContext:
+    return RequestContext(
+        request=MessageSendParams(
+            message=Message(message_id="msg-1", role=Role.user, parts=[Part(TextPart(text=text))])
+        ),
+        task_id="task-1",
+        context_id="ctx-1",
+    )
+
+
+async def _execute(executor: LangGraphAgentExecutor, context: RequestContext) -> list:
+    queue = EventQueue()
+    await executor.execute(context, queue)
+    events = []
+    while not queue.queue.empty():
+        events.append(await queue.dequeue_event())
+    return events
+
+
+def _graph(node, checkpointer=None):
+    builder = StateGraph(MessagesState)
+    builder.add_node("agent", node)
+    builder.add_edge(START, "agent")
+    return builder.compile(checkpointer=checkpointer)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_flush_error_does_not_replace_the_graph_error():
+    async def failing(state: MessagesState):
+        raise KeyError("boom")
+
+    api = FakeCheckpointAPI()
+    api.failing_threads.add("ctx-1")
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="exit"))
+    executor = LangGraphAgentExecutor(graph=_graph(failing, checkpointer), app_name="app")
+
+    events = await _execute(executor, _request_context())
+
+    final = events[-1]
+    assert isinstance(final, TaskStatusUpdateEvent)
+    assert final.status.state == TaskState.failed
+    assert final.metadata[get_kagent_metadata_key("error_type")] == "KeyError"
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_flush_error_fails_a_successful_run():
+    async def reply(state: MessagesState):
+        return {"messages": [AIMessage(content="hello")]}
+
+    api = FakeCheckpointAPI()
+    api.failing_threads.add("ctx-1")
+    checkpointer = KAgentCheckpointer(api.client(), "app", config=KAgentCheckpointerConfig(durability="exit"))
+    executor = LangGraphAgentExecutor(graph=_graph(reply, checkpointer), app_name="app")
+
+    events = await _execute(executor, _request_context())
+
+    assert events[-1].status.state == TaskState.failed
+    assert events[-1].metadata[get_kagent_metadata_key("error_type")] == httpx.HTTPStatusError.__name__
+
+
+class FakeTaskStore:
+    async def wait_for_save(self, task_id: str, timeout: float) -> None:
+        return None
+
+
+def _streaming_graph(after_reply=None):
+    """An agent streaming "one two three" from a fake chat model, then running after_reply."""
+    model = GenericFakeChatModel(messages=iter([AIMessage(content="one two three")]))
+
+    async def agent(state: MessagesState):
+        reply = await model.ainvoke(state["messages"])
+        if after_reply is not None:
+            after_reply()
+        return {"messages": [reply]}
+
+    return _graph(agent, InMemorySaver())
+
+
+def _artifact_updates(events: list) -> list[TaskArtifactUpdateEvent]:
+    return [event for event in events if isinstance(event, TaskArtifactUpdateEvent)]
+
+
+def _texts(update: TaskArtifactUpdateEvent) -> list[str]:
+    return [part.root.text for part in update.artifact.parts]
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_not_streamed_by_default():
+    executor = LangGraphAgentExecutor(graph=_streaming_graph(), app_name="app")
+
+    updates = _artifact_updates(await _execute(executor, _request_context()))
+
+    assert [(update.last_chunk, _texts(update)) for update in updates] == [(True, ["one two three"])]
+
+
+@pytest.mark.asyncio
+async def test_completed_run_replaces_streamed_tokens_with_the_result():
+    config = LangGraphAgentExecutorConfig(stream_tokens=True, partial_event_window=0)
+    executor = LangGraphAgentExecutor(graph=_streaming_graph(), app_name="app", config=config)
+
+    events = await _execute(executor, _request_context())
+
+    updates = _artifact_updates(events)
+    partial, final = updates[:-1], updates[-1]
+    assert "".join(text for update in partial for text in _texts(update)) == "one two three"
+    assert not any(update.last_chunk for update in partial)
+    assert final.last_chunk and not final.append
+    assert _texts(final) == ["one two three"]
+    assert {update.artifact.artifact_id for update in updates} == {final.artifact.artifact_id}
+    assert events[-1].status.state == TaskState.completed
+
+
+@pytest.mark.asyncio
+async def test_interrupted_run_clears_the_streamed_tokens():
+    def ask_approval():
+        interrupt({"action_requests": [{"name": "delete", "args": {}, "id": "call-1"}]})
+
+    config = LangGraphAgentExecutorConfig(stream_tokens=True, partial_event_window=0)
+    executor = LangGraphAgentExecutor(graph=_streaming_graph(ask_approval), app_name="app", config=config)
+    context = _request_context()
+    context.task_store = FakeTaskStore()
+
+    events = await _execute(executor, context)
+
+    updates = _artifact_updates(events)
+    assert len(updates) > 1
+    closing = updates[-1]
+    assert closing.last_chunk and not closing.append
+    assert closing.artifact.parts == []
+    assert closing.artifact.artifact_id == updates[0].artifact.artifact_id
+    assert events[-1].status.state == TaskState.input_required
+
+
+@pytest.mark.asyncio
+async def test_failed_run_clears_the_streamed_tokens():
+    def fail():
+        raise KeyError("boom")
+
+    config = LangGraphAgentExecutorConfig(stream_tokens=True, partial_event_window=0)
+    executor = LangGraphAgentExecutor(graph=_streaming_graph(fail), app_name="app", config=config)
+
+    events = await _execute(executor, _request_context())
+
+    updates = _artifact_updates(events)
+    assert len(updates) > 1
+    assert updates[-1].last_chunk and updates[-1].artifact.parts == []
+    assert events.index(updates[-1]) < len(events) - 1
+    assert events[-1].status.state == TaskState.failed
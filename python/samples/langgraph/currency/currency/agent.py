@@ -1,7 +1,7 @@
 import logging
 
 import httpx
-from kagent.core import KAgentConfig
+from kagent.core import KAgentConfig, create_http_client
 from kagent.langgraph import KAgentCheckpointer
 from langchain_core.tools import tool
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -11,7 +11,7 @@ from langsmith import traceable
 logger = logging.getLogger(__name__)
 
 kagent_checkpointer = KAgentCheckpointer(
-    client=httpx.AsyncClient(base_url=KAgentConfig().url),
+    client=create_http_client(KAgentConfig().url),
     app_name=KAgentConfig().app_name,
 )
 